@@ -8,6 +8,7 @@ from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from functools import partial
 import logging
+from operator import attrgetter
 from typing import Any, Protocol, cast
 
 from propcache import cached_property
@@ -64,6 +65,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -112,6 +114,9 @@ from .helpers import async_get_blueprints
 from .trace import trace_automation
 
 DATA_COMPONENT: HassKey[EntityComponent[BaseAutomationEntity]] = HassKey(DOMAIN)
+DATA_REFERENCE_INDEX: HassKey[ReferenceIndex[BaseAutomationEntity]] = HassKey(
+    f"{DOMAIN}_reference_index"
+)
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 
@@ -160,18 +165,26 @@ def is_on(hass: HomeAssistant, entity_id: str) -> bool:
     return hass.states.is_state(entity_id, STATE_ON)
 
 
+_REFERENCE_PROPERTIES = (
+    "referenced_areas",
+    "referenced_blueprint",
+    "referenced_devices",
+    "referenced_entities",
+    "referenced_floors",
+    "referenced_labels",
+)
+
+
 def _automations_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all automations that reference the x."""
-    if DATA_COMPONENT not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    return [
-        automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if referenced_id in getattr(automation_entity, property_name)
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(
+        property_name, referenced_id
+    )
 
 
 def _x_in_automation(
@@ -250,14 +263,7 @@ def labels_in_automation(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def automations_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all automations that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in hass.data[DATA_COMPONENT].entities
-        if automation_entity.referenced_blueprint == blueprint_path
-    ]
+    return _automations_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -277,6 +283,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DATA_COMPONENT] = component = EntityComponent[BaseAutomationEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex(
+        {name: attrgetter(name) for name in _REFERENCE_PROPERTIES}
+    )
 
     # Register automation as valid domain for Blueprint
     async_get_blueprints(hass)
@@ -364,6 +373,16 @@ class BaseAutomationEntity(ToggleEntity, ABC):
             return {CONF_ID: self.unique_id}
         return None
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Add the automation to the reference index."""
+        await super().async_internal_added_to_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(self)
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Remove the automation from the reference index."""
+        await super().async_internal_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self)
+
     @cached_property
     @abstractmethod
     def referenced_labels(self) -> set[str]:
@@ -81,8 +81,10 @@ from .const import (  # noqa: F401
     StreamType,
 )
 from .helper import get_camera_from_entity_id
+from .image_cache import CameraImageCache
 from .img_util import scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
+from .still_stream import StillStreamHub
 from .webrtc import (
     DATA_ICE_SERVERS,
     CameraWebRTCProvider,
@@ -189,35 +191,45 @@ async def _async_get_image(
     Not all cameras can scale images or return jpegs
     that we can scale, however the majority of cases
     are handled.
+
+    Concurrent requests for the same size share a single fetch,
+    and the image is cached for the image_cache_ttl of the camera.
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            if image := await camera.image_cache.async_get_image(
+                camera.hass, (width, height), camera.image_cache_ttl, timeout
+            ):
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera, width: int | None, height: int | None
+) -> Image | None:
+    """Fetch a snapshot image from a camera and scale it if needed."""
+    image_bytes = (
+        await _async_get_stream_image(
+            camera, width=width, height=height, wait_for_next_keyframe=False
+        )
+        if camera.use_stream_for_stills
+        else await camera.async_camera_image(width=width, height=height)
+    )
+    if not image_bytes:
+        return None
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -281,22 +293,7 @@ async def async_get_still_stream(
 
     This method must be run in the event loop.
     """
-    response = web.StreamResponse()
-    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
-    await response.prepare(request)
-
-    async def write_to_mjpeg_stream(img_bytes: bytes) -> None:
-        """Write image to stream."""
-        await response.write(
-            bytes(
-                "--frameboundary\r\n"
-                f"Content-Type: {content_type}\r\n"
-                f"Content-Length: {len(img_bytes)}\r\n\r\n",
-                "utf-8",
-            )
-            + img_bytes
-            + b"\r\n"
-        )
+    response = await _async_prepare_mjpeg_response(request)
 
     last_image = None
 
@@ -307,16 +304,9 @@ async def async_get_still_stream(
             break
 
         if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
-
-            # Chrome always shows the n-1 frame:
-            # https://issues.chromium.org/issues/41199053
-            # https://issues.chromium.org/issues/40791855
-            # We send the first frame twice to ensure it shows
-            # Subsequent frames are not a concern at reasonable frame rates
-            # (even 1/10 FPS is about the latency of HLS)
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
+            await _async_write_mjpeg_frame(
+                response, content_type, img_bytes, last_image is None
+            )
             last_image = img_bytes
 
         next_fetch = last_fetch + interval
@@ -328,6 +318,65 @@ async def async_get_still_stream(
     return response
 
 
+async def _async_get_shared_still_stream(
+    request: web.Request, hub: StillStreamHub, content_type: str
+) -> web.StreamResponse:
+    """Generate an HTTP MJPEG stream from the images of a still stream hub.
+
+    The images are fetched once for all the viewers of the hub. Images
+    are skipped if the viewer is slower than the stream.
+    """
+    response = await _async_prepare_mjpeg_response(request)
+    viewer = hub.async_add_viewer()
+    first_frame = True
+    try:
+        while (img_bytes := await viewer.async_next_image()) is not None:
+            await _async_write_mjpeg_frame(
+                response, content_type, img_bytes, first_frame
+            )
+            first_frame = False
+    finally:
+        hub.async_remove_viewer(viewer)
+
+    return response
+
+
+async def _async_prepare_mjpeg_response(request: web.Request) -> web.StreamResponse:
+    """Prepare the response of an HTTP MJPEG stream."""
+    response = web.StreamResponse()
+    response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
+    await response.prepare(request)
+    return response
+
+
+async def _async_write_mjpeg_frame(
+    response: web.StreamResponse,
+    content_type: str,
+    img_bytes: bytes,
+    first_frame: bool,
+) -> None:
+    """Write an image to an HTTP MJPEG stream."""
+    frame = (
+        bytes(
+            "--frameboundary\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(img_bytes)}\r\n\r\n",
+            "utf-8",
+        )
+        + img_bytes
+        + b"\r\n"
+    )
+    await response.write(frame)
+    # Chrome always shows the n-1 frame:
+    # https://issues.chromium.org/issues/41199053
+    # https://issues.chromium.org/issues/40791855
+    # We send the first frame twice to ensure it shows
+    # Subsequent frames are not a concern at reasonable frame rates
+    # (even 1/10 FPS is about the latency of HLS)
+    if first_frame:
+        await response.write(frame)
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the camera component."""
     component = hass.data[DATA_COMPONENT] = EntityComponent[Camera](
@@ -422,6 +471,7 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "brand",
     "frame_interval",
     "frontend_stream_type",
+    "image_cache_ttl",
     "is_on",
     "is_recording",
     "is_streaming",
@@ -442,6 +492,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_brand: str | None = None
     _attr_frame_interval: float = MIN_STREAM_INTERVAL
     _attr_frontend_stream_type: StreamType | None
+    _attr_image_cache_ttl: float = 0
     _attr_is_on: bool = True
     _attr_is_recording: bool = False
     _attr_is_streaming: bool = False
@@ -457,9 +508,11 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.stream_options: dict[str, str | bool | float] = {}
         self.content_type: str = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self.image_cache = CameraImageCache(partial(_async_fetch_image, self))
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
+        self._still_stream_hubs: dict[float, StillStreamHub] = {}
         self._webrtc_providers: list[CameraWebRTCProvider] = []
 
     @cached_property
@@ -522,6 +575,14 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         """Return the interval between frames of the mjpeg stream."""
         return self._attr_frame_interval
 
+    @cached_property
+    def image_cache_ttl(self) -> float:
+        """Return how long a snapshot image is returned to new requests.
+
+        Concurrent requests always share a single fetch from the camera.
+        """
+        return self._attr_image_cache_ttl
+
     @property
     def frontend_stream_type(self) -> StreamType | None:
         """Return the type of stream supported by this camera.
@@ -608,10 +669,19 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        The images are fetched once for all the viewers of the camera
+        streaming at the same interval.
+        """
+        if (hub := self._still_stream_hubs.get(interval)) is None:
+            hub = self._still_stream_hubs[interval] = StillStreamHub(
+                self.hass,
+                self.async_camera_image,
+                interval,
+                partial(self._still_stream_hubs.pop, interval),
+            )
+        return await _async_get_shared_still_stream(request, hub, self.content_type)
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -27,5 +27,5 @@ async def async_get_config_entry_diagnostics(
             continue
         diagnostics[entity.entity_id] = (
             camera.stream.get_diagnostics() if camera.stream else {}
-        )
+        ) | {"image_cache": camera.image_cache.get_diagnostics()}
     return diagnostics
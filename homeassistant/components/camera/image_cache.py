@@ -0,0 +1,93 @@
+"""Share camera images between concurrent and recent requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from . import Image
+
+type ImageSize = tuple[int | None, int | None]
+
+
+class _CachedImage:
+    """An image fetched from a camera."""
+
+    __slots__ = ("fetched", "image")
+
+    def __init__(self, image: Image) -> None:
+        """Initialize the cached image."""
+        self.fetched = time.monotonic()
+        self.image = image
+
+
+class CameraImageCache:
+    """Share the images of a camera between requests.
+
+    Concurrent requests for an image of the same size share a single fetch
+    from the camera, which is passed the size so cameras able to scale their
+    images still do. The fetched image is returned to the requests for the
+    same size made while it is younger than the time to live.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int | None, int | None], Coroutine[Any, Any, Image | None]],
+    ) -> None:
+        """Initialize the cache."""
+        self._fetch = fetch
+        self._images: dict[ImageSize, _CachedImage] = {}
+        self._fetch_tasks: dict[ImageSize, asyncio.Task[Image | None]] = {}
+        self.hits = 0
+        self.shared = 0
+        self.misses = 0
+
+    async def async_get_image(
+        self, hass: HomeAssistant, size: ImageSize, ttl: float, timeout: float
+    ) -> Image | None:
+        """Return a cached image, or fetch it if it is not cached."""
+        if (cached := self._images.get(size)) is not None:
+            if time.monotonic() - cached.fetched < ttl:
+                self.hits += 1
+                return cached.image
+            del self._images[size]
+        if (task := self._fetch_tasks.get(size)) is None:
+            self.misses += 1
+            task = self._fetch_tasks[size] = hass.async_create_background_task(
+                self._async_fetch(size, ttl, timeout), "camera image fetch"
+            )
+        else:
+            self.shared += 1
+        # A request giving up must not cancel the fetch shared with the others
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self, size: ImageSize, ttl: float, timeout: float
+    ) -> Image | None:
+        """Fetch an image of a size and cache it."""
+        try:
+            async with asyncio.timeout(timeout):
+                image = await self._fetch(*size)
+        except TimeoutError:
+            return None
+        finally:
+            del self._fetch_tasks[size]
+        if image is not None and ttl > 0:
+            # Drop the expired images of the sizes no longer requested
+            now = time.monotonic()
+            self._images = {
+                cached_size: cached
+                for cached_size, cached in self._images.items()
+                if now - cached.fetched < ttl
+            }
+            self._images[size] = _CachedImage(image)
+        return image
+
+    def get_diagnostics(self) -> dict[str, int]:
+        """Return the counters of the cache."""
+        return {"hits": self.hits, "shared": self.shared, "misses": self.misses}
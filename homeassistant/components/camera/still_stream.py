@@ -0,0 +1,113 @@
+"""Share the images of a still stream between all its viewers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+
+class StillStreamViewer:
+    """Hold the latest image of a still stream not yet sent to a viewer.
+
+    A viewer which is slower than the stream skips the images it did
+    not get to, instead of queueing them.
+    """
+
+    __slots__ = ("_event", "_image")
+
+    def __init__(self) -> None:
+        """Initialize the viewer."""
+        self._event = asyncio.Event()
+        self._image: bytes | None = None
+
+    @callback
+    def async_put_image(self, image: bytes | None) -> None:
+        """Replace the pending image, None ends the stream."""
+        self._image = image
+        self._event.set()
+
+    async def async_next_image(self) -> bytes | None:
+        """Wait for the next image, return None when the stream ended."""
+        await self._event.wait()
+        self._event.clear()
+        return self._image
+
+
+class StillStreamHub:
+    """Fetch the images of a still stream once for all its viewers.
+
+    The images are fetched while there are viewers and each new image is
+    passed to all of them. The hub closes when the last viewer is removed
+    or fetching an image fails, after which it must not be used anymore.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        interval: float,
+        on_close: CALLBACK_TYPE,
+    ) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._image_cb = image_cb
+        self._interval = interval
+        self._on_close = on_close
+        self._viewers: set[StillStreamViewer] = set()
+        self._fetch_task: asyncio.Task[None] | None = None
+        self._last_image: bytes | None = None
+        self._closed = False
+
+    @callback
+    def async_add_viewer(self) -> StillStreamViewer:
+        """Add a viewer, which gets the latest image right away."""
+        viewer = StillStreamViewer()
+        if self._last_image is not None:
+            viewer.async_put_image(self._last_image)
+        self._viewers.add(viewer)
+        if self._fetch_task is None:
+            self._fetch_task = self._hass.async_create_background_task(
+                self._async_fetch_images(), "camera still stream"
+            )
+        return viewer
+
+    @callback
+    def async_remove_viewer(self, viewer: StillStreamViewer) -> None:
+        """Remove a viewer and close the hub if it was the last one."""
+        self._viewers.discard(viewer)
+        if not self._viewers and self._fetch_task is not None:
+            self._fetch_task.cancel()
+            self._async_close()
+
+    @callback
+    def _async_close(self) -> None:
+        """End the streams of the viewers and stop using the hub."""
+        if self._closed:
+            return
+        self._closed = True
+        for viewer in self._viewers:
+            viewer.async_put_image(None)
+        self._on_close()
+
+    async def _async_fetch_images(self) -> None:
+        """Fetch the images and pass the new ones to the viewers."""
+        try:
+            while True:
+                last_fetch = time.monotonic()
+                if not (img_bytes := await self._image_cb()):
+                    break
+
+                if img_bytes != self._last_image:
+                    self._last_image = img_bytes
+                    for viewer in self._viewers:
+                        viewer.async_put_image(img_bytes)
+
+                next_fetch = last_fetch + self._interval
+                now = time.monotonic()
+                if next_fetch > now:
+                    await asyncio.sleep(next_fetch - now)
+        finally:
+            self._async_close()
@@ -21,6 +21,7 @@ from homeassistant.helpers import (
     integration_platform,
 )
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.entity_platform import async_get_platforms
 from homeassistant.helpers.json import (
     ExtendedJSONEncoder,
     find_paths_unserializable_data,
@@ -211,6 +212,8 @@ async def _async_get_json_file_response(
         "setup_times": async_get_domain_setup_times(hass, domain),
         "data": data,
     }
+    if polling_intervals := _async_get_polling_intervals(hass, domain, d_id):
+        payload["polling_intervals"] = polling_intervals
     try:
         json_data = json.dumps(payload, indent=2, cls=ExtendedJSONEncoder)
     except TypeError:
@@ -232,6 +235,18 @@ async def _async_get_json_file_response(
     )
 
 
+@callback
+def _async_get_polling_intervals(
+    hass: HomeAssistant, domain: str, entry_id: str
+) -> dict[str, float]:
+    """Return the adaptive poll intervals of the config entry's entities."""
+    polling_intervals: dict[str, float] = {}
+    for platform in async_get_platforms(hass, domain):
+        if platform.config_entry and platform.config_entry.entry_id == entry_id:
+            polling_intervals.update(platform.async_get_polling_intervals())
+    return polling_intervals
+
+
 class DownloadDiagnosticsView(http.HomeAssistantView):
     """Download diagnostics view."""
 
@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Number of state rows sent per message when history is chunked
+HISTORY_CHUNK_SIZE = 10000
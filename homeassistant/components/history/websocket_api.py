@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -38,7 +39,11 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_SIZE,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -77,22 +82,87 @@ def _ws_get_significant_states(
     return json_bytes(
         messages.result_message(
             msg_id,
-            history.get_significant_states(
+            history.get_significant_states_json(
                 hass,
                 start_time,
                 end_time,
                 entity_ids,
-                None,
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
-                True,
             ),
         )
     )
 
 
+def _ws_send_significant_states_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str] | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch history significant_states and send them in chunks from the executor.
+
+    Every chunk but the last is marked as partial. The next chunk is only
+    read from the database once the previous one was written to the client
+    so only one chunk is held in memory at a time. Reading stops when the
+    connection is closed or the client unsubscribes.
+    """
+    stream_end_time = end_time or dt_util.utcnow()
+
+    def _send(states: dict[str, Any], partial: bool) -> bool:
+        message = _generate_stream_message(states, start_time, stream_end_time)
+        if partial:
+            message["partial"] = True
+        return asyncio.run_coroutine_threadsafe(
+            _async_send_chunk(
+                connection, msg_id, json_bytes(messages.event_message(msg_id, message))
+            ),
+            hass.loop,
+        ).result()
+
+    pending: dict[str, Any] | None = None
+    with closing(
+        history.get_significant_states_json_chunks(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            HISTORY_CHUNK_SIZE,
+        )
+    ) as chunks:
+        for states in chunks:
+            if pending is not None and not _send(pending, True):
+                return
+            pending = states
+    _send(pending or {}, False)
+
+
+async def _async_send_chunk(
+    connection: ActiveConnection, msg_id: int, message: bytes
+) -> bool:
+    """Send a chunk and wait until it is written to the client.
+
+    Returns False if the subscription of the chunks has ended.
+    """
+    if msg_id not in connection.subscriptions:
+        return False
+    connection.send_message(message)
+    await connection.async_drain()
+    return msg_id in connection.subscriptions
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,6 +173,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -128,8 +199,12 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    chunked: bool = msg["chunked"]
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        if chunked:
+            _async_send_empty_response(connection, msg["id"], start_time, end_time)
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,12 +224,39 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        if chunked:
+            _async_send_empty_response(connection, msg["id"], start_time, end_time)
+        else:
+            connection.send_result(msg["id"], {})
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunked:
+        msg_id: int = msg["id"]
+        # The states are sent as event messages once the command is
+        # acknowledged, until the client unsubscribes or disconnects
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_send_significant_states_chunks,
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        finally:
+            connection.subscriptions.pop(msg_id, None)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
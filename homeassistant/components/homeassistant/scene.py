@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, ValuesView
+from collections.abc import Mapping
 import logging
 from typing import Any, NamedTuple, cast
 
@@ -27,13 +27,16 @@ from homeassistant.core import HomeAssistant, ServiceCall, State, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv, entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback, EntityPlatform
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.service import (
     async_extract_entity_ids,
     async_register_admin_service,
 )
+from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.state import async_reproduce_state
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.loader import async_get_integration
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN
 
@@ -82,6 +85,9 @@ def _ensure_no_intersection(value: dict[str, Any]) -> dict[str, Any]:
 CONF_SCENE_ID = "scene_id"
 CONF_SNAPSHOT = "snapshot_entities"
 DATA_PLATFORM = "homeassistant_scene"
+DATA_REFERENCE_INDEX: HassKey[ReferenceIndex[HomeAssistantScene]] = HassKey(
+    "homeassistant_scene_reference_index"
+)
 EVENT_SCENE_RELOADED = "scene_reloaded"
 STATES_SCHEMA = vol.All(dict, _convert_states)
 
@@ -135,20 +141,22 @@ class SceneConfig(NamedTuple):
     states: dict[str, State]
 
 
+@callback
+@singleton(DATA_REFERENCE_INDEX)
+def _async_get_reference_index(
+    hass: HomeAssistant,
+) -> ReferenceIndex[HomeAssistantScene]:
+    """Return the index of the entities referenced by scenes."""
+    return ReferenceIndex({"entities": lambda scene: scene.scene_config.states})
+
+
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> list[str]:
     """Return all scenes that reference the entity."""
-    if DATA_PLATFORM not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    platform: EntityPlatform = hass.data[DATA_PLATFORM]
-
-    scene_entities = cast(ValuesView[HomeAssistantScene], platform.entities.values())
-    return [
-        scene_entity.entity_id
-        for scene_entity in scene_entities
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing("entities", entity_id)
 
 
 @callback
@@ -338,6 +346,14 @@ class HomeAssistantScene(Scene):
         self.scene_config = scene_config
         self.from_service = from_service
 
+    async def async_added_to_hass(self) -> None:
+        """Add the scene to the reference index."""
+        _async_get_reference_index(self.hass).async_add(self)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove the scene from the reference index."""
+        _async_get_reference_index(self.hass).async_remove(self)
+
     @property
     def name(self) -> str:
         """Return the name of the scene."""
@@ -5,12 +5,15 @@ from __future__ import annotations
 from collections.abc import Callable, Generator, Sequence
 from dataclasses import dataclass
 from datetime import datetime as dt
+from itertools import islice
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -157,32 +160,70 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
+            return self.humanify(
+                execute_stmt_lambda_element(
+                    session,
+                    self._statement_for_request(session, start_day, end_day),
+                    orm_rows=False,
                 )
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+
+    def get_events_chunks(
+        self,
+        start_day: dt,
+        end_day: dt,
+        chunk_size: int,
+    ) -> Generator[list[dict[str, Any]]]:
+        """Get events for a period of time in chunks of at most chunk_size events.
+
+        The rows are read from the database cursor as the chunks are consumed.
+        """
+        logbook_run = self.logbook_run
+        context_lookup = logbook_run.context_lookup
+        with session_scope(hass=self.hass, read_only=True) as session:
+            stmt = self._statement_for_request(session, start_day, end_day)
+            events = _humanify(
+                self.hass,
+                session.connection().execute(stmt).yield_per(chunk_size),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            while chunk := list(islice(events, chunk_size)):
+                yield chunk
+                # Bound the caches so memory does not grow with the result.
+                # Up to a chunk of contexts is kept, so the events of the next
+                # chunk can still refer to the events which caused them.
+                logbook_run.event_cache.clear()
+                if len(context_lookup) > chunk_size:
+                    context_lookup.clear()
+                    context_lookup[None] = None
+
+    def _statement_for_request(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> StatementLambdaElement:
+        """Generate the logbook statement for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
+            )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
             )
+        )
+        return statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
@@ -35,6 +36,8 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# how many events to deliver per message when get_events is chunked
+GET_EVENTS_CHUNK_SIZE = 2048
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -441,6 +444,57 @@ def _ws_formatted_get_events(
     )
 
 
+def _ws_send_formatted_events_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+) -> None:
+    """Fetch events and send them in chunks from the executor.
+
+    Every chunk but the last is marked as partial. The next chunk is only
+    read from the database once the previous one was written to the client,
+    and reading stops when the client unsubscribes or disconnects.
+    """
+
+    def _send(events: list[dict[str, Any]], partial: bool) -> bool:
+        message = _generate_stream_message(events, start_time, end_time)
+        if partial:
+            message["partial"] = True
+        return asyncio.run_coroutine_threadsafe(
+            _async_send_chunk(
+                connection, msg_id, json_bytes(messages.event_message(msg_id, message))
+            ),
+            hass.loop,
+        ).result()
+
+    pending: list[dict[str, Any]] | None = None
+    with closing(
+        event_processor.get_events_chunks(start_time, end_time, GET_EVENTS_CHUNK_SIZE)
+    ) as chunks:
+        for events in chunks:
+            if pending is not None and not _send(pending, True):
+                return
+            pending = events
+    _send(pending or [], False)
+
+
+async def _async_send_chunk(
+    connection: ActiveConnection, msg_id: int, message: bytes
+) -> bool:
+    """Send a chunk of events and wait until the client received it.
+
+    Returns False if the client unsubscribed or disconnected.
+    """
+    if msg_id not in connection.subscriptions:
+        return False
+    connection.send_message(message)
+    await connection.async_drain()
+    return msg_id in connection.subscriptions
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "logbook/get_events",
@@ -449,6 +503,7 @@ def _ws_formatted_get_events(
         vol.Optional("entity_ids"): [str],
         vol.Optional("device_ids"): [str],
         vol.Optional("context_id"): str,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -474,8 +529,12 @@ async def ws_get_events(
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
         return
 
+    chunked: bool = msg["chunked"]
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
+        if chunked:
+            _async_send_empty_response(connection, msg["id"], start_time, end_time)
+        else:
+            connection.send_result(msg["id"], [])
         return
 
     device_ids = msg.get("device_ids")
@@ -485,7 +544,12 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
+            if chunked:
+                _async_send_empty_response(
+                    connection, msg["id"], start_time, end_time
+                )
+            else:
+                connection.send_result(msg["id"], [])
             return
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
@@ -500,6 +564,26 @@ async def ws_get_events(
         include_entity_name=False,
     )
 
+    if chunked:
+        msg_id: int = msg["id"]
+        # The events are sent as event messages once the command is
+        # acknowledged, until the client unsubscribes or disconnects
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        try:
+            await get_instance(hass).async_add_executor_job(
+                _ws_send_formatted_events_chunks,
+                hass,
+                connection,
+                msg_id,
+                start_time,
+                end_time,
+                event_processor,
+            )
+        finally:
+            connection.subscriptions.pop(msg_id, None)
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_formatted_get_events,
@@ -6,7 +6,7 @@ import asyncio
 from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
@@ -83,6 +83,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -117,6 +118,9 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# How many topics the matching subscriptions are cached for
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
@@ -207,6 +211,7 @@ def async_subscribe_internal(
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
     job_type: HassJobType | None = None,
+    coalesce_window: float | None = None,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
@@ -214,6 +219,10 @@ def async_subscribe_internal(
     and may change at any time. It should not be considered
     a stable API.
 
+    If a coalesce window is set, messages received on a topic during
+    the window after a message was passed on are coalesced, and only the
+    latest of them is passed on at the end of the window.
+
     Call the return value to unsubscribe.
     """
     try:
@@ -234,7 +243,9 @@ def async_subscribe_internal(
             translation_domain=DOMAIN,
             translation_placeholders={"topic": topic},
         )
-    return client.async_subscribe(topic, msg_callback, qos, encoding, job_type)
+    return client.async_subscribe(
+        topic, msg_callback, qos, encoding, job_type, coalesce_window
+    )
 
 
 @bind_hass
@@ -267,10 +278,22 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    coalesce_window: float | None = None
+
+
+class _CoalesceWindow:
+    """Hold the latest message received on a topic during a coalesce window."""
+
+    __slots__ = ("dropped", "pending", "timer")
+
+    def __init__(self, timer: asyncio.TimerHandle) -> None:
+        """Initialize the coalesce window."""
+        self.timer = timer
+        self.pending: ReceiveMessage | None = None
+        self.dropped = 0
 
 
 class MqttClientSetup:
@@ -377,11 +400,14 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscription_trie: TopicTrie[Subscription] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
         # which has subscribed messages.
         self._retained_topics: defaultdict[Subscription, set[str]] = defaultdict(set)
+        # The open coalesce windows by subscription and received topic
+        self._coalesce_windows: dict[Subscription, dict[str, _CoalesceWindow]] = {}
         self.connected = False
         self._ha_started = asyncio.Event()
         self._cleanup_on_unload: list[Callable[[], None]] = []
@@ -439,6 +465,8 @@ class MQTT:
         """Clean up listeners."""
         while self._cleanup_on_unload:
             self._cleanup_on_unload.pop()()
+        for subscription in list(self._coalesce_windows):
+            self._async_close_coalesce_windows(subscription)
 
     @contextlib.asynccontextmanager
     async def _async_connect_in_executor(self) -> AsyncGenerator[None]:
@@ -755,6 +783,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscription_trie.add(subscription.topic, subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -773,6 +802,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscription_trie.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -817,6 +847,7 @@ class MQTT:
         qos: int,
         encoding: str | None = None,
         job_type: HassJobType | None = None,
+        coalesce_window: float | None = None,
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos."""
         if not isinstance(topic, str):
@@ -835,9 +866,10 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(
+            topic, is_simple_match, job, qos, encoding, coalesce_window
+        )
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -854,6 +886,8 @@ class MQTT:
         self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
+        if subscription in self._coalesce_windows:
+            self._async_close_coalesce_windows(subscription)
         # Only unsubscribe if currently connected
         if self.connected:
             self._async_unsubscribe(subscription.topic)
@@ -1044,18 +1078,12 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscription_trie.matches(topic))
         return subscriptions
 
     @callback
@@ -1126,20 +1154,93 @@ class MQTT:
                 msg_cache_by_subscription_topic[subscription_topic] = receive_msg
             else:
                 receive_msg = msg_cache_by_subscription_topic[subscription_topic]
-            job = subscription.job
-            if job.job_type is HassJobType.Callback:
-                # We do not wrap Callback jobs in catch_log_exception since
-                # its expensive and we have to do it 2x for every entity
-                try:
-                    job.target(receive_msg)
-                except Exception:  # noqa: BLE001
-                    log_exception(
-                        partial(self._exception_message, job.target, receive_msg)
-                    )
-            else:
-                self.hass.async_run_hass_job(job, receive_msg)
+            if subscription.coalesce_window is not None and self._async_coalesce(
+                subscription, receive_msg
+            ):
+                continue
+            self._async_run_subscription_job(subscription.job, receive_msg)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
+    @callback
+    def _async_run_subscription_job(
+        self,
+        job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None],
+        receive_msg: ReceiveMessage,
+    ) -> None:
+        """Pass a received message to the job of a subscription."""
+        if job.job_type is HassJobType.Callback:
+            # We do not wrap Callback jobs in catch_log_exception since
+            # its expensive and we have to do it 2x for every entity
+            try:
+                job.target(receive_msg)
+            except Exception:  # noqa: BLE001
+                log_exception(partial(self._exception_message, job.target, receive_msg))
+        else:
+            self.hass.async_run_hass_job(job, receive_msg)
+
+    @callback
+    def _async_coalesce(
+        self, subscription: Subscription, receive_msg: ReceiveMessage
+    ) -> bool:
+        """Coalesce a message received for a subscription with a coalesce window.
+
+        Returns True if the message is held back until the end of the window.
+        """
+        if TYPE_CHECKING:
+            assert subscription.coalesce_window is not None
+        topic = receive_msg.topic
+        if (windows := self._coalesce_windows.get(subscription)) is None:
+            windows = self._coalesce_windows[subscription] = {}
+        if (window := windows.get(topic)) is None:
+            # Pass on the first message and hold back the ones that follow
+            windows[topic] = _CoalesceWindow(
+                self.loop.call_later(
+                    subscription.coalesce_window,
+                    self._async_end_coalesce_window,
+                    subscription,
+                    topic,
+                )
+            )
+            return False
+        if window.pending is not None:
+            window.dropped += 1
+        window.pending = receive_msg
+        return True
+
+    @callback
+    def _async_end_coalesce_window(
+        self, subscription: Subscription, topic: str
+    ) -> None:
+        """Pass on the latest message held back and start a new window."""
+        windows = self._coalesce_windows[subscription]
+        window = windows[topic]
+        if (receive_msg := window.pending) is None:
+            # Nothing was received during the window
+            del windows[topic]
+            if not windows:
+                del self._coalesce_windows[subscription]
+            return
+        if window.dropped:
+            receive_msg = replace(receive_msg, coalesced=window.dropped)
+        window.pending = None
+        window.dropped = 0
+        if TYPE_CHECKING:
+            assert subscription.coalesce_window is not None
+        window.timer = self.loop.call_later(
+            subscription.coalesce_window,
+            self._async_end_coalesce_window,
+            subscription,
+            topic,
+        )
+        self._async_run_subscription_job(subscription.job, receive_msg)
+        self._mqtt_data.state_write_requests.process_write_state_requests(receive_msg)
+
+    @callback
+    def _async_close_coalesce_windows(self, subscription: Subscription) -> None:
+        """Close the coalesce windows of a subscription without passing on."""
+        for window in self._coalesce_windows.pop(subscription).values():
+            window.timer.cancel()
+
     @callback
     def _async_mqtt_on_callback(
         self,
@@ -1247,13 +1348,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
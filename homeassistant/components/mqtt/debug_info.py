@@ -64,6 +64,7 @@ def add_subscription(
             entity_info["subscriptions"][subscription] = {
                 "count": 1,
                 "messages": deque([], STORED_MESSAGES),
+                "coalesced": 0,
             }
         else:
             entity_info["subscriptions"][subscription]["count"] += 1
@@ -163,6 +164,12 @@ def _info_for_entity(hass: HomeAssistant, entity_id: str) -> dict[str, Any]:
         }
         for topic, subscription in entity_info["subscriptions"].items()
     ]
+    # Report the messages dropped by coalescing for the subscriptions with any
+    for info, subscription in zip(
+        subscriptions, entity_info["subscriptions"].values(), strict=True
+    ):
+        if subscription["coalesced"]:
+            info["coalesced"] = subscription["coalesced"]
     transmitted = [
         {
             "topic": topic,
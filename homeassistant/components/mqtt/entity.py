@@ -72,6 +72,7 @@ from .const import (
     CONF_AVAILABILITY_MODE,
     CONF_AVAILABILITY_TEMPLATE,
     CONF_AVAILABILITY_TOPIC,
+    CONF_COALESCE_WINDOW,
     CONF_CONFIGURATION_URL,
     CONF_CONNECTIONS,
     CONF_ENABLED_BY_DEFAULT,
@@ -1252,11 +1253,14 @@ class MqttEntity(
                 for attribute in attributes
             )
         mqtt_data = self.hass.data[DATA_MQTT]
-        messages = mqtt_data.debug_info_entities[self.entity_id]["subscriptions"][
-            msg.subscribed_topic
-        ]["messages"]
+        subscription_info = mqtt_data.debug_info_entities[self.entity_id][
+            "subscriptions"
+        ][msg.subscribed_topic]
+        messages = subscription_info["messages"]
         if msg not in messages:
             messages.append(msg)
+        if msg.coalesced:
+            subscription_info["coalesced"] += msg.coalesced
 
         try:
             msg_callback(msg)
@@ -1292,6 +1296,7 @@ class MqttEntity(
                 "qos": qos,
                 "encoding": encoding,
                 "job_type": HassJobType.Callback,
+                "coalesce_window": self._config.get(CONF_COALESCE_WINDOW),
             }
             return True
         return False
@@ -90,6 +90,8 @@ class ReceiveMessage:
     retain: bool
     subscribed_topic: str
     timestamp: float
+    # The number of messages this message replaced while being coalesced
+    coalesced: int = 0
 
 
 type MessageCallbackType = Callable[[ReceiveMessage], None]
@@ -100,6 +102,7 @@ class SubscriptionDebugInfo(TypedDict):
 
     messages: deque[ReceiveMessage]
     count: int
+    coalesced: int
 
 
 class EntityDebugInfo(TypedDict):
@@ -358,7 +361,7 @@ class EntityTopicState:
         self.subscribe_calls: dict[str, Entity] = {}
 
     @callback
-    def process_write_state_requests(self, msg: MQTTMessage) -> None:
+    def process_write_state_requests(self, msg: MQTTMessage | ReceiveMessage) -> None:
         """Process the write state requests."""
         while self.subscribe_calls:
             entity_id, entity = self.subscribe_calls.popitem()
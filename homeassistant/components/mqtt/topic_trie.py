@@ -0,0 +1,90 @@
+"""Match MQTT topics against wildcard subscriptions with a topic trie."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+
+class _TopicTrieNode[_T: Hashable]:
+    """A level of a subscription topic."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.values: set[_T] = set()
+
+
+class TopicTrie[_T: Hashable]:
+    """Hold values by subscription topic, which may contain wildcards.
+
+    The subscription topics are split into their levels, so matching a
+    topic only visits the levels of the subscriptions which can match it,
+    instead of trying every subscription. Matching follows the rules of
+    the MQTT specification, also implemented by paho's MQTTMatcher:
+    - + matches a single level
+    - # matches any number of levels, including the parent level
+    - wildcards at the first level do not match topics starting with $
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+
+    def add(self, subscription_topic: str, value: _T) -> None:
+        """Add a value for a subscription topic."""
+        node = self._root
+        for level in subscription_topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.values.add(value)
+
+    def remove(self, subscription_topic: str, value: _T) -> None:
+        """Remove a value for a subscription topic.
+
+        Raises KeyError if the value was not added for the topic.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in subscription_topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.values.remove(value)
+        # Prune the levels which no longer lead to any value
+        for parent, level in reversed(path):
+            if node.values or node.children:
+                break
+            del parent.children[level]
+            node = parent
+
+    def matches(self, topic: str) -> list[_T]:
+        """Return the values of all subscription topics matching a topic."""
+        matches: list[_T] = []
+        nodes = [self._root]
+        # Wildcards at the first level do not match topics starting with $
+        wildcards = not topic.startswith("$")
+        for level in topic.split("/"):
+            next_nodes: list[_TopicTrieNode[_T]] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards:
+                    if (child := children.get("+")) is not None:
+                        next_nodes.append(child)
+                    if (child := children.get("#")) is not None:
+                        matches.extend(child.values)
+            if not next_nodes:
+                return matches
+            nodes = next_nodes
+            wildcards = True
+        for node in nodes:
+            matches.extend(node.values)
+            # A multi-level wildcard also matches its parent level
+            if (child := node.children.get("#")) is not None:
+                matches.extend(child.values)
+        return matches
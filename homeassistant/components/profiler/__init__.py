@@ -17,16 +17,20 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import compiled_template_cache_info
 
-from .const import DOMAIN
+from .const import DATA_LOOP_MONITOR, DOMAIN
+from .loop_monitor import LoopMonitor
+
+PLATFORMS = [Platform.SENSOR]
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -86,6 +90,10 @@ async def async_setup_entry(  # noqa: C901
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
 
+    monitor = domain_data[DATA_LOOP_MONITOR] = LoopMonitor(hass)
+    monitor.async_start()
+    websocket_api.async_register_command(hass, websocket_subscribe_loop_stats)
+
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
             await _async_generate_profile(hass, call)
@@ -214,6 +222,10 @@ async def async_setup_entry(  # noqa: C901
                             maybe_lru.get_stats(),
                         )
 
+        _LOGGER.critical(
+            "Cache stats for compiled templates: %s", compiled_template_cache_info()
+        )
+
         for lru in objgraph.by_type(_SQLALCHEMY_LRU_OBJECT):
             if (data := getattr(lru, "_data", None)) and isinstance(data, dict):
                 for key, value in dict(data).items():
@@ -382,11 +394,16 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+    hass.data[DOMAIN][DATA_LOOP_MONITOR].async_stop()
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
@@ -395,6 +412,36 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {vol.Required("type"): "profiler/loop_stats/subscribe"}
+)
+def websocket_subscribe_loop_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the event loop statistics."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not loaded"
+        )
+        return
+    monitor: LoopMonitor = hass.data[DOMAIN][DATA_LOOP_MONITOR]
+    msg_id = msg["id"]
+
+    @callback
+    def _async_forward_stats(stats: dict[str, Any]) -> None:
+        connection.send_event(msg_id, stats)
+
+    connection.subscriptions[msg_id] = monitor.async_add_listener(
+        _async_forward_stats
+    )
+    connection.send_result(msg_id)
+    connection.send_event(msg_id, monitor.async_stats())
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -455,14 +502,36 @@ async def _async_generate_memory_profile(hass: HomeAssistant, call: ServiceCall)
 
     heap_path = hass.config.path(f"heap_profile.{start_time}.hpy")
     await hass.async_add_executor_job(_write_memory_profile, heap, heap_path)
+    state_memory = _async_state_memory_summary(hass)
+    _LOGGER.info("State machine memory: %s", state_memory)
     persistent_notification.async_create(
         hass,
-        f"Wrote heapy memory profile to {heap_path}",
+        f"Wrote heapy memory profile to {heap_path}\n\nState machine: {state_memory}",
         title="Profile Complete",
         notification_id=f"memory_profiler_{start_time}",
     )
 
 
+@callback
+def _async_state_memory_summary(hass: HomeAssistant) -> str:
+    """Summarize the memory used by the attributes of the states."""
+    states = hass.states.async_all()
+    attributes = {id(state.attributes): state.attributes for state in states}
+    attributes_size = sum(sys.getsizeof(attrs) for attrs in attributes.values())
+    # _attributes_json is cached when a state is serialized and shared
+    # with the next state of the entity if the attributes are the same
+    attributes_json_size = sum(
+        len(attributes_json)
+        for state in states
+        if (attributes_json := state._cache.get("_attributes_json"))  # noqa: SLF001
+    )
+    return (
+        f"{len(states)} states, {len(attributes)} distinct attribute dicts"
+        f" using {attributes_size} bytes, {attributes_json_size} bytes of"
+        " cached attribute JSON"
+    )
+
+
 def _write_profile(profiler, cprofile_path, callgrind_path):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
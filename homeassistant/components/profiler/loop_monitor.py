@@ -0,0 +1,180 @@
+"""Always-on event loop latency and slow callback monitoring."""
+
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+
+# How often the event loop lag is sampled
+LAG_SAMPLE_INTERVAL = 1.0
+# How often the window statistics are published
+WINDOW_INTERVAL = 30.0
+# Jobs running longer than this on the event loop are attributed
+SLOW_CALLBACK_THRESHOLD = 0.01
+
+LAG_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+_UNKNOWN_DOMAIN = "unknown"
+
+
+def _job_domain(job: HassJob[..., Any]) -> str:
+    """Return the integration domain the target of a job belongs to."""
+    target: Any = job.target
+    while isinstance(target, partial):
+        target = target.func
+    module: str | None = getattr(target, "__module__", None)
+    if not module:
+        return _UNKNOWN_DOMAIN
+    parts = module.split(".", 3)
+    if parts[0] == "homeassistant":
+        if len(parts) > 2 and parts[1] == "components":
+            return parts[2]
+        return "homeassistant"
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return parts[0]
+
+
+class LoopMonitor:
+    """Sample the event loop lag and attribute slow jobs to integrations.
+
+    The lag is the delay of a timer scheduled every second. The jobs timed
+    by the job timer of Home Assistant, which include all event bus
+    listeners, blocking the loop for longer than the threshold are counted
+    by the domain of their target.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the monitor."""
+        self._hass = hass
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+        self._remove_job_timer: CALLBACK_TYPE | None = None
+        self._lag_timer: asyncio.TimerHandle | None = None
+        self._window_timer: asyncio.TimerHandle | None = None
+        self._next_sample = 0.0
+        self.lag_counts = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.lag_samples = 0
+        self.max_lag_ms = 0.0
+        self.window_max_lag_ms = 0.0
+        self.window_slow_callbacks = 0
+        # domain -> [count, total ms, max ms]
+        self.slow_callbacks: dict[str, list[float]] = {}
+        self.last_window: dict[str, Any] = {
+            "max_lag_ms": 0.0,
+            "slow_callbacks": 0,
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Start monitoring."""
+        hass = self._hass
+        loop = hass.loop
+        self._remove_job_timer = hass.async_set_job_timer(self._async_time_job)
+        self._next_sample = loop.time() + LAG_SAMPLE_INTERVAL
+        self._lag_timer = loop.call_at(self._next_sample, self._async_sample_lag)
+        self._window_timer = loop.call_later(WINDOW_INTERVAL, self._async_end_window)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop monitoring."""
+        if self._remove_job_timer is not None:
+            self._remove_job_timer()
+            self._remove_job_timer = None
+        for timer in (self._lag_timer, self._window_timer):
+            if timer is not None:
+                timer.cancel()
+        self._lag_timer = self._window_timer = None
+
+    @callback
+    def async_add_listener(
+        self, listener: Callable[[dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for the statistics published at the end of each window."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return _remove_listener
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return the statistics collected since the monitor started."""
+        return {
+            "lag": {
+                "buckets_ms": LAG_BUCKETS_MS,
+                "counts": list(self.lag_counts),
+                "samples": self.lag_samples,
+                "max_ms": round(self.max_lag_ms, 3),
+            },
+            "slow_callbacks": {
+                domain: {
+                    "count": int(count),
+                    "total_ms": round(total, 3),
+                    "max_ms": round(longest, 3),
+                }
+                for domain, (count, total, longest) in self.slow_callbacks.items()
+            },
+            "executor": {
+                domain: {
+                    "jobs": stats.jobs,
+                    "running": stats.running,
+                    "queued": stats.queued,
+                    "total_wait_ms": round(stats.total_wait * 1000, 3),
+                    "max_wait_ms": round(stats.max_wait * 1000, 3),
+                    "total_run_ms": round(stats.total_run * 1000, 3),
+                    "max_run_ms": round(stats.max_run * 1000, 3),
+                }
+                for domain, stats in self._hass.executor_job_queue.stats.items()
+            },
+            "window": self.last_window,
+        }
+
+    @callback
+    def _async_time_job(self, hassjob: HassJob[..., Any], elapsed: float) -> None:
+        """Attribute a slow job to the domain of its target."""
+        if elapsed <= SLOW_CALLBACK_THRESHOLD:
+            return
+        elapsed_ms = elapsed * 1000
+        domain = _job_domain(hassjob)
+        if (stats := self.slow_callbacks.get(domain)) is None:
+            stats = self.slow_callbacks[domain] = [0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += elapsed_ms
+        stats[2] = max(stats[2], elapsed_ms)
+        self.window_slow_callbacks += 1
+
+    @callback
+    def _async_sample_lag(self) -> None:
+        """Record how late the sample timer fired."""
+        loop = self._hass.loop
+        now = loop.time()
+        lag_ms = max(now - self._next_sample, 0.0) * 1000
+        self.lag_counts[bisect_left(LAG_BUCKETS_MS, lag_ms)] += 1
+        self.lag_samples += 1
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self.window_max_lag_ms = max(self.window_max_lag_ms, lag_ms)
+        self._next_sample = now + LAG_SAMPLE_INTERVAL
+        self._lag_timer = loop.call_at(self._next_sample, self._async_sample_lag)
+
+    @callback
+    def _async_end_window(self) -> None:
+        """Publish the statistics of the window and start a new one."""
+        self._window_timer = self._hass.loop.call_later(
+            WINDOW_INTERVAL, self._async_end_window
+        )
+        self.last_window = {
+            "max_lag_ms": round(self.window_max_lag_ms, 3),
+            "slow_callbacks": self.window_slow_callbacks,
+        }
+        self.window_max_lag_ms = 0.0
+        self.window_slow_callbacks = 0
+        stats = self.async_stats()
+        for listener in list(self._listeners):
+            listener(stats)
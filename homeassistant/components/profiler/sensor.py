@@ -0,0 +1,91 @@
+"""Sensors for the event loop statistics of the profiler."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DATA_LOOP_MONITOR, DOMAIN
+from .loop_monitor import LoopMonitor
+
+
+@dataclass(frozen=True, kw_only=True)
+class LoopMonitorSensorEntityDescription(SensorEntityDescription):
+    """Describes a loop monitor sensor entity."""
+
+    value_fn: Callable[[dict[str, Any]], float | int]
+
+
+SENSORS: tuple[LoopMonitorSensorEntityDescription, ...] = (
+    LoopMonitorSensorEntityDescription(
+        key="event_loop_lag",
+        translation_key="event_loop_lag",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=1,
+        value_fn=lambda window: window["max_lag_ms"],
+    ),
+    LoopMonitorSensorEntityDescription(
+        key="slow_callbacks",
+        translation_key="slow_callbacks",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda window: window["slow_callbacks"],
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the loop monitor sensors."""
+    monitor: LoopMonitor = hass.data[DOMAIN][DATA_LOOP_MONITOR]
+    async_add_entities(
+        LoopMonitorSensor(monitor, entry, description) for description in SENSORS
+    )
+
+
+class LoopMonitorSensor(SensorEntity):
+    """A sensor updated at the end of each loop monitor window."""
+
+    entity_description: LoopMonitorSensorEntityDescription
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        monitor: LoopMonitor,
+        entry: ConfigEntry,
+        description: LoopMonitorSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self._monitor = monitor
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_native_value = description.value_fn(monitor.last_window)
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for the statistics of each window."""
+        self.async_on_remove(self._monitor.async_add_listener(self._async_update))
+
+    @callback
+    def _async_update(self, stats: dict[str, Any]) -> None:
+        """Update the state from the statistics of the last window."""
+        self._attr_native_value = self.entity_description.value_fn(stats["window"])
+        self.async_write_ha_state()
@@ -30,6 +30,11 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# Events are written to the spill file instead of the queue when the
+# backlog is full, and replayed once the queue drains below this size
+SPILL_FILE = "recorder_spill.jsonl"
+SPILL_RESUME_BACKLOG = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -58,6 +63,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUP_SCHEMA_VERSION = 48
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
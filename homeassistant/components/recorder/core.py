@@ -7,7 +7,9 @@ from collections.abc import Callable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
+from itertools import chain
 import logging
+import os
 import queue
 import sqlite3
 import threading
@@ -16,7 +18,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    Table,
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -61,6 +70,8 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPILL_FILE,
+    SPILL_RESUME_BACKLOG,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -84,10 +95,12 @@ from .migration import (
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import get_migration_changes
+from .spill import SPILL_FILE_LOCK, EventSpill, read_spilled_events
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -108,6 +121,7 @@ from .tasks import (
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    ReplaySpilledEventsTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -148,6 +162,8 @@ DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
+SPILL_CHECK_INTERVAL = timedelta(seconds=10)
+SPILL_REPLAY_COMMIT_SIZE = 1000
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -156,6 +172,28 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
 
+def _bulk_state_row(dbstate: States, columns: Iterable[str]) -> dict[str, Any]:
+    """Return the row to insert for a buffered state."""
+    values = dbstate.__dict__
+    row = {key: values.get(key) for key in columns}
+    if (states_meta := values.get("states_meta_rel")) is not None:
+        row["metadata_id"] = states_meta.metadata_id
+    if (state_attributes := values.get("state_attributes")) is not None:
+        row["attributes_id"] = state_attributes.attributes_id
+    return row
+
+
+def _bulk_event_row(dbevent: Events, columns: Iterable[str]) -> dict[str, Any]:
+    """Return the row to insert for a buffered event."""
+    values = dbevent.__dict__
+    row = {key: values.get(key) for key in columns}
+    if (event_type := values.get("event_type_rel")) is not None:
+        row["event_type_id"] = event_type.event_type_id
+    if (event_data := values.get("event_data_rel")) is not None:
+        row["data_id"] = event_data.data_id
+    return row
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -212,6 +250,11 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States and events are not added to the event session, they are
+        # buffered here and written with a single executemany at commit time
+        # to avoid the unit-of-work overhead of the ORM.
+        self._pending_bulk_states: list[States] = []
+        self._pending_bulk_events: list[Events] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -227,11 +270,15 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.statistics_rollups_active = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
+        self._spill_watcher: CALLBACK_TYPE | None = None
+        self._spill: EventSpill | None = None
+        self._spill_path = hass.config.path(SPILL_FILE)
         self._keep_alive_listener: CALLBACK_TYPE | None = None
         self._commit_listener: CALLBACK_TYPE | None = None
         self._periodic_listener: CALLBACK_TYPE | None = None
@@ -278,6 +325,18 @@ class Recorder(threading.Thread):
         """Add a task to the recorder queue."""
         self._queue.put(task)
 
+    def queue_statistics_rollup_rebuild(self) -> None:
+        """Recompile the statistics rollups from the hourly statistics.
+
+        This method is thread-safe, the rollups are not used until they
+        have been recompiled.
+        """
+        if not self.statistics_rollups_active:
+            return
+        self.statistics_rollups_active = False
+        migrator = StatisticsRollupMigration(SCHEMA_VERSION, {})
+        self.queue_task(migrator.task(migrator))
+
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
@@ -300,9 +359,19 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
+        self._event_listener = self._async_listen_events(self._queue.put_nowait)
+        self._queue_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_queue,
+            QUEUE_CHECK_INTERVAL,
+            name="Recorder queue watcher",
+        )
+
+    @callback
+    def _async_listen_events(self, queue_put: Callable[[Event], None]) -> CALLBACK_TYPE:
+        """Listen for events to record and pass them to queue_put."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -331,16 +400,7 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event)
 
-        self._event_listener = self.hass.bus.async_listen(
-            MATCH_ALL,
-            _event_listener,
-        )
-        self._queue_watcher = async_track_time_interval(
-            self.hass,
-            self._async_check_queue,
-            QUEUE_CHECK_INTERVAL,
-            name="Recorder queue watcher",
-        )
+        return self.hass.bus.async_listen(MATCH_ALL, _event_listener)
 
     @callback
     def _async_keep_alive(self, now: datetime) -> None:
@@ -372,18 +432,70 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
-        if not self._reached_max_backlog():
+        if self._spill or not self._reached_max_backlog():
             return
         _LOGGER.error(
             (
                 "The recorder backlog queue reached the maximum size of %s events; "
                 "usually, the system is CPU bound, I/O bound, or the database "
-                "is corrupt due to a disk problem; The recorder will stop "
-                "recording events to avoid running out of memory"
+                "is corrupt due to a disk problem; The recorder will write new "
+                "events to %s until the database catches up to avoid running "
+                "out of memory"
             ),
             self.backlog,
+            self._spill_path,
         )
-        self._async_stop_queue_watcher_and_event_listener()
+        self._async_start_spill()
+
+    @callback
+    def _async_start_spill(self) -> None:
+        """Start writing new events to the spill file instead of the queue."""
+        if not self._event_listener:
+            return
+        self._spill = EventSpill(self.hass, self._spill_path)
+        self._event_listener()
+        self._event_listener = self._async_listen_events(self._spill.async_add)
+        self._spill_watcher = async_track_time_interval(
+            self.hass,
+            self._async_check_spill,
+            SPILL_CHECK_INTERVAL,
+            name="Recorder spill watcher",
+        )
+
+    @callback
+    def _async_check_spill(self, *_: Any) -> None:
+        """Stop spilling once the database has caught up with the queue."""
+        if self.backlog > SPILL_RESUME_BACKLOG:
+            _LOGGER.debug("Recorder queue size is: %s", self.backlog)
+            return
+        if self._spill_watcher:
+            self._spill_watcher()
+            self._spill_watcher = None
+        self.hass.async_create_background_task(
+            self._async_stop_spill(), "recorder stop spill"
+        )
+
+    async def _async_stop_spill(self) -> None:
+        """Resume queueing events and replay the spilled events in order."""
+        if not (spill := self._spill):
+            return
+        await spill.async_flush()
+        if self._spill is not spill:
+            return
+        self._spill = None
+        # Events that were spilled while the last flush was running
+        # are still in memory and are replayed after the file.
+        pending = spill.async_take_pending()
+        if self._event_listener:
+            self._event_listener()
+            self._event_listener = self._async_listen_events(self._queue.put_nowait)
+        _LOGGER.warning(
+            "The recorder backlog has been written to the database; "
+            "recording the %s events that were written to %s",
+            spill.spilled,
+            spill.path,
+        )
+        self.queue_task(ReplaySpilledEventsTask(spill.path, pending))
 
     def _available_memory(self) -> int:
         """Return the available memory in bytes."""
@@ -407,6 +519,9 @@ class Recorder(threading.Thread):
         if self._queue_watcher:
             self._queue_watcher()
             self._queue_watcher = None
+        if self._spill_watcher:
+            self._spill_watcher()
+            self._spill_watcher = None
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
@@ -452,6 +567,10 @@ class Recorder(threading.Thread):
             self._hass_started.set_result(SHUTDOWN_TASK)
         self.queue_task(StopTask())
         self._async_stop_listeners()
+        if spill := self._spill:
+            # The spilled events are recorded on the next start
+            self._spill = None
+            await spill.async_flush()
         await self.hass.async_add_executor_job(self.join)
 
     @callback
@@ -699,6 +818,16 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_state_to_bulk_insert(self, dbstate: States) -> None:
+        """Buffer a state row to be written at the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_bulk_states.append(dbstate)
+
+    def _add_event_to_bulk_insert(self, dbevent: Events) -> None:
+        """Buffer an event row to be written at the next commit."""
+        self._event_session_has_pending_writes = True
+        self._pending_bulk_events.append(dbevent)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -812,6 +941,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -829,6 +959,10 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        if self._spill is None and os.path.exists(self._spill_path):
+            # Events spilled before the last shutdown are older
+            # than anything in the queue
+            self._replay_spilled_events(self._spill_path, [])
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
@@ -1033,6 +1167,21 @@ class Recorder(threading.Thread):
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _replay_spilled_events(self, path: str, pending: list[Event]) -> None:
+        """Record the events that were written to the spill file."""
+        count = 0
+        with SPILL_FILE_LOCK:
+            spilled = read_spilled_events(path) if os.path.exists(path) else ()
+            for event in chain(spilled, pending):
+                self._guarded_process_one_task_or_event_or_recover(event)
+                count += 1
+                if not count % SPILL_REPLAY_COMMIT_SIZE:
+                    self._commit_event_session_or_retry()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+        self._commit_event_session_or_retry()
+        _LOGGER.info("Recorded %s events from %s", count, path)
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
@@ -1052,7 +1201,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_event_to_bulk_insert(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1077,7 +1226,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_event_to_bulk_insert(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1160,7 +1309,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_state_to_bulk_insert(dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1199,6 +1348,7 @@ class Recorder(threading.Thread):
                     raise
 
                 tries += 1
+                self._rollback_pending_rows()
                 time.sleep(self.db_retry_wait)
             else:
                 return
@@ -1223,7 +1373,11 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self._pending_bulk_states or self._pending_bulk_events:
+            self._bulk_insert_pending_rows(session)
         session.commit()
+        self._pending_bulk_states.clear()
+        self._pending_bulk_events.clear()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1243,6 +1397,86 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _bulk_insert_pending_rows(self, session: Session) -> None:
+        """Write the buffered states and events with executemany.
+
+        The event session is flushed first so the pending StatesMeta,
+        StateAttributes, EventTypes and EventData rows that were deduplicated
+        by the table managers have their ids. The database assigns the
+        state_ids, which are returned in the order of the rows since new
+        states reference the pending state they replace via old_state_id
+        and the StatesManager needs to know them after the commit.
+        """
+        session.flush()
+        if states := self._pending_bulk_states:
+            # The rows are inserted with the Core table since the ORM
+            # bulk insert splits the rows by the attributes that are set
+            states_table = cast(Table, States.__table__)
+            columns = [
+                column.key
+                for column in states_table.columns
+                if column.key != "state_id"
+            ]
+            result = session.execute(
+                states_table.insert().return_defaults(
+                    states_table.c.state_id, sort_by_parameter_order=True
+                ),
+                [_bulk_state_row(dbstate, columns) for dbstate in states],
+            )
+            for dbstate, primary_key in zip(
+                states, result.inserted_primary_key_rows, strict=True
+            ):
+                dbstate.state_id = primary_key[0]
+            # The states replacing a state written in the same commit
+            # only know its state_id now
+            if old_state_ids := [
+                {"state_id": dbstate.state_id, "old_state_id": old_state.state_id}
+                for dbstate in states
+                if (old_state := dbstate.__dict__.get("old_state")) is not None
+            ]:
+                session.execute(update(States), old_state_ids)
+        if events := self._pending_bulk_events:
+            events_table = cast(Table, Events.__table__)
+            columns = [
+                column.key
+                for column in events_table.columns
+                if column.key != "event_id"
+            ]
+            session.execute(
+                events_table.insert(),
+                [_bulk_event_row(dbevent, columns) for dbevent in events],
+            )
+
+    def _rollback_pending_rows(self) -> None:
+        """Rollback a failed commit and add its rows back to the event session.
+
+        The rollback expunges the StatesMeta, StateAttributes, EventTypes and
+        EventData rows added by the table managers, and the rows that were
+        flushed keep the ids the database assigned to them. The ids are
+        cleared before the rows are added back so the next commit inserts
+        them again instead of reusing ids that were rolled back.
+        """
+        assert self.event_session is not None
+        session = self.event_session
+        session.rollback()
+        for dbstate in self._pending_bulk_states:
+            dbstate.state_id = None
+            values = dbstate.__dict__
+            if (states_meta := values.get("states_meta_rel")) is not None:
+                states_meta.metadata_id = None
+                session.add(states_meta)
+            if (state_attributes := values.get("state_attributes")) is not None:
+                state_attributes.attributes_id = None
+                session.add(state_attributes)
+        for dbevent in self._pending_bulk_events:
+            values = dbevent.__dict__
+            if (event_type := values.get("event_type_rel")) is not None:
+                event_type.event_type_id = None
+                session.add(event_type)
+            if (event_data := values.get("event_data_rel")) is not None:
+                event_data.data_id = None
+                session.add(event_data)
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1257,6 +1491,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self._pending_bulk_states.clear()
+        self._pending_bulk_events.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
+from ..util import DEFAULT_YIELD_STATES_ROWS
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_json as _modern_get_significant_states_json,
+    get_significant_states_json_chunks as _modern_get_significant_states_json_chunks,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -27,6 +32,8 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_json",
+    "get_significant_states_json_chunks",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +122,89 @@ def get_significant_states(
     )
 
 
+def get_significant_states_json(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, json_fragment]:
+    """Return the compressed significant states as a JSON fragment per entity."""
+    if not get_instance(hass).states_meta_manager.active:
+        from .legacy import (  # pylint: disable=import-outside-toplevel
+            get_significant_states as _legacy_get_significant_states,
+        )
+
+        return {
+            entity_id: json_fragment(json_bytes(states))
+            for entity_id, states in _legacy_get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ).items()
+        }
+    return _modern_get_significant_states_json(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+
+
+def get_significant_states_json_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = DEFAULT_YIELD_STATES_ROWS,
+) -> Generator[dict[str, json_fragment]]:
+    """Yield the compressed significant states as JSON fragments in chunks."""
+    if not get_instance(hass).states_meta_manager.active:
+        # The legacy schema is only used while migrating, it's not worth
+        # streaming so everything is sent in a single chunk
+        if result := get_significant_states_json(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        ):
+            yield result
+        return
+    yield from _modern_get_significant_states_json_chunks(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        chunk_size,
+    )
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
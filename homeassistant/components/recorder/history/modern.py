@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
 from datetime import datetime
-from itertools import groupby
-from operator import itemgetter
+from itertools import compress, groupby, islice, repeat
+from operator import itemgetter, ne
 from typing import Any, cast
 
 from sqlalchemy import (
@@ -19,11 +20,18 @@ from sqlalchemy import (
     select,
     union_all,
 )
+from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
-from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+)
 from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
 
@@ -33,11 +41,16 @@ from ..filters import Filters
 from ..models import (
     LazyState,
     datetime_to_timestamp_or_none,
+    decode_attributes_from_source,
     extract_metadata_ids,
     process_timestamp,
     row_to_compressed_state,
 )
-from ..util import execute_stmt_lambda_element, session_scope
+from ..util import (
+    DEFAULT_YIELD_STATES_ROWS,
+    execute_stmt_lambda_element,
+    session_scope,
+)
 from .const import (
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
@@ -51,6 +64,16 @@ _FIELD_MAP = {
     "last_updated_ts": 2,
 }
 
+_METADATA_ID_GETTER = itemgetter(_FIELD_MAP["metadata_id"])
+_STATE_GETTER = itemgetter(_FIELD_MAP["state"])
+_LAST_UPDATED_TS_GETTER = itemgetter(_FIELD_MAP["last_updated_ts"])
+
+_STATE_PREFIX = f'{{"{COMPRESSED_STATE_STATE}":'.encode()
+_ATTRIBUTES_PREFIX = f',"{COMPRESSED_STATE_ATTRIBUTES}":'.encode()
+_EMPTY_ATTRIBUTES = _ATTRIBUTES_PREFIX + b"{}"
+_LAST_UPDATED_PREFIX = f',"{COMPRESSED_STATE_LAST_UPDATED}":'.encode()
+_LAST_CHANGED_PREFIX = f',"{COMPRESSED_STATE_LAST_CHANGED}":'.encode()
+
 
 def _stmt_and_join_attributes(
     no_attributes: bool,
@@ -229,6 +252,51 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        executed := _execute_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    states, entity_id_to_metadata_id, start_time_ts = executed
+    return _sorted_states_to_dict(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def _execute_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    yield_per: int | None = None,
+) -> tuple[Sequence[Row] | Result, dict[str, int | None], float | None] | None:
+    """Execute the significant states query.
+
+    Returns the rows sorted by metadata_id and last_updated_ts, the
+    entity_id to metadata_id map and the start time timestamp when
+    the start time states are included.
+
+    If yield_per is given, the rows are fetched from the cursor
+    in batches of yield_per rows as they are consumed.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -237,7 +305,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,17 +343,113 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    if yield_per is not None:
+        rows: Sequence[Row] | Result = (
+            session.connection().execute(stmt).yield_per(yield_per)
+        )
+    else:
+        rows = execute_stmt_lambda_element(
+            session, stmt, None, end_time, orm_rows=False
+        )
+    return (
+        rows,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
+def get_significant_states_json(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> dict[str, json_fragment]:
+    """Return the compressed significant states as a JSON fragment per entity.
+
+    The output is the same as get_significant_states with
+    compressed_state_format, but each entity's list is encoded
+    directly from the columns of the result without building
+    a State or dict for every row.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            executed := _execute_significant_states_stmt(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}
+        states, entity_id_to_metadata_id, start_time_ts = executed
+        return _sorted_states_to_json(
+            states,
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            not significant_changes_only,
+            no_attributes,
+        )
+
+
+def get_significant_states_json_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = DEFAULT_YIELD_STATES_ROWS,
+) -> Generator[dict[str, json_fragment]]:
+    """Yield the compressed significant states as JSON fragments in chunks.
+
+    The rows are read from the database cursor as the chunks are consumed,
+    so only one chunk is held in memory at a time. Each chunk maps entity_id
+    to a list of states of at most chunk_size rows in total; the states of an
+    entity may continue in the next chunk.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            executed := _execute_significant_states_stmt(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                chunk_size,
+            )
+        ):
+            return
+        states, entity_id_to_metadata_id, start_time_ts = executed
+        yield from _sorted_states_to_json_chunks(
+            states,
+            start_time_ts,
+            entity_id_to_metadata_id,
+            minimal_response,
+            not significant_changes_only,
+            no_attributes,
+            chunk_size,
+        )
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -816,3 +980,267 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_json(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+) -> dict[str, json_fragment]:
+    """Convert sorted rows to compressed states encoded as JSON per entity.
+
+    The metadata_id, state and last_updated_ts columns are pulled out of
+    the rows as arrays and each entity's slice of them is encoded with a
+    handful of C level map and join calls, so the per row cost stays out
+    of the interpreter.
+    """
+    if not (rows := list(states)):
+        return {}
+    metadata_id_col: list[int] = list(map(_METADATA_ID_GETTER, rows))
+    state_col: list[str | None] = list(map(_STATE_GETTER, rows))
+    last_updated_ts_col: list[float] = list(map(_LAST_UPDATED_TS_GETTER, rows))
+    encoder = _CompressedStateEncoder(
+        3 if include_last_changed else None, None if no_attributes else -1
+    )
+    result: dict[str, json_fragment] = {}
+    for entity_id in entity_ids:
+        if (metadata_id := entity_id_to_metadata_id.get(entity_id)) is None:
+            continue
+        start = bisect_left(metadata_id_col, metadata_id)
+        end = bisect_right(metadata_id_col, metadata_id, start)
+        if start == end:
+            continue
+        result[entity_id] = json_fragment(
+            b"[%b]"
+            % _encode_entity_states(
+                encoder,
+                entity_id,
+                rows[start:end],
+                state_col[start:end],
+                last_updated_ts_col[start:end],
+                start_time_ts,
+                minimal_response,
+                no_attributes,
+                None,
+            )
+        )
+    return result
+
+
+def _sorted_states_to_json_chunks(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    include_last_changed: bool,
+    no_attributes: bool,
+    chunk_size: int,
+) -> Generator[dict[str, json_fragment]]:
+    """Convert sorted rows to compressed states encoded as JSON in chunks.
+
+    Each chunk holds the states of at most chunk_size rows. The states of
+    an entity with more rows continue in the next chunk.
+    """
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    encoder = _CompressedStateEncoder(
+        3 if include_last_changed else None, None if no_attributes else -1
+    )
+    chunk: dict[str, json_fragment] = {}
+    chunk_rows = 0
+    for metadata_id, group in groupby(states, _METADATA_ID_GETTER):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        previous: tuple[str | None, float] | None = None
+        while rows := list(islice(group, chunk_size - chunk_rows)):
+            state_col: list[str | None] = list(map(_STATE_GETTER, rows))
+            last_updated_ts_col: list[float] = list(map(_LAST_UPDATED_TS_GETTER, rows))
+            if encoded := _encode_entity_states(
+                encoder,
+                entity_id,
+                rows,
+                state_col,
+                last_updated_ts_col,
+                start_time_ts,
+                minimal_response,
+                no_attributes,
+                previous,
+            ):
+                chunk[entity_id] = json_fragment(b"[%b]" % encoded)
+            previous = (state_col[-1], last_updated_ts_col[-1])
+            chunk_rows += len(rows)
+            if chunk_rows >= chunk_size:
+                yield chunk
+                chunk = {}
+                chunk_rows = 0
+                # Only the states of a chunk share encoded values so memory
+                # does not grow with the result
+                encoder.clear()
+    if chunk:
+        yield chunk
+
+
+def _encode_entity_states(
+    encoder: _CompressedStateEncoder,
+    entity_id: str,
+    rows: list[Row],
+    state_col: list[str | None],
+    last_updated_ts: list[float],
+    start_time_ts: float | None,
+    minimal_response: bool,
+    no_attributes: bool,
+    previous: tuple[str | None, float] | None,
+) -> bytes:
+    """Encode the rows of one entity as comma separated compressed states.
+
+    previous is the last state and last_updated_ts of the rows of the
+    entity that were already encoded, if the rows are a continuation.
+    """
+    if start_time_ts and not all(last_updated_ts):
+        # The start time state rows have a last_updated_ts of 0
+        last_updated_ts = [ts or start_time_ts for ts in last_updated_ts]
+    if not minimal_response or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        return encoder.full_states(rows, state_col, last_updated_ts, True)
+    if previous is not None:
+        # Only the first state of an entity is sent in full
+        return encoder.minimal_states(
+            [previous[0], *state_col], [previous[1], *last_updated_ts]
+        )
+    encoded = encoder.full_states(
+        rows[:1], state_col[:1], last_updated_ts[:1], not no_attributes
+    )
+    if minimal := encoder.minimal_states(state_col, last_updated_ts):
+        encoded = b"%b,%b" % (encoded, minimal)
+    return encoded
+
+
+class _CompressedStateEncoder:
+    """Encode columns of states to compressed state JSON objects.
+
+    Each distinct state and attributes source is only encoded once.
+    """
+
+    __slots__ = (
+        "_attr_cache",
+        "_attributes",
+        "_attributes_getter",
+        "_last_changed_ts_getter",
+        "_states",
+    )
+
+    def __init__(
+        self, last_changed_ts_idx: int | None, attributes_idx: int | None
+    ) -> None:
+        """Initialize the encoder."""
+        self._last_changed_ts_getter = (
+            None if last_changed_ts_idx is None else itemgetter(last_changed_ts_idx)
+        )
+        self._attributes_getter = (
+            None if attributes_idx is None else itemgetter(attributes_idx)
+        )
+        self._states: dict[str | None, bytes] = {}
+        self._attributes: dict[str | None, bytes] = {}
+        self._attr_cache: dict[str, dict[str, Any]] = {}
+
+    def clear(self) -> None:
+        """Forget the encoded states and attributes."""
+        self._states.clear()
+        self._attributes.clear()
+        self._attr_cache.clear()
+
+    def _state_parts(self, states: Sequence[str | None]) -> Iterator[bytes]:
+        """Return the encoded state key for each state."""
+        encoded = self._states
+        if missing := set(states).difference(encoded):
+            encoded.update(
+                zip(
+                    missing,
+                    map(_STATE_PREFIX.__add__, map(json_bytes, missing)),
+                    strict=True,
+                )
+            )
+        return map(encoded.__getitem__, states)
+
+    def _attribute_parts(self, sources: list[str | None]) -> Iterator[bytes]:
+        """Return the encoded attributes key for each attributes source."""
+        encoded = self._attributes
+        if missing := set(sources).difference(encoded):
+            attr_cache = self._attr_cache
+            encoded.update(
+                (
+                    source,
+                    _ATTRIBUTES_PREFIX
+                    + json_bytes(decode_attributes_from_source(source, attr_cache)),
+                )
+                for source in missing
+            )
+        return map(encoded.__getitem__, sources)
+
+    def full_states(
+        self,
+        rows: list[Row],
+        states: Sequence[str | None],
+        last_updated_ts: Sequence[float],
+        include_attributes: bool,
+    ) -> bytes:
+        """Encode states with their attributes and last_changed."""
+        parts: list[Iterable[bytes]] = [self._state_parts(states)]
+        if include_attributes:
+            if self._attributes_getter is None:
+                parts.append(repeat(_EMPTY_ATTRIBUTES))
+            else:
+                parts.append(
+                    self._attribute_parts(list(map(self._attributes_getter, rows)))
+                )
+        parts.append(_timestamp_parts(_LAST_UPDATED_PREFIX, last_updated_ts))
+        if self._last_changed_ts_getter is not None:
+            parts.append(
+                [
+                    _LAST_CHANGED_PREFIX + json_bytes(changed_ts)
+                    if changed_ts and changed_ts != updated_ts
+                    else b""
+                    for changed_ts, updated_ts in zip(
+                        map(self._last_changed_ts_getter, rows),
+                        last_updated_ts,
+                        strict=True,
+                    )
+                ]
+            )
+        return b"},".join(map(b"".join, zip(*parts, strict=False))) + b"}"
+
+    def minimal_states(
+        self, states: Sequence[str | None], last_updated_ts: Sequence[float]
+    ) -> bytes:
+        """Encode the states that differ from the previous state.
+
+        The first state is skipped since it is always sent in full.
+        """
+        changed = list(map(ne, states[1:], states[:-1]))
+        if not any(changed):
+            return b""
+        changed_states = list(compress(states[1:], changed))
+        changed_ts = list(compress(last_updated_ts[1:], changed))
+        return (
+            b"},".join(
+                map(
+                    b"".join,
+                    zip(
+                        self._state_parts(changed_states),
+                        _timestamp_parts(_LAST_UPDATED_PREFIX, changed_ts),
+                        strict=True,
+                    ),
+                )
+            )
+            + b"}"
+        )
+
+
+def _timestamp_parts(prefix: bytes, timestamps: Sequence[float]) -> Iterator[bytes]:
+    """Encode timestamps with a single dump and split them back apart."""
+    return map(prefix.__add__, json_bytes(list(timestamps))[1:-1].split(b","))
@@ -53,6 +53,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUP_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -75,7 +76,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -88,6 +91,7 @@ from .queries import (
     find_entity_ids_to_migrate,
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
+    find_oldest_statistics_start_ts,
     find_states_context_ids_to_migrate,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
@@ -95,12 +99,18 @@ from .queries import (
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
+    has_statistics_to_rollup,
     has_used_states_entity_ids,
     has_used_states_event_ids,
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    get_start_time,
+    reduce_month_ts_factory,
+    update_rollup_statistics,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -1758,6 +1768,14 @@ class _SchemaVersion47Migrator(_SchemaVersionMigrator, target_version=47):
         )
 
 
+class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics_daily and statistics_monthly tables are created by
+        # Base.metadata.create_all, they are filled from the existing hourly
+        # statistics by StatisticsRollupMigration once the recorder is running.
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2648,6 +2666,54 @@ class EntityIDPostMigration(BaseRunTimeMigrationWithQuery):
         return has_used_states_entity_ids()
 
 
+class StatisticsRollupMigration(BaseRunTimeMigrationWithQuery):
+    """Migration to compile the daily and monthly rollups of hourly statistics."""
+
+    required_schema_version = STATISTICS_ROLLUP_SCHEMA_VERSION
+    migration_id = "statistics_rollup"
+
+    def __init__(self, schema_version: int, migration_changes: dict[str, int]) -> None:
+        """Initialize a new StatisticsRollupMigration."""
+        super().__init__(schema_version, migration_changes)
+        self._next_start_ts: float | None = None
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Compile the rollups of one month, returns True if completed.
+
+        The rollups are compiled one local month at a time, starting from the
+        oldest hourly statistics, so the recorder queue is not blocked for long.
+        """
+        with session_scope(session=instance.get_session()) as session:
+            if self._next_start_ts is None:
+                # Start from scratch, rollups compiled in another time zone
+                # don't line up with the periods compiled now
+                session.query(StatisticsDaily).delete(synchronize_session=False)
+                session.query(StatisticsMonthly).delete(synchronize_session=False)
+                self._next_start_ts = session.execute(
+                    find_oldest_statistics_start_ts()
+                ).scalar()
+            if self._next_start_ts is not None:
+                _, month_start_end = reduce_month_ts_factory()
+                start_ts, end_ts = month_start_end(self._next_start_ts)
+                _LOGGER.debug("Compiling statistics rollups from %s", start_ts)
+                update_rollup_statistics(session, start_ts, end_ts)
+                self._next_start_ts = end_ts if end_ts <= time() else None
+
+            is_done = self._next_start_ts is None
+
+        _LOGGER.debug("Compiling statistics rollups done=%s", is_done)
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Will be called after migrate returns True."""
+        _LOGGER.debug("Activating statistics rollups as all periods are compiled")
+        instance.statistics_rollups_active = True
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if there are statistics to roll up."""
+        return has_statistics_to_rollup()
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
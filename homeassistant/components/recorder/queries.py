@@ -896,6 +896,16 @@ def find_unmigrated_short_term_statistics_rows(
     )
 
 
+def has_statistics_to_rollup() -> StatementLambdaElement:
+    """Check if there are hourly statistics to roll up."""
+    return lambda_stmt(lambda: select(Statistics.id).limit(1))
+
+
+def find_oldest_statistics_start_ts() -> StatementLambdaElement:
+    """Find the start of the oldest hourly statistics."""
+    return lambda_stmt(lambda: select(func.min(Statistics.start_ts)))
+
+
 def find_unmigrated_statistics_rows(max_bind_vars: int) -> StatementLambdaElement:
     """Find unmigrated statistics rows."""
     return lambda_stmt(
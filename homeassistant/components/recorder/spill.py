@@ -0,0 +1,136 @@
+"""Spill recorder events to disk while the database cannot keep up."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import logging
+import threading
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Context,
+    Event,
+    EventOrigin,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads_object
+
+_LOGGER = logging.getLogger(__name__)
+
+SPILL_FLUSH_DELAY = 1
+
+# Held while appending to or replaying the spill file so events
+# are never appended to a file that is being replayed and removed
+SPILL_FILE_LOCK = threading.Lock()
+
+
+class EventSpill:
+    """Append events to a file while the recorder backlog is full.
+
+    The events are written as JSON lines from the executor so they
+    survive a restart, and the recorder replays them in order once
+    the database has caught up.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the spill."""
+        self.hass = hass
+        self.path = path
+        self.spilled = 0
+        self._pending: list[Event] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_lock = asyncio.Lock()
+
+    @callback
+    def async_add(self, event: Event) -> None:
+        """Add an event to be written to the spill file."""
+        self._pending.append(event)
+        self.spilled += 1
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                SPILL_FLUSH_DELAY, self._async_schedule_flush
+            )
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule writing the pending events."""
+        self._flush_handle = None
+        self.hass.async_create_background_task(
+            self.async_flush(), "recorder spill flush"
+        )
+
+    async def async_flush(self) -> None:
+        """Write the pending events to the spill file."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        async with self._flush_lock:
+            if not (events := self._pending):
+                return
+            self._pending = []
+            await self.hass.async_add_executor_job(_append_events, self.path, events)
+
+    @callback
+    def async_take_pending(self) -> list[Event]:
+        """Return the events that have not been written to the spill file yet."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        events = self._pending
+        self._pending = []
+        return events
+
+
+def _append_events(path: str, events: list[Event]) -> None:
+    """Append events to the spill file."""
+    lines: list[bytes] = []
+    for event in events:
+        try:
+            lines.append(json_bytes(event) + b"\n")
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+    with SPILL_FILE_LOCK, open(path, "ab") as fp:
+        fp.writelines(lines)
+
+
+def read_spilled_events(path: str) -> Iterator[Event]:
+    """Read the events back from the spill file.
+
+    The caller must hold SPILL_FILE_LOCK.
+    """
+    with open(path, "rb") as fp:
+        for line in fp:
+            try:
+                yield _event_from_dict(json_loads_object(line))
+            except (KeyError, TypeError, ValueError):
+                _LOGGER.warning("Skipping invalid event in %s: %s", path, line)
+
+
+def _event_from_dict(event_dict: dict[str, Any]) -> Event:
+    """Convert a dict written to the spill file back into an event."""
+    event_type = event_dict["event_type"]
+    data = event_dict["data"]
+    if event_type == EVENT_STATE_CHANGED:
+        data["old_state"] = State.from_dict(data["old_state"])
+        data["new_state"] = State.from_dict(data["new_state"])
+    context = event_dict["context"]
+    time_fired = dt_util.parse_datetime(event_dict["time_fired"])
+    if time_fired is None:
+        raise ValueError(f"Invalid time_fired {event_dict['time_fired']}")
+    return Event(
+        event_type,
+        data,
+        EventOrigin(event_dict["origin"]),
+        time_fired.timestamp(),
+        Context(
+            user_id=context["user_id"],
+            parent_id=context["parent_id"],
+            id=context["id"],
+        ),
+    )
@@ -60,6 +60,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -126,6 +128,39 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
+QUERY_STATISTICS_ROLLUP_MEAN = (
+    Statistics.metadata_id,
+    func.avg(Statistics.mean),
+    func.count(Statistics.mean),
+    func.min(Statistics.min),
+    func.max(Statistics.max),
+)
+
+QUERY_STATISTICS_ROLLUP_SUM = (
+    Statistics.metadata_id,
+    Statistics.start_ts,
+    Statistics.last_reset_ts,
+    Statistics.state,
+    Statistics.sum,
+    func.row_number()
+    .over(
+        partition_by=Statistics.metadata_id,
+        order_by=Statistics.start_ts.desc(),
+    )
+    .label("rownum"),
+)
+
+QUERY_STATISTICS_MONTHLY_ROLLUP = (
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.mean,
+    StatisticsDaily.mean_count,
+    StatisticsDaily.min,
+    StatisticsDaily.max,
+    StatisticsDaily.last_reset_ts,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+)
+
 
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: ConductivityConverter for unit in ConductivityConverter.VALID_UNITS},
@@ -444,6 +479,246 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
         for metadata_id, summary_item in summary.items()
     )
 
+    if summary:
+        # Keep the daily and monthly rollups of this hour up to date
+        update_rollup_statistics(session, start_time_ts, end_time_ts, list(summary))
+
+
+def _compile_rollup_statistics_summary_mean_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the summary mean statement for rolled up statistics."""
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_ROLLUP_MEAN)
+        .filter(Statistics.start_ts >= start_time_ts)
+        .filter(Statistics.start_ts < end_time_ts)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(Statistics.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.group_by(Statistics.metadata_id).order_by(
+        Statistics.metadata_id
+    )
+    return stmt
+
+
+def _compile_rollup_statistics_last_sum_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the last sum statement for rolled up statistics."""
+    if metadata_ids:
+        return lambda_stmt(
+            lambda: select(
+                subquery := (
+                    select(*QUERY_STATISTICS_ROLLUP_SUM)
+                    .filter(Statistics.start_ts >= start_time_ts)
+                    .filter(Statistics.start_ts < end_time_ts)
+                    .filter(Statistics.metadata_id.in_(metadata_ids))
+                    .subquery()
+                )
+            )
+            .filter(subquery.c.rownum == 1)
+            .order_by(subquery.c.metadata_id)
+        )
+    return lambda_stmt(
+        lambda: select(
+            subquery := (
+                select(*QUERY_STATISTICS_ROLLUP_SUM)
+                .filter(Statistics.start_ts >= start_time_ts)
+                .filter(Statistics.start_ts < end_time_ts)
+                .subquery()
+            )
+        )
+        .filter(subquery.c.rownum == 1)
+        .order_by(subquery.c.metadata_id)
+    )
+
+
+def _compile_daily_rollup_statistics(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Compile the rollup of one day of hourly statistics.
+
+    This replaces the rows of the day with a summary of the hourly statistics
+    in the same way as _reduce_statistics does:
+    - average, min max is computed by a database query
+    - last_reset, state and sum are taken from the last hourly entry of the day
+    The number of hourly means is stored too, so the monthly rollups can be
+    compiled from the daily rollups.
+    """
+    summary: dict[int, StatisticDataTimestamp] = {}
+    mean_counts: dict[int, int] = {}
+    stmt = _compile_rollup_statistics_summary_mean_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for metadata_id, _mean, mean_count, _min, _max in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        summary[metadata_id] = {
+            "start_ts": start_time_ts,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+        mean_counts[metadata_id] = mean_count
+
+    stmt = _compile_rollup_statistics_last_sum_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for metadata_id, _, last_reset_ts, state, _sum, _ in execute_stmt_lambda_element(
+        session, stmt
+    ):
+        summary[metadata_id].update(
+            {
+                "last_reset_ts": last_reset_ts,
+                "state": state,
+                "sum": _sum,
+            }
+        )
+
+    query = session.query(StatisticsDaily).filter(
+        StatisticsDaily.start_ts == start_time_ts
+    )
+    if metadata_ids:
+        query = query.filter(StatisticsDaily.metadata_id.in_(metadata_ids))
+    query.delete(synchronize_session=False)
+    for metadata_id, summary_item in summary.items():
+        row = StatisticsDaily.from_stats_ts(metadata_id, summary_item)
+        row.mean_count = mean_counts[metadata_id]
+        session.add(row)
+
+
+def _compile_monthly_rollup_statistics_stmt(
+    start_time_ts: float, end_time_ts: float, metadata_ids: list[int] | None
+) -> StatementLambdaElement:
+    """Generate the statement for the daily rollups of a month."""
+    stmt = lambda_stmt(
+        lambda: select(*QUERY_STATISTICS_MONTHLY_ROLLUP)
+        .filter(StatisticsDaily.start_ts >= start_time_ts)
+        .filter(StatisticsDaily.start_ts < end_time_ts)
+    )
+    if metadata_ids:
+        stmt += lambda q: q.filter(StatisticsDaily.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(StatisticsDaily.metadata_id, StatisticsDaily.start_ts)
+    return stmt
+
+
+def _compile_monthly_rollup_statistics(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None,
+) -> None:
+    """Compile the rollup of one month from the daily rollups.
+
+    This replaces the rows of the month with a summary of its daily rollups,
+    which gives the same result as summarizing the hourly statistics:
+    - the mean is the average of the daily means weighted by their number of
+      hourly means, min and max are the lowest and highest of the days
+    - last_reset, state and sum are taken from the last day of the month
+    """
+    summary: dict[int, StatisticDataTimestamp] = {}
+    # metadata_id -> sum of the hourly means, number of hourly means
+    mean_sums: dict[int, tuple[float, int]] = {}
+    stmt = _compile_monthly_rollup_statistics_stmt(
+        start_time_ts, end_time_ts, metadata_ids
+    )
+    for (
+        metadata_id,
+        _mean,
+        mean_count,
+        _min,
+        _max,
+        last_reset_ts,
+        state,
+        _sum,
+    ) in execute_stmt_lambda_element(session, stmt):
+        if (summary_item := summary.get(metadata_id)) is None:
+            summary_item = summary[metadata_id] = {
+                "start_ts": start_time_ts,
+                "mean": None,
+                "min": None,
+                "max": None,
+            }
+        if _min is not None and (
+            (month_min := summary_item["min"]) is None or _min < month_min
+        ):
+            summary_item["min"] = _min
+        if _max is not None and (
+            (month_max := summary_item["max"]) is None or _max > month_max
+        ):
+            summary_item["max"] = _max
+        if _mean is not None and mean_count:
+            mean_sum, count = mean_sums.get(metadata_id, (0.0, 0))
+            mean_sums[metadata_id] = (mean_sum + _mean * mean_count, count + mean_count)
+        # The rows are ordered by start, so the last one wins
+        summary_item["last_reset_ts"] = last_reset_ts
+        summary_item["state"] = state
+        summary_item["sum"] = _sum
+
+    for metadata_id, (mean_sum, count) in mean_sums.items():
+        summary[metadata_id]["mean"] = mean_sum / count
+
+    query = session.query(StatisticsMonthly).filter(
+        StatisticsMonthly.start_ts == start_time_ts
+    )
+    if metadata_ids:
+        query = query.filter(StatisticsMonthly.metadata_id.in_(metadata_ids))
+    query.delete(synchronize_session=False)
+    session.add_all(
+        StatisticsMonthly.from_stats_ts(metadata_id, summary_item)
+        for metadata_id, summary_item in summary.items()
+    )
+
+
+def _rollup_tables() -> (
+    tuple[
+        tuple[
+            type[StatisticsDaily | StatisticsMonthly],
+            Callable[[float], tuple[float, float]],
+            Callable[[Session, float, float, list[int] | None], None],
+        ],
+        ...,
+    ]
+):
+    """Return the rollup tables with their period start end and compile functions.
+
+    The daily rollups come first, the monthly rollups are compiled from them.
+    """
+    # The functions are created on each call in case the timezone changes
+    return (
+        (
+            StatisticsDaily,
+            reduce_day_ts_factory()[1],
+            _compile_daily_rollup_statistics,
+        ),
+        (
+            StatisticsMonthly,
+            reduce_month_ts_factory()[1],
+            _compile_monthly_rollup_statistics,
+        ),
+    )
+
+
+def update_rollup_statistics(
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    metadata_ids: list[int] | None = None,
+) -> None:
+    """Compile the daily and monthly rollups of hourly statistics.
+
+    All days and months overlapping start_time_ts - end_time_ts are compiled,
+    for the given metadata_ids or for all statistics if metadata_ids is omitted.
+    """
+    for _, period_start_end, compile_rollup in _rollup_tables():
+        period_start_ts, period_end_ts = period_start_end(start_time_ts)
+        while period_start_ts < end_time_ts:
+            compile_rollup(session, period_start_ts, period_end_ts, metadata_ids)
+            period_start_ts, period_end_ts = period_start_end(period_end_ts)
+
 
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
@@ -1698,6 +1973,186 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _reduced_hourly_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time_ts: float,
+    end_time_ts: float,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    reduce: Callable[
+        [
+            dict[str, list[StatisticsRow]],
+            set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+        ],
+        dict[str, list[StatisticsRow]],
+    ],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return the hourly statistics of part of a day or month reduced to it."""
+    stmt = _generate_statistics_during_period_stmt(
+        dt_util.utc_from_timestamp(start_time_ts),
+        dt_util.utc_from_timestamp(end_time_ts),
+        metadata_ids,
+        Statistics,
+        types,
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return {}
+    return reduce(
+        _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            Statistics,
+            units,
+            types,
+        ),
+        types,
+    )
+
+
+def _statistics_during_period_from_rollups(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    period: Literal["day", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return daily, weekly or monthly statistics from the rollup tables.
+
+    The whole days or months in the requested period are read from the
+    rollups, the days or months the period only partly covers are reduced
+    from the hourly statistics. Weeks are reduced from the days.
+
+    Returns None if the rollups can't be used, the caller should then reduce
+    the hourly statistics instead.
+    """
+    instance = get_instance(hass)
+    if not instance.statistics_rollups_active:
+        return None
+
+    table: type[StatisticsDaily | StatisticsMonthly]
+    if period == "month":
+        table = StatisticsMonthly
+        _, period_start_end = reduce_month_ts_factory()
+        reduce_hourly = _reduce_statistics_per_month
+    else:
+        table = StatisticsDaily
+        _, period_start_end = reduce_day_ts_factory()
+        reduce_hourly = _reduce_statistics_per_day
+
+    # Only whole periods are read from the rollups
+    start_time_ts = start_time.timestamp()
+    first_start_ts, first_end_ts = period_start_end(start_time_ts)
+    rollup_start_ts = (
+        start_time_ts if first_start_ts == start_time_ts else first_end_ts
+    )
+    end_time_ts: float | None = None
+    rollup_end_ts: float | None = None
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+        rollup_end_ts, _ = period_start_end(end_time_ts)
+        if rollup_end_ts <= rollup_start_ts:
+            # The requested period does not cover a whole day or month
+            return None
+
+    stmt = _generate_statistics_during_period_stmt(
+        dt_util.utc_from_timestamp(rollup_start_ts),
+        None if rollup_end_ts is None else dt_util.utc_from_timestamp(rollup_end_ts),
+        metadata_ids,
+        table,
+        types,
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    rollup_result = (
+        _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
+        if stats
+        else {}
+    )
+
+    # Days and months don't have a fixed duration, so the end of each row is
+    # recalculated. This also detects rollups compiled in another time zone.
+    for rows in rollup_result.values():
+        for row in rows:
+            start, end = period_start_end(row["start"])
+            if start != row["start"]:
+                _LOGGER.debug("Statistics rollups are not aligned, rebuilding")
+                instance.queue_statistics_rollup_rebuild()
+                return None
+            row["end"] = end
+
+    results = [rollup_result]
+    if start_time_ts < rollup_start_ts:
+        results.insert(
+            0,
+            _reduced_hourly_statistics_during_period(
+                hass,
+                session,
+                start_time_ts,
+                rollup_start_ts,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                reduce_hourly,
+                units,
+                types,
+            ),
+        )
+    if (
+        end_time_ts is not None
+        and rollup_end_ts is not None
+        and rollup_end_ts < end_time_ts
+    ):
+        results.append(
+            _reduced_hourly_statistics_during_period(
+                hass,
+                session,
+                rollup_end_ts,
+                end_time_ts,
+                statistic_ids,
+                metadata,
+                metadata_ids,
+                reduce_hourly,
+                units,
+                types,
+            )
+        )
+
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    for partial_result in results:
+        for statistic_id, rows in partial_result.items():
+            result[statistic_id].extend(rows)
+
+    if period == "week":
+        result = _reduce_statistics_per_week(result, types)
+
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1768,35 +2223,58 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if (
+        period == "day"
+        or period == "month"
+        # The mean of a week can't be computed from the daily means
+        or (period == "week" and "mean" not in types)
+    ) and (
+        rollup_result := _statistics_during_period_from_rollups(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            period,
+            units,
+            types,
+        )
+    ) is not None:
+        if not rollup_result:
+            return {}
+        result = rollup_result
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2340,13 +2818,23 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    imported_start_ts: list[float] = []
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        imported_start_ts.append(stat["start"].timestamp())
 
     if table != StatisticsShortTerm:
+        if imported_start_ts:
+            # Recompile the days and months the imported hours belong to
+            update_rollup_statistics(
+                session,
+                min(imported_start_ts),
+                max(imported_start_ts) + table.duration.total_seconds(),
+                [metadata_id],
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2476,6 +2964,25 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # The rollup of the period start_time is in is recompiled from the
+        # adjusted hourly statistics, later periods are adjusted directly
+        hour_start_ts = start_time.replace(minute=0).timestamp()
+        for table, period_start_end, compile_rollup in _rollup_tables():
+            period_start_ts, period_end_ts = period_start_end(hour_start_ts)
+            compile_rollup(
+                session,
+                period_start_ts,
+                period_end_ts,
+                [metadata[statistic_id][0]],
+            )
+            _adjust_sum_statistics(
+                session,
+                table,
+                metadata[statistic_id][0],
+                dt_util.utc_from_timestamp(period_end_ts),
+                sum_adjustment,
+            )
+
     return True
 
 
@@ -2536,6 +3043,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
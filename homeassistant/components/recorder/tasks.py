@@ -11,6 +11,7 @@ import logging
 import threading
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
@@ -251,6 +252,18 @@ class WaitTask(RecorderTask):
         instance._queue_watch.set()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class ReplaySpilledEventsTask(RecorderTask):
+    """Record the events written to the spill file while the backlog was full."""
+
+    path: str
+    pending: list[Event]
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spilled_events(self.path, self.pending)  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class DatabaseLockTask(RecorderTask):
     """An object to insert into the recorder queue to prevent writes to the database."""
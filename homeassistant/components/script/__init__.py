@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 import asyncio
 from dataclasses import dataclass
 import logging
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
@@ -48,6 +49,7 @@ from homeassistant.helpers.issue_registry import (
     async_create_issue,
     async_delete_issue,
 )
+from homeassistant.helpers.reference_index import ReferenceIndex
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -64,6 +66,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.dt import parse_datetime
+from homeassistant.util.hass_dict import HassKey
 
 from .config import ScriptConfig, ValidationStatus
 from .const import (
@@ -80,6 +83,10 @@ from .const import (
 from .helpers import async_get_blueprints
 from .trace import trace_script
 
+DATA_REFERENCE_INDEX: HassKey[ReferenceIndex[BaseScriptEntity]] = HassKey(
+    f"{DOMAIN}_reference_index"
+)
+
 SCRIPT_SERVICE_SCHEMA = vol.Schema(dict)
 SCRIPT_TURN_ONOFF_SCHEMA = make_entity_service_schema(
     {vol.Optional(ATTR_VARIABLES): {str: cv.match_all}}
@@ -93,20 +100,26 @@ def is_on(hass: HomeAssistant, entity_id: str) -> bool:
     return hass.states.is_state(entity_id, STATE_ON)
 
 
+_REFERENCE_PROPERTIES = (
+    "referenced_areas",
+    "referenced_blueprint",
+    "referenced_devices",
+    "referenced_entities",
+    "referenced_floors",
+    "referenced_labels",
+)
+
+
 def _scripts_with_x(
     hass: HomeAssistant, referenced_id: str, property_name: str
 ) -> list[str]:
     """Return all scripts that reference the x."""
-    if DOMAIN not in hass.data:
+    if DATA_REFERENCE_INDEX not in hass.data:
         return []
 
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if referenced_id in getattr(script_entity, property_name)
-    ]
+    return hass.data[DATA_REFERENCE_INDEX].async_referencing(
+        property_name, referenced_id
+    )
 
 
 def _x_in_script(hass: HomeAssistant, entity_id: str, property_name: str) -> list[str]:
@@ -185,16 +198,7 @@ def labels_in_script(hass: HomeAssistant, entity_id: str) -> list[str]:
 @callback
 def scripts_with_blueprint(hass: HomeAssistant, blueprint_path: str) -> list[str]:
     """Return all scripts that reference the blueprint."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component: EntityComponent[BaseScriptEntity] = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if script_entity.referenced_blueprint == blueprint_path
-    ]
+    return _scripts_with_x(hass, blueprint_path, "referenced_blueprint")
 
 
 @callback
@@ -216,6 +220,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = component = EntityComponent[BaseScriptEntity](
         LOGGER, DOMAIN, hass
     )
+    hass.data[DATA_REFERENCE_INDEX] = ReferenceIndex(
+        {name: attrgetter(name) for name in _REFERENCE_PROPERTIES}
+    )
 
     # Register script as valid domain for Blueprint
     async_get_blueprints(hass)
@@ -427,6 +434,16 @@ class BaseScriptEntity(ToggleEntity, ABC):
 
     raw_config: ConfigType | None
 
+    async def async_internal_added_to_hass(self) -> None:
+        """Add the script to the reference index."""
+        await super().async_internal_added_to_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_add(self)
+
+    async def async_internal_will_remove_from_hass(self) -> None:
+        """Remove the script from the reference index."""
+        await super().async_internal_will_remove_from_hass()
+        self.hass.data[DATA_REFERENCE_INDEX].async_remove(self)
+
     @cached_property
     @abstractmethod
     def referenced_labels(self) -> set[str]:
@@ -191,6 +191,15 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     """Base class for sensor entities."""
 
     _entity_component_unrecorded_attributes = frozenset({ATTR_OPTIONS})
+    _derived_attribute_properties = {
+        "capability_attributes": ("options", "state_class"),
+        "state_attributes": ("last_reset", "state_class"),
+        "unit_of_measurement": (
+            "device_class",
+            "native_unit_of_measurement",
+            "suggested_unit_of_measurement",
+        ),
+    }
 
     entity_description: SensorEntityDescription
     _attr_device_class: SensorDeviceClass | None
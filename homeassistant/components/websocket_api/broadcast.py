@@ -0,0 +1,166 @@
+"""Shared fan-out of state changed events to websocket subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Mapping
+import logging
+from typing import Any, Final
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import CONF_EXCLUDE, CONF_INCLUDE, EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+DATA_STATE_CHANGED_BROADCASTER: HassKey[StateChangedBroadcaster] = HassKey(
+    "websocket_api_state_changed_broadcaster"
+)
+
+type StateChangedSender = Callable[[Event[EventStateChangedData]], None]
+
+
+def filter_key(config: Mapping[str, Any]) -> Hashable:
+    """Return a hashable key for an include/exclude filter config."""
+    return tuple(
+        (section, key, tuple(sorted(values)))
+        for section in (CONF_INCLUDE, CONF_EXCLUDE)
+        for key, values in sorted(config[section].items())
+    )
+
+
+class _Bucket:
+    """Subscriptions sharing the same entity_ids and filter."""
+
+    __slots__ = ("entity_ids", "entity_filter", "users")
+
+    def __init__(
+        self,
+        entity_ids: frozenset[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+    ) -> None:
+        """Initialize the bucket."""
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        # user_id -> (user, {subscription: sender})
+        self.users: dict[str, tuple[User, dict[object, StateChangedSender]]] = {}
+
+    def matches(self, entity_id: str) -> bool:
+        """Return if the bucket wants events for the entity."""
+        return (not self.entity_ids or entity_id in self.entity_ids) and (
+            not self.entity_filter or self.entity_filter(entity_id)
+        )
+
+
+class StateChangedBroadcaster:
+    """Forward state changed events to websocket subscriptions.
+
+    Subscriptions are grouped in buckets by their entity_ids and filter
+    and by user within a bucket. Each event is matched once per bucket
+    and the read permission is checked once per user, no matter how many
+    connections share them. Encoding is shared through the cached
+    message helpers used by the senders.
+    """
+
+    __slots__ = ("_hass", "_buckets", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the broadcaster."""
+        self._hass = hass
+        self._buckets: dict[Hashable, _Bucket] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        user: User,
+        bucket_key: Hashable,
+        entity_ids: frozenset[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        sender: StateChangedSender,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a sender to state changes readable by the user.
+
+        bucket_key must identify the entity_ids and entity_filter.
+        """
+        if (bucket := self._buckets.get(bucket_key)) is None:
+            bucket = self._buckets[bucket_key] = _Bucket(entity_ids, entity_filter)
+        if (user_senders := bucket.users.get(user.id)) is None:
+            user_senders = bucket.users[user.id] = (user, {})
+        subscription = object()
+        user_senders[1][subscription] = sender
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the sender."""
+            senders = user_senders[1]
+            senders.pop(subscription, None)
+            if not senders and bucket.users.get(user.id) is user_senders:
+                del bucket.users[user.id]
+            if not bucket.users and self._buckets.get(bucket_key) is bucket:
+                del self._buckets[bucket_key]
+            if not self._buckets and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state changed event to all matching subscriptions."""
+        entity_id = event.data["entity_id"]
+        can_read: dict[str, bool] = {}
+        for bucket in list(self._buckets.values()):
+            if not bucket.matches(entity_id):
+                continue
+            for user_id, (user, senders) in list(bucket.users.items()):
+                if (allowed := can_read.get(user_id)) is None:
+                    allowed = can_read[user_id] = _async_user_can_read(user, entity_id)
+                if not allowed:
+                    continue
+                for sender in list(senders.values()):
+                    # A failing sender must not keep the event from the others
+                    try:
+                        sender(event)
+                    except Exception:
+                        _LOGGER.exception(
+                            "Error sending %s event for %s to a subscription",
+                            EVENT_STATE_CHANGED,
+                            entity_id,
+                        )
+
+
+@callback
+def _async_user_can_read(user: User, entity_id: str) -> bool:
+    """Return if the user may read the entity."""
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    if user.is_admin:
+        return True
+    permissions = user.permissions
+    return permissions.access_all_entities(POLICY_READ) or permissions.check_entity(
+        entity_id, POLICY_READ
+    )
+
+
+@callback
+def async_get_state_changed_broadcaster(
+    hass: HomeAssistant,
+) -> StateChangedBroadcaster:
+    """Return the state changed broadcaster."""
+    if (broadcaster := hass.data.get(DATA_STATE_CHANGED_BROADCASTER)) is None:
+        broadcaster = hass.data[DATA_STATE_CHANGED_BROADCASTER] = (
+            StateChangedBroadcaster(hass)
+        )
+    return broadcaster
@@ -10,7 +10,6 @@ from typing import Any, cast
 
 import voluptuous as vol
 
-from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
@@ -63,6 +62,7 @@ from homeassistant.setup import async_get_loaded_integrations, async_get_setup_t
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .broadcast import async_get_state_changed_broadcaster, filter_key
 from .connection import ActiveConnection
 from .messages import construct_result_message
 
@@ -105,26 +105,6 @@ def pong_message(iden: int) -> dict[str, Any]:
     return {"id": iden, "type": "pong"}
 
 
-@callback
-def _forward_events_check_permissions(
-    send_message: Callable[[bytes | str | dict[str, Any]], None],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event,
-) -> None:
-    """Forward state changed events to websocket."""
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_event_message(message_id_as_bytes, event))
-
-
 @callback
 def _forward_events_unconditional(
     send_message: Callable[[bytes | str | dict[str, Any]], None],
@@ -158,22 +138,19 @@ def handle_subscribe_events(
 
     message_id_as_bytes = str(msg["id"]).encode()
 
+    forward_events = partial(
+        _forward_events_unconditional, connection.send_message, message_id_as_bytes
+    )
     if event_type == EVENT_STATE_CHANGED:
-        forward_events = partial(
-            _forward_events_check_permissions,
-            connection.send_message,
-            connection.user,
-            message_id_as_bytes,
-        )
+        # The broadcaster checks the read permissions of the user
+        connection.subscriptions[msg["id"]] = async_get_state_changed_broadcaster(
+            hass
+        ).async_subscribe(connection.user, "events", None, None, forward_events)
     else:
-        forward_events = partial(
-            _forward_events_unconditional, connection.send_message, message_id_as_bytes
+        connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+            event_type, forward_events
         )
 
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
-
     connection.send_result(msg["id"])
 
 
@@ -367,33 +344,6 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
@@ -406,7 +356,7 @@ def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle subscribe entities command."""
-    entity_ids = set(msg.get("entity_ids", [])) or None
+    entity_ids = frozenset(msg.get("entity_ids", [])) or None
     _filter = convert_include_exclude_filter(msg)
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
     # We must never await between sending the states and listening for
@@ -415,16 +365,15 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    # Subscriptions with the same entity_ids and filter share a bucket
+    connection.subscriptions[msg_id] = async_get_state_changed_broadcaster(
+        hass
+    ).async_subscribe(
+        connection.user,
+        ("entities", entity_ids, filter_key(msg)),
+        entity_ids,
+        entity_filter,
+        partial(connection.send_state_diff, message_id_as_bytes),
     )
     connection.send_result(msg_id)
 
@@ -34,6 +34,10 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages after which subscribe_entities state diffs
+# are collapsed per entity instead of being queued one by one.
+PENDING_MSG_COALESCE_STATE_DIFFS: Final = 512
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +62,11 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESSED_MESSAGES = "compressed_messages"
+
+# Messages at least this large are sent as zlib compressed binary frames to
+# clients that enabled FEATURE_COMPRESSED_MESSAGES, unless permessage-deflate
+# was already negotiated during the websocket handshake.
+COMPRESSED_MESSAGE_MIN_SIZE: Final = 8192
+# Messages at least this large are compressed in the executor.
+COMPRESS_IN_EXECUTOR_MIN_SIZE: Final = 262144
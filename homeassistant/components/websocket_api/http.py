@@ -9,13 +9,20 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
@@ -23,8 +30,11 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESS_IN_EXECUTOR_MIN_SIZE,
+    COMPRESSED_MESSAGE_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE_STATE_DIFFS,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -33,7 +43,11 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import (
+    cached_state_diff_message,
+    coalesced_state_diff_message,
+    message_to_json_bytes,
+)
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -79,7 +93,9 @@ class WebSocketHandler:
         "_logger",
         "_peak_checker_unsub",
         "_connection",
+        "_drain_futures",
         "_message_queue",
+        "_pending_state_diffs",
         "_ready_future",
         "_release_ready_queue_size",
     )
@@ -103,8 +119,15 @@ class WebSocketHandler:
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
         self._message_queue: deque[bytes] = deque()
+        # State diffs of subscribe_entities subscriptions collapsed per
+        # entity while the client is behind, keyed by message id and
+        # entity_id with the old state the client last received and the
+        # newest state.
+        self._pending_state_diffs: dict[bytes, dict[str, list[State | None]]] = {}
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Waiting for the message queue to be written to the client
+        self._drain_futures: list[asyncio.Future[None]] = []
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -128,6 +151,7 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -138,11 +162,19 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        # Compressing again is pointless if permessage-deflate was negotiated
+        can_compress = connection.can_compress and not wsock.compress
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
+                if not message_queue and self._pending_state_diffs:
+                    # The client caught up, send the collapsed state diffs
+                    self._flush_state_diffs()
+                    ready_message_count = len(message_queue)
+
                 if not message_queue:
+                    self._release_drain_futures()
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -153,18 +185,22 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                if not can_compress:
+                    # compression may be enabled later in the connection
+                    can_compress = connection.can_compress and not wsock.compress
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                if can_compress and len(message) >= COMPRESSED_MESSAGE_MIN_SIZE:
+                    await send_bytes_binary(await self._async_compress(message))
+                else:
+                    await send_bytes_text(message)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -174,6 +210,30 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drain_futures()
+
+    @callback
+    def _release_drain_futures(self) -> None:
+        """Release the waits for the message queue to be written."""
+        drain_futures = self._drain_futures
+        self._drain_futures = []
+        for future in drain_futures:
+            if not future.done():
+                future.set_result(None)
+
+    async def _async_drain(self) -> None:
+        """Wait until the queued messages are written to the client."""
+        if self._closing or not self._message_queue:
+            return
+        future: asyncio.Future[None] = self._loop.create_future()
+        self._drain_futures.append(future)
+        await future
+
+    async def _async_compress(self, message: bytes) -> bytes:
+        """Compress a message with zlib."""
+        if len(message) < COMPRESS_IN_EXECUTOR_MIN_SIZE:
+            return zlib.compress(message)
+        return await self._hass.async_add_executor_job(zlib.compress, message)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -234,6 +294,47 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _send_state_diff(
+        self, message_id_as_bytes: bytes, event: Event[EventStateChangedData]
+    ) -> None:
+        """Queue sending a subscribe_entities state diff to the client.
+
+        Once the client falls behind, state diffs are collapsed per entity
+        so the backlog is bounded by the number of entities instead of
+        the number of state changes.
+
+        Async friendly.
+        """
+        if len(self._message_queue) < PENDING_MSG_COALESCE_STATE_DIFFS:
+            if self._pending_state_diffs:
+                self._flush_state_diffs()
+            self._send_message(cached_state_diff_message(message_id_as_bytes, event))
+            return
+
+        if self._closing:
+            return
+
+        data = event.data
+        entity_id = data["entity_id"]
+        if (entity_diffs := self._pending_state_diffs.get(message_id_as_bytes)) is None:
+            entity_diffs = self._pending_state_diffs[message_id_as_bytes] = {}
+        if (pending := entity_diffs.get(entity_id)) is None:
+            entity_diffs[entity_id] = [data["old_state"], data["new_state"]]
+        else:
+            pending[1] = data["new_state"]
+
+    @callback
+    def _flush_state_diffs(self) -> None:
+        """Queue one message per subscription with the collapsed state diffs."""
+        pending_state_diffs = self._pending_state_diffs
+        self._pending_state_diffs = {}
+        for message_id_as_bytes, entity_diffs in pending_state_diffs.items():
+            if message := coalesced_state_diff_message(
+                message_id_as_bytes, entity_diffs
+            ):
+                self._send_message(message)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -335,6 +436,7 @@ class WebSocketHandler:
             send_frame = writer._send_frame  # noqa: SLF001
 
         send_bytes_text = partial(send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_binary = partial(send_frame, opcode=WSMsgType.BINARY)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -342,7 +444,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection, send_bytes_text)
         except asyncio.CancelledError:
@@ -377,6 +481,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -407,7 +512,11 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        connection.send_state_diff = self._send_state_diff
+        connection.async_drain = self._async_drain
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -177,6 +177,42 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+def coalesced_state_diff_message(
+    message_id_as_bytes: bytes, changes: dict[str, list[State | None]]
+) -> bytes | None:
+    """Return an event message with the net changes of many entities.
+
+    changes maps each entity_id to the old state the client last
+    received and the newest state. Returns None if none of the
+    changes are visible to the client.
+    """
+    event: dict[str, Any] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        if old_state is None and new_state is None:
+            # Added and removed again before the client saw it
+            continue
+        for event_type, diff in _entity_state_diff(
+            entity_id, old_state, new_state
+        ).items():
+            if event_type == ENTITY_EVENT_REMOVE:
+                event.setdefault(event_type, []).extend(diff)
+            else:
+                event.setdefault(event_type, {}).update(diff)
+    if not event:
+        return None
+    return b"".join(
+        (
+            (
+                _message_to_json_bytes_or_none({"type": "event", "event": event})
+                or INVALID_JSON_PARTIAL_MESSAGE
+            )[:-1],
+            b',"id":',
+            message_id_as_bytes,
+            b"}",
+        )
+    )
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -195,9 +231,23 @@ def _state_diff_event(
         "r": [entity_id,…]
     }
     """
-    if (new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (old_state := event.data["old_state"]) is None:
+    return _entity_state_diff(
+        event.data["entity_id"], event.data["old_state"], event.data["new_state"]
+    )
+
+
+def _entity_state_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict[
+    str,
+    list[str]
+    | dict[str, CompressedState]
+    | dict[str, dict[str, dict[str, str | list[str]]]],
+]:
+    """Convert the change of an entity from old_state to new_state to a diff."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
@@ -221,9 +271,11 @@ def _state_diff_event(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
+    # The state machine reuses the attributes of the old state
+    # if they did not change so we can avoid comparing them.
+    if (old_attributes := old_state.attributes) is not (
         new_attributes := new_state.attributes
-    ):
+    ) and old_attributes != new_attributes:
         if added := {
             key: value
             for key, value in new_attributes.items()
@@ -51,10 +51,12 @@ import yarl
 
 from . import util
 from .const import (
+    ATTR_DEVICE_CLASS,
     ATTR_DOMAIN,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    ATTR_UNIT_OF_MEASUREMENT,
     BASE_PLATFORMS,
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_CONTEXT,
@@ -106,7 +108,7 @@ from .util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 from .util.event_type import EventType
-from .util.executor import InterruptibleThreadPoolExecutor
+from .util.executor import ExecutorJobQueue, InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
@@ -454,7 +456,9 @@ class HomeAssistant:
         self.import_executor = InterruptibleThreadPoolExecutor(
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
+        self.executor_job_queue = ExecutorJobQueue(self.loop)
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        self._job_timer: Callable[[HassJob[..., Any], float], None] | None = None
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -768,7 +772,7 @@ class HomeAssistant:
         else:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            task = self.loop.run_in_executor(None, hassjob.target, *args)
+            task = self.executor_job_queue.async_submit(hassjob.target, *args)
 
         task_bucket = self._background_tasks if background else self._tasks
         task_bucket.add(task)
@@ -877,7 +881,7 @@ class HomeAssistant:
         self, target: Callable[[*_Ts], _T], *args: *_Ts
     ) -> asyncio.Future[_T]:
         """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        task = self.executor_job_queue.async_submit(target, *args)
 
         tracked = asyncio.current_task() in self._tasks
         task_bucket = self._tasks if tracked else self._background_tasks
@@ -942,6 +946,52 @@ class HomeAssistant:
 
         return self._async_add_hass_job(hassjob, *args, background=background)
 
+    @callback
+    def _async_run_timed_hass_job[_R](
+        self,
+        job_timer: Callable[[HassJob[..., Any], float], None],
+        hassjob: HassJob[..., Coroutine[Any, Any, _R] | _R],
+        *args: Any,
+        background: bool = False,
+    ) -> asyncio.Future[_R] | None:
+        """Run a HassJob and pass how long it blocked the loop to the job timer."""
+        start = time.perf_counter()
+        try:
+            return HomeAssistant.async_run_hass_job(
+                self, hassjob, *args, background=background
+            )
+        finally:
+            job_timer(hassjob, time.perf_counter() - start)
+
+    @callback
+    def async_set_job_timer(
+        self, job_timer: Callable[[HassJob[..., Any], float], None]
+    ) -> CALLBACK_TYPE:
+        """Time the jobs run in the event loop.
+
+        The job timer is called with each job run with async_run_hass_job,
+        which includes the event bus listeners, along with how long they
+        blocked the event loop. Only one job timer can be set at a time.
+
+        This method must be run in the event loop.
+        """
+        if self._job_timer is not None:
+            raise HomeAssistantError("A job timer is already set")
+        self._job_timer = job_timer
+        # Swap in the timed runner instead of checking for a job timer
+        # each time a job is run since it is rarely set
+        self.async_run_hass_job = functools.partial(  # type: ignore[method-assign]
+            self._async_run_timed_hass_job, job_timer
+        )
+
+        @callback
+        def _remove_job_timer() -> None:
+            if self._job_timer is job_timer:
+                self._job_timer = None
+                del self.async_run_hass_job
+
+        return _remove_job_timer
+
     @overload
     @callback
     def async_run_job[_R, *_Ts](
@@ -1421,6 +1471,26 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+_KeyedJobType = HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None]
+
+
+@dataclass(slots=True, frozen=True)
+class EventKeyIndex(Generic[_DataT]):
+    """Describe how events are routed to listeners registered by key.
+
+    key_func derives the dispatch key (entity_id, domain, device_id, ...)
+    from the event data, or returns None when the event should not be
+    dispatched to any listener of the index. Listeners registered with
+    the MATCH_ALL key receive every event the key_func accepts.
+
+    If dispatch_soon is set, listeners are called in a later iteration
+    of the event loop instead of while the event is being fired.
+    """
+
+    name: str
+    key_func: Callable[[_DataT], str | None]
+    dispatch_soon: bool = False
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1460,7 +1530,13 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1544,10 @@ class EventBus:
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[EventKeyIndex[Any], defaultdict[str, list[_KeyedJobType[Any]]]],
+        ] = {}
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
         self._async_logging_changed()
@@ -1482,9 +1562,15 @@ class EventBus:
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
 
+        Keyed listeners are counted once per index they are registered
+        with, since the bus only dispatches to a single bucket per index.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, indexes in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(indexes)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1554,6 +1640,11 @@ class EventBus:
             match_all_listeners = self._match_all_listeners
         else:
             match_all_listeners = EMPTY_LIST
+        keyed_indexes = self._keyed_listeners.get(event_type)
+
+        if not listeners and not match_all_listeners and not keyed_indexes:
+            # Nobody is listening, avoid creating the event
+            return
 
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
@@ -1579,6 +1670,59 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if not keyed_indexes or event_data is None:
+            return
+
+        # Listeners registered by key are bucketed so firing an event
+        # only costs one key lookup per index instead of calling an
+        # event filter for every listener.
+        for index, buckets in list(keyed_indexes.items()):
+            try:
+                if (key := index.key_func(event_data)) is None:
+                    continue
+            except Exception:
+                _LOGGER.exception("Error in event key function %s", index.name)
+                continue
+
+            if key not in buckets and MATCH_ALL not in buckets:
+                continue
+
+            if not event:
+                event = Event(
+                    event_type,
+                    event_data,
+                    origin,
+                    time_fired,
+                    context,
+                )
+
+            if index.dispatch_soon:
+                self._hass.loop.call_soon(
+                    self._async_dispatch_keyed, buckets, key, event
+                )
+            else:
+                self._async_dispatch_keyed(buckets, key, event)
+
+    @callback
+    def _async_dispatch_keyed(
+        self,
+        buckets: dict[str, list[_KeyedJobType[_DataT]]],
+        key: str,
+        event: Event[_DataT],
+    ) -> None:
+        """Run the listeners registered for a key and for MATCH_ALL."""
+        jobs = buckets.get(key, EMPTY_LIST)
+        if MATCH_ALL in buckets:
+            jobs = jobs + buckets[MATCH_ALL]
+        else:
+            # Copy since listeners may unsubscribe while we iterate
+            jobs = jobs.copy()
+        for job in jobs:
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1719,6 +1863,72 @@ class EventBus:
         one_time_listener.remove = remove
         return remove
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        index: EventKeyIndex[_DataT],
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        job_type: HassJobType | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type that match one of the keys.
+
+        The index describes how the key is derived from the event data.
+        Listeners sharing an index are bucketed by key, so firing an event
+        only touches the listeners of the matching bucket.
+
+        This method must be run in the event loop.
+        """
+        job: _KeyedJobType[_DataT] = HassJob(
+            listener, f"listen {event_type} {index.name} {keys}", job_type=job_type
+        )
+        indexes = self._keyed_listeners.setdefault(event_type, {})
+        if (buckets := indexes.get(index)) is None:
+            buckets = indexes[index] = defaultdict(list)
+
+        if isinstance(keys, str):
+            # Almost all listeners use a single key so we optimize for
+            # that case.
+            buckets[keys].append(job)
+            keys = (keys,)
+        else:
+            keys = tuple(keys)
+            for key in keys:
+                buckets[key].append(job)
+
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, index, keys, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        index: EventKeyIndex[_DataT],
+        keys: Iterable[str],
+        job: _KeyedJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            indexes = self._keyed_listeners[event_type]
+            buckets = indexes[index]
+            for key in keys:
+                buckets[key].remove(job)
+                if not buckets[key]:
+                    del buckets[key]
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed job listener %s", job)
+            return
+
+        if not buckets:
+            del indexes[index]
+            if not indexes:
+                del self._keyed_listeners[event_type]
+
     @callback
     def _async_remove_listener(
         self,
@@ -1743,6 +1953,34 @@ class EventBus:
             )
 
 
+# Attributes whose values come from a small set shared by the states of
+# many entities, such as the members of the device and state class enums.
+_SHARED_ATTRIBUTES = (ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT, "state_class")
+# The shared values are kept in a bounded dict rather than interned since
+# interned strings are never freed.
+_MAX_SHARED_ATTRIBUTE_VALUES = 256
+_SHARED_ATTRIBUTE_VALUES: dict[str, str] = {}
+
+
+def _shared_attribute_values(
+    attributes: Mapping[str, Any],
+) -> dict[str, str] | None:
+    """Return the attribute values to replace with an equal shared string."""
+    shared: dict[str, str] | None = None
+    for key in _SHARED_ATTRIBUTES:
+        # Enum members are already shared
+        if type(value := attributes.get(key)) is not str:
+            continue
+        if (shared_value := _SHARED_ATTRIBUTE_VALUES.get(value)) is None:
+            if len(_SHARED_ATTRIBUTE_VALUES) < _MAX_SHARED_ATTRIBUTE_VALUES:
+                _SHARED_ATTRIBUTE_VALUES[value] = value
+        elif shared_value is not value:
+            if shared is None:
+                shared = {}
+            shared[key] = shared_value
+    return shared
+
+
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
 
@@ -1813,7 +2051,10 @@ class State:
         # there is no need to check for subclassing with
         # isinstance here so we can use the faster type check.
         if type(attributes) is not ReadOnlyDict:
-            self.attributes = ReadOnlyDict(attributes or {})
+            if attributes and (shared := _shared_attribute_values(attributes)):
+                self.attributes = ReadOnlyDict(attributes, **shared)
+            else:
+                self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
         self.last_reported = last_reported or dt_util.utcnow()
@@ -1910,10 +2151,22 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @under_cached_property
+    def _attributes_json(self) -> bytes:
+        """Return a JSON string of the attributes.
+
+        The state machine passes this on to the next state of the
+        entity if the attributes did not change so they are only
+        serialized once.
+        """
+        return json_bytes(self.attributes)
+
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": json_fragment(self._attributes_json)}
+        )
 
     @under_cached_property
     def json_fragment(self) -> json_fragment:
@@ -1956,7 +2209,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        return json_bytes(
+            {
+                self.entity_id: {
+                    **self.as_compressed_state,
+                    COMPRESSED_STATE_ATTRIBUTES: json_fragment(self._attributes_json),
+                }
+            }
+        )[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2283,6 +2543,100 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities, add entities if they do not exist.
+
+        states is an iterable of (entity_id, state, attributes) tuples.
+
+        All states are written with the same timestamp and context and the
+        state changed events are fired once all states have been written, so
+        listeners see the result of the whole batch.
+
+        This method must be run in the event loop.
+        """
+        self.async_set_many_internal(
+            [
+                (
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    None,
+                    None,
+                )
+                for entity_id, new_state, attributes in states
+            ],
+            context,
+            timestamp or time.time(),
+        )
+
+    @callback
+    def async_set_many_internal(
+        self,
+        states: Iterable[
+            tuple[str, str, Mapping[str, Any], bool, Context | None, StateInfo | None]
+        ],
+        context: Context | None,
+        timestamp: float,
+    ) -> None:
+        """Set the state of multiple entities.
+
+        states is an iterable of (entity_id, state, attributes,
+        force_update, context, state_info) tuples. States without
+        a context share the context passed in.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        now = dt_util.utc_from_timestamp(timestamp)
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        events: list[tuple[EventType[Any], Mapping[str, Any], Context]] = []
+        try:
+            for (
+                entity_id,
+                new_state,
+                attributes,
+                force_update,
+                state_context,
+                state_info,
+            ) in states:
+                state_context = state_context or context
+                events.append(
+                    (
+                        *self._async_update_state(
+                            entity_id,
+                            new_state,
+                            attributes,
+                            force_update,
+                            state_context,
+                            state_info,
+                            timestamp,
+                            now,
+                        ),
+                        state_context,
+                    )
+                )
+        finally:
+            # Always fire the events for the states that
+            # have been written, even if a later state is invalid.
+            fire = self._bus.async_fire_internal
+            for event_type, event_data, event_context in events:
+                fire(
+                    event_type, event_data, context=event_context, time_fired=timestamp
+                )
+
     @callback
     def async_set_internal(
         self,
@@ -2303,6 +2657,52 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        # It is much faster to convert a timestamp to a utc datetime object
+        # than converting a utc datetime object to a timestamp since cpython
+        # does not have a fast path for handling the UTC timezone and has to do
+        # multiple local timezone conversions.
+        #
+        # from_timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+        #
+        # timestamp implementation:
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        now = dt_util.utc_from_timestamp(timestamp)
+
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        event_type, event_data = self._async_update_state(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+            now,
+        )
+        self._bus.async_fire_internal(
+            event_type, event_data, context=context, time_fired=timestamp
+        )
+
+    @callback
+    def _async_update_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context,
+        state_info: StateInfo | None,
+        timestamp: float,
+        now: datetime.datetime,
+    ) -> tuple[EventType[Any], Mapping[str, Any]]:
+        """Write the state of an entity to the state machine.
+
+        Returns the event type and event data that must be fired.
+        """
         # Most cases the key will be in the dict
         # so we optimize for the happy path as
         # python 3.11+ has near zero overhead for
@@ -2320,43 +2720,25 @@ class StateMachine:
             same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
-
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
-
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
+            return (
                 EVENT_STATE_REPORTED,
                 {
                     "entity_id": entity_id,
                     "old_last_reported": old_last_reported,
                     "new_state": old_state,
                 },
-                context=context,
-                time_fired=timestamp,
             )
-            return
 
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
+            # Reuse the attributes of the old state, they are immutable
             attributes = old_state.attributes
 
         # This is intentionally called with positional only arguments for performance
@@ -2374,6 +2756,10 @@ class StateMachine:
             timestamp,
         )
         if old_state is not None:
+            if same_attr and (
+                attributes_json := old_state._cache.get("_attributes_json")  # noqa: SLF001
+            ):
+                state._cache["_attributes_json"] = attributes_json  # noqa: SLF001
             old_state.expire()
         self._states[entity_id] = state
         state_changed_data: EventStateChangedData = {
@@ -2381,12 +2767,7 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
+        return EVENT_STATE_CHANGED, state_changed_data
 
 
 class SupportsResponse(enum.StrEnum):
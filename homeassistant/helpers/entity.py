@@ -48,6 +48,7 @@ from homeassistant.core import (
     callback,
     get_hassjob_callable_job_type,
     get_release_channel,
+    validate_state,
 )
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -70,6 +71,8 @@ from .typing import UNDEFINED, StateType, UndefinedType
 timer = time.time
 
 if TYPE_CHECKING:
+    from homeassistant.util.unit_system import UnitSystem
+
     from .entity_platform import EntityPlatform
 
 _LOGGER = logging.getLogger(__name__)
@@ -196,6 +199,41 @@ def get_unit_of_measurement(hass: HomeAssistant, entity_id: str) -> str | None:
     return entry.unit_of_measurement
 
 
+@callback
+def async_write_ha_states(hass: HomeAssistant, entities: Iterable[Entity]) -> None:
+    """Write the state of multiple entities to the state machine in one batch.
+
+    All states are written with the same timestamp and the state changed
+    events are fired once all states have been written.
+    """
+    if hass.loop_thread_id != threading.get_ident():
+        report_non_thread_safe_operation("async_write_ha_states")
+
+    states: list[
+        tuple[str, str, Mapping[str, Any], bool, Context | None, StateInfo | None]
+    ] = []
+    timestamp = 0.0
+    for entity in entities:
+        if not entity.hass or not entity._verified_state_writable:  # noqa: SLF001
+            entity._async_verify_state_writable()  # noqa: SLF001
+        if (calculated := entity._async_calculate_state_write()) is None:  # noqa: SLF001
+            continue
+        entity_id, state, attr, force_update, context, state_info, timestamp = (
+            calculated
+        )
+        try:
+            validate_state(state)
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+            )
+            state, attr, state_info = STATE_UNKNOWN, {}, None
+        states.append((entity_id, state, attr, force_update, context, state_info))
+
+    if states:
+        hass.states.async_set_many_internal(states, None, timestamp)
+
+
 ENTITY_CATEGORIES_SCHEMA: Final = vol.Coerce(EntityCategory)
 
 
@@ -278,6 +316,8 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - If the instance has a _changed_cached_properties set, the _attr_-property
+      setter and deleter add the name of the property to it
     """
 
     def __new__(
@@ -324,6 +364,9 @@ class CachedProperties(type):
                 o.__dict__.pop(name, None)
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
+                changed = o.__dict__.get("_changed_cached_properties")
+                if changed is not None:
+                    changed.add(name)
 
             return _deleter
 
@@ -342,6 +385,9 @@ class CachedProperties(type):
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                changed = o.__dict__.get("_changed_cached_properties")
+                if changed is not None:
+                    changed.add(name)
 
             return _setter
 
@@ -425,6 +471,84 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "unit_of_measurement",
 }
 
+# Properties read when calculating the attributes of an entity
+_ATTRIBUTE_PROPERTIES = (
+    "assumed_state",
+    "attribution",
+    "available",
+    "capability_attributes",
+    "device_class",
+    "entity_picture",
+    "extra_state_attributes",
+    "has_entity_name",
+    "icon",
+    "name",
+    "state_attributes",
+    "supported_features",
+    "unit_of_measurement",
+    "use_device_name",
+)
+# Attribute properties returning mappings, which entities may modify in place
+_MAPPING_ATTRIBUTE_PROPERTIES = (
+    "capability_attributes",
+    "extra_state_attributes",
+    "state_attributes",
+)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _CachedAttributes:
+    """Attributes calculated at a state write, which can be reused."""
+
+    registry_entry: er.RegistryEntry | None
+    device_entry: dr.DeviceEntry | None
+    units: UnitSystem
+    # The cached properties the attributes were calculated from
+    dependencies: frozenset[str]
+    # Copies of the mappings returned by cached mapping properties
+    mappings: tuple[tuple[str, dict[str, Any] | None], ...]
+    attributes: dict[str, Any]
+    capability_attributes: Mapping[str, Any] | None
+    original_device_class: str | None
+    supported_features: int | None
+
+
+def _attribute_dependencies(
+    cls: type[Entity],
+) -> tuple[frozenset[str], tuple[str, ...]] | None:
+    """Return the cached properties the attributes of an entity class depend on.
+
+    Returns the cached properties and the cached mapping properties, or None if
+    the attributes depend on a property which is not cached. A property which is
+    not cached is accepted if the class defining it lists the cached properties
+    it is derived from in _derived_attribute_properties.
+    """
+    friendly_name_internal = Entity._friendly_name_internal  # noqa: SLF001
+    if cls._friendly_name_internal is not friendly_name_internal:
+        return None
+    dependencies: set[str] = set()
+    resolved: set[str] = set()
+    unresolved = list(_ATTRIBUTE_PROPERTIES)
+    while unresolved:
+        if (name := unresolved.pop()) in resolved:
+            continue
+        resolved.add(name)
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                break
+        else:
+            return None
+        if isinstance(klass.__dict__[name], cached_property):
+            dependencies.add(name)
+            continue
+        derived = klass.__dict__.get("_derived_attribute_properties", {})
+        if (sources := derived.get(name)) is None:
+            return None
+        unresolved.extend(sources)
+    return frozenset(dependencies), tuple(
+        name for name in _MAPPING_ATTRIBUTE_PROPERTIES if name in dependencies
+    )
+
 
 class Entity(
     metaclass=ABCCachedProperties, cached_properties=CACHED_PROPERTIES_WITH_ATTR_
@@ -521,6 +645,18 @@ class Entity(
     __capabilities_updated_at_reported: bool = False
     __remove_future: asyncio.Future[None] | None = None
 
+    # Properties which are not cached, but only derived from the listed cached
+    # properties and the entity and device registry entries. Set by base
+    # components, e.g. sensor, to allow reusing the attributes of their entities.
+    _derived_attribute_properties: Mapping[str, tuple[str, ...]] = {}
+    # The cached properties the attributes depend on, set on each class the
+    # first time the attributes of one of its entities are cached
+    __attribute_dependencies: tuple[frozenset[str], tuple[str, ...]] | None
+    # The attributes calculated at the last state write and the cached
+    # properties which changed since then
+    __cached_attributes: _CachedAttributes | None = None
+    _changed_cached_properties: set[str] | None = None
+
     # Entity Properties
     _attr_assumed_state: bool = False
     _attr_attribution: str | None = None
@@ -1105,9 +1241,37 @@ class Entity(
     @callback
     def _async_write_ha_state(self) -> None:
         """Write the state to the state machine."""
+        if (calculated := self._async_calculate_state_write()) is None:
+            return
+
+        entity_id, state, attr, force_update, context, state_info, time_now = calculated
+        hass = self.hass
+        try:
+            hass.states.async_set_internal(
+                entity_id, state, attr, force_update, context, state_info, time_now
+            )
+        except InvalidStateError:
+            _LOGGER.exception(
+                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
+            )
+            hass.states.async_set(entity_id, STATE_UNKNOWN, {}, force_update, context)
+
+    @callback
+    def _async_calculate_state_write(
+        self,
+    ) -> (
+        tuple[str, str, dict[str, Any], bool, Context | None, StateInfo | None, float]
+        | None
+    ):
+        """Calculate the state to write to the state machine.
+
+        Returns a tuple of entity_id, state, attributes, force_update, context,
+        state_info and the time the state was calculated, or None if the state
+        should not be written.
+        """
         if self._platform_state is EntityPlatformState.REMOVED:
             # Polling returned after the entity has already been removed
-            return
+            return None
 
         hass = self.hass
         entity_id = self.entity_id
@@ -1123,12 +1287,24 @@ class Entity(
                     entity_id,
                     self.platform.platform_name,
                 )
-            return
+            return None
 
         state_calculate_start = timer()
-        state, attr, capabilities, original_device_class, supported_features = (
-            self.__async_calculate_state()
-        )
+        if (
+            cached := self.__cached_attributes
+        ) is not None and self.__async_cached_attributes_valid(cached, entry):
+            state = self._stringify_state(self.available)
+            attr = cached.attributes
+            capabilities = cached.capability_attributes
+            original_device_class = cached.original_device_class
+            supported_features = cached.supported_features
+        else:
+            state, attr, capabilities, original_device_class, supported_features = (
+                self.__async_calculate_state()
+            )
+            self.__async_cache_attributes(
+                entry, attr, capabilities, original_device_class, supported_features
+            )
         time_now = timer()
 
         if entry:
@@ -1195,8 +1371,9 @@ class Entity(
             pass
         else:
             # Overwrite properties that have been set in the config file.
+            # The attributes may be cached, so they are not updated in place.
             if custom := customize.get(entity_id):
-                attr.update(custom)
+                attr = attr | custom
 
         if (
             self._context_set is not None
@@ -1205,23 +1382,74 @@ class Entity(
             self._context = None
             self._context_set = None
 
+        return (
+            entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+            time_now,
+        )
+
+    def __async_cached_attributes_valid(
+        self, cached: _CachedAttributes, entry: er.RegistryEntry | None
+    ) -> bool:
+        """Return if the cached attributes can be reused."""
+        if (
+            cached.registry_entry is not entry
+            or cached.device_entry is not self.device_entry
+            or cached.units is not self.hass.config.units
+        ):
+            return False
+        if changed := self._changed_cached_properties:
+            unchanged = cached.dependencies.isdisjoint(changed)
+            changed.clear()
+            if not unchanged:
+                return False
+        # Mappings returned by cached properties may be modified in place
+        for name, value in cached.mappings:
+            if getattr(self, name) != value:
+                return False
+        return True
+
+    def __async_cache_attributes(
+        self,
+        entry: er.RegistryEntry | None,
+        attr: dict[str, Any],
+        capabilities: Mapping[str, Any] | None,
+        original_device_class: str | None,
+        supported_features: int | None,
+    ) -> None:
+        """Cache the attributes until a property they depend on changes."""
+        cls = type(self)
         try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
-        except InvalidStateError:
-            _LOGGER.exception(
-                "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
-            )
-            hass.states.async_set(
-                entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
-            )
+            resolved = cls.__dict__["_Entity__attribute_dependencies"]
+        except KeyError:
+            resolved = _attribute_dependencies(cls)
+            cls.__attribute_dependencies = resolved
+        if resolved is None:
+            return
+        dependencies, mapping_properties = resolved
+        if (changed := self._changed_cached_properties) is None:
+            self._changed_cached_properties = set()
+        else:
+            changed.clear()
+        mappings: list[tuple[str, dict[str, Any] | None]] = []
+        for name in mapping_properties:
+            value = getattr(self, name)
+            mappings.append((name, None if value is None else dict(value)))
+        self.__cached_attributes = _CachedAttributes(
+            entry,
+            self.device_entry,
+            self.hass.config.units,
+            dependencies,
+            tuple(mappings),
+            attr,
+            capabilities,
+            original_device_class,
+            supported_features,
+        )
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
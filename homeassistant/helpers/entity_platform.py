@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
+from functools import partial
 from logging import Logger, getLogger
 from typing import TYPE_CHECKING, Any, Protocol
 
@@ -44,9 +45,11 @@ from . import (
     service,
     translation,
 )
+from .entity import async_write_ha_states
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .refresh_scheduler import RefreshStats, async_get_refresh_scheduler, refresh_host
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -67,6 +70,9 @@ DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]]
     HassKey("domain_platform_entities")
 )
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+# With adaptive polling the poll interval of an entity doubles after
+# its state did not change for this many polls
+ADAPTIVE_POLLING_UNCHANGED_POLLS = 3
 
 _LOGGER = getLogger(__name__)
 
@@ -146,6 +152,8 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._polling_stats: RefreshStats | None = None
+        self._polling_scheduled_at = 0.0
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -153,6 +161,15 @@ class EntityPlatform:
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
 
+        # Platforms opt in to adaptive polling by setting MAX_SCAN_INTERVAL
+        max_scan_interval = getattr(platform, "MAX_SCAN_INTERVAL", None)
+        self._max_poll_multiplier = (
+            max(int(max_scan_interval / scan_interval), 1)
+            if isinstance(max_scan_interval, timedelta) and scan_interval
+            else 1
+        )
+        self._adaptive_polls: dict[str, _AdaptivePoll] = {}
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -659,32 +676,68 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+        self._async_schedule_polling()
+
+    @property
+    def _polling_key(self) -> str:
+        """Return the key of the platform in the refresh scheduler."""
+        if self.config_entry:
+            return (
+                f"{self.domain}.{self.platform_name}.{self.config_entry.entry_id}"
+            )
+        return f"{self.domain}.{self.platform_name}"
+
+    @callback
+    def _async_schedule_polling(self) -> None:
+        """Schedule the next poll at the slot of this platform."""
+        loop = self.hass.loop
+        scheduler = async_get_refresh_scheduler(self.hass)
+        if (stats := self._polling_stats) is None:
+            stats = self._polling_stats = scheduler.async_add(self._polling_key)
+        scheduled_at = self._polling_scheduled_at = scheduler.async_next_refresh(
+            stats, self.scan_interval_seconds
+        )
+        self._async_polling_timer = loop.call_later(
+            scheduled_at - loop.time(),
             self._async_handle_interval_callback,
         )
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
+        if TYPE_CHECKING:
+            assert self._polling_stats is not None
+        # The next poll is scheduled once this one starts so polls waiting
+        # for their turn to poll the host do not pile up
+        update = async_get_refresh_scheduler(self.hass).async_run(
+            self._polling_stats,
+            refresh_host(self.config_entry),
+            self._polling_scheduled_at,
+            self._async_update_entity_states,
+            partial(self._async_polling_started, self._async_polling_timer),
         )
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
-                self._async_update_entity_states(),
+                update,
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
         else:
             self.hass.async_create_background_task(
-                self._async_update_entity_states(),
+                update,
                 name=f"EntityPlatform poll {self.domain}.{self.platform_name}",
                 eager_start=True,
             )
 
+    @callback
+    def _async_polling_started(self, timer: asyncio.TimerHandle | None) -> None:
+        """Schedule the next poll once the current one started."""
+        # Polling may have stopped, or been scheduled again, while
+        # the poll was waiting for its turn
+        if self._async_polling_timer is timer:
+            self._async_schedule_polling()
+
     def _entity_id_already_exists(self, entity_id: str) -> tuple[bool, bool]:
         """Check if an entity_id already exists.
 
@@ -908,6 +961,7 @@ class EntityPlatform:
             del self.entities[entity_id]
             del self.domain_entities[entity_id]
             del self.domain_platform_entities[entity_id]
+            self._adaptive_polls.pop(entity_id, None)
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -944,6 +998,9 @@ class EntityPlatform:
         if self._async_polling_timer is not None:
             self._async_polling_timer.cancel()
             self._async_polling_timer = None
+        if self._polling_stats is not None:
+            async_get_refresh_scheduler(self.hass).async_remove(self._polling_stats)
+            self._polling_stats = None
 
     @callback
     def async_prepare(self) -> None:
@@ -1011,6 +1068,18 @@ class EntityPlatform:
             supports_response=supports_response,
         )
 
+    @callback
+    def async_write_ha_states(self, entities: Iterable[Entity] | None = None) -> None:
+        """Write the state of multiple entities of the platform in one batch.
+
+        Writes all entities of the platform if no entities are passed.
+
+        This method must be run in the event loop.
+        """
+        async_write_ha_states(
+            self.hass, self.entities.values() if entities is None else entities
+        )
+
     async def _async_update_entity_states(self) -> None:
         """Update the states of all the polling entities.
 
@@ -1031,6 +1100,10 @@ class EntityPlatform:
             return
 
         async with self._process_updates:
+            if self._max_poll_multiplier > 1:
+                await self._async_update_adaptive_entity_states()
+                return
+
             if self._update_in_sequence or len(self.entities) <= 1:
                 # If we know we will update sequentially, we want to avoid scheduling
                 # the coroutines as tasks that will wait on the semaphore lock.
@@ -1051,6 +1124,78 @@ class EntityPlatform:
             ]:
                 await asyncio.gather(*tasks)
 
+    async def _async_update_adaptive_entity_states(self) -> None:
+        """Update the polling entities which are due with adaptive polling."""
+        due: list[Entity] = []
+        for entity in self.entities.values():
+            if not entity.should_poll:
+                continue
+            if (poll := self._adaptive_polls.get(entity.entity_id)) is None:
+                poll = self._adaptive_polls[entity.entity_id] = _AdaptivePoll()
+            if poll.skip:
+                poll.skip -= 1
+            else:
+                due.append(entity)
+
+        if self._update_in_sequence or len(due) <= 1:
+            for entity in due:
+                # The entity may have been removed while updating the previous one
+                if entity.hass:
+                    await self._async_update_adaptive_entity_state(entity)
+            return
+
+        await asyncio.gather(
+            *(
+                create_eager_task(
+                    self._async_update_adaptive_entity_state(entity),
+                    loop=self.hass.loop,
+                )
+                for entity in due
+            )
+        )
+
+    async def _async_update_adaptive_entity_state(self, entity: Entity) -> None:
+        """Update an entity and adapt its poll interval to its changes."""
+        entity_id = entity.entity_id
+        states = self.hass.states
+        old_state = states.get(entity_id)
+        await entity.async_update_ha_state(True)
+        if (poll := self._adaptive_polls.get(entity_id)) is None:
+            return
+        # Writing an unchanged state keeps the same State object
+        if states.get(entity_id) is not old_state:
+            poll.multiplier = 1
+            poll.unchanged = 0
+        else:
+            poll.unchanged += 1
+            if poll.unchanged >= ADAPTIVE_POLLING_UNCHANGED_POLLS:
+                poll.unchanged = 0
+                poll.multiplier = min(poll.multiplier * 2, self._max_poll_multiplier)
+        poll.skip = poll.multiplier - 1
+
+    @callback
+    def async_get_polling_intervals(self) -> dict[str, float]:
+        """Return the effective poll interval in seconds by entity_id.
+
+        Only entities polled with adaptive polling are included.
+        """
+        return {
+            entity_id: poll.multiplier * self.scan_interval_seconds
+            for entity_id, poll in self._adaptive_polls.items()
+        }
+
+
+class _AdaptivePoll:
+    """Adaptive polling state of an entity."""
+
+    __slots__ = ("multiplier", "skip", "unchanged")
+
+    def __init__(self) -> None:
+        """Initialize the state."""
+        self.multiplier = 1
+        self.skip = 0
+        self.unchanged = 0
+
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
     "current_platform", default=None
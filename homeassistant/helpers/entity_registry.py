@@ -713,6 +713,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1261,6 +1262,18 @@ class EntityRegistry(BaseRegistry):
         data = await self._store.async_load()
         entities = EntityRegistryItems()
         deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
+        # Entries share many values, such as the platform, config entry
+        # and device ids and the timestamps of migrated entries. Parse
+        # each value once and share it to cut load time and memory.
+        datetimes: dict[str, datetime] = {}
+        strings: dict[str | None, str | None] = {}
+
+        def parse_datetime(value: str) -> datetime:
+            if (parsed := datetimes.get(value)) is None:
+                parsed = datetimes[value] = datetime.fromisoformat(value)
+            return parsed
+
+        share = strings.setdefault
 
         if data is not None:
             for entity in data["entities"]:
@@ -1291,13 +1304,15 @@ class EntityRegistry(BaseRegistry):
 
                 entities[entity["entity_id"]] = RegistryEntry(
                     aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
+                    area_id=share(entity["area_id"], entity["area_id"]),
                     categories=entity["categories"],
                     capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
+                    config_entry_id=share(
+                        entity["config_entry_id"], entity["config_entry_id"]
+                    ),
+                    created_at=parse_datetime(entity["created_at"]),
+                    device_class=share(entity["device_class"], entity["device_class"]),
+                    device_id=share(entity["device_id"], entity["device_id"]),
                     disabled_by=RegistryEntryDisabler(entity["disabled_by"])
                     if entity["disabled_by"]
                     else None,
@@ -1312,18 +1327,25 @@ class EntityRegistry(BaseRegistry):
                     id=entity["id"],
                     has_entity_name=entity["has_entity_name"],
                     labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
+                    modified_at=parse_datetime(entity["modified_at"]),
                     name=entity["name"],
                     options=entity["options"],
-                    original_device_class=entity["original_device_class"],
+                    original_device_class=share(
+                        entity["original_device_class"],
+                        entity["original_device_class"],
+                    ),
                     original_icon=entity["original_icon"],
                     original_name=entity["original_name"],
-                    platform=entity["platform"],
+                    platform=share(entity["platform"], entity["platform"]),
                     supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
+                    translation_key=share(
+                        entity["translation_key"], entity["translation_key"]
+                    ),
                     unique_id=entity["unique_id"],
                     previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
+                    unit_of_measurement=share(
+                        entity["unit_of_measurement"], entity["unit_of_measurement"]
+                    ),
                 )
             for entity in data["deleted_entities"]:
                 try:
@@ -1343,13 +1365,15 @@ class EntityRegistry(BaseRegistry):
                     entity["unique_id"],
                 )
                 deleted_entities[key] = DeletedRegistryEntry(
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
+                    config_entry_id=share(
+                        entity["config_entry_id"], entity["config_entry_id"]
+                    ),
+                    created_at=parse_datetime(entity["created_at"]),
                     entity_id=entity["entity_id"],
                     id=entity["id"],
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
+                    modified_at=parse_datetime(entity["modified_at"]),
                     orphaned_timestamp=entity["orphaned_timestamp"],
-                    platform=entity["platform"],
+                    platform=share(entity["platform"], entity["platform"]),
                     unique_id=entity["unique_id"],
                 )
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
 from dataclasses import dataclass
@@ -25,6 +24,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
+    EventKeyIndex,
     # Explicit reexport of 'EventStateChangedData' for backwards compatibility
     EventStateChangedData as EventStateChangedData,  # noqa: PLC0414
     EventStateEventData,
@@ -34,7 +34,6 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
-    split_entity_id,
 )
 from homeassistant.exceptions import TemplateError
 from homeassistant.loader import bind_hass
@@ -57,31 +56,16 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import TemplateVarsType
 
-_TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
-    "track_state_change_data"
-)
-_TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
-    "track_state_report_data"
-)
-_TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_added_domain_data")
-)
-_TRACK_STATE_REMOVED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
-    HassKey("track_state_removed_domain_data")
-)
-_TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventEntityRegistryUpdatedData]
-] = HassKey("track_entity_registry_updated_data")
-_TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
-    _KeyedEventData[EventDeviceRegistryUpdatedData]
-] = HassKey("track_device_registry_updated_data")
-
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
 
 _LOGGER = logging.getLogger(__name__)
 
+_TEMPLATE_RENDER_SCHEDULER: HassKey[_TemplateRenderScheduler] = HassKey(
+    "template_render_scheduler"
+)
+
 # Used to spread async_track_utc_time_change listeners and DataUpdateCoordinator
 # refresh cycles between RANDOM_MICROSECOND_MIN..RANDOM_MICROSECOND_MAX.
 # The values have been determined experimentally in production testing, background
@@ -90,39 +74,14 @@ RANDOM_MICROSECOND_MIN = 50000
 RANDOM_MICROSECOND_MAX = 500000
 
 _TypedDictT = TypeVar("_TypedDictT", bound=Mapping[str, Any])
-_StateEventDataT = TypeVar("_StateEventDataT", bound=EventStateEventData)
 
 
 @dataclass(slots=True, frozen=True)
 class _KeyedEventTracker(Generic[_TypedDictT]):
     """Class to track events by key."""
 
-    key: HassKey[_KeyedEventData[_TypedDictT]]
     event_type: EventType[_TypedDictT] | str
-    dispatcher_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            Event[_TypedDictT],
-        ],
-        None,
-    ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
-
-
-@dataclass(slots=True, frozen=True)
-class _KeyedEventData(Generic[_TypedDictT]):
-    """Class to track data for events by key."""
-
-    listener: CALLBACK_TYPE
-    callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    index: EventKeyIndex[_TypedDictT]
 
 
 @dataclass(slots=True)
@@ -329,50 +288,15 @@ def async_track_state_change_event(
 
 
 @callback
-def _async_dispatch_entity_id_event_soon(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners soon to ensure one event loop runs before dispatch."""
-    hass.loop.call_soon(_async_dispatch_entity_id_event, hass, callbacks, event)
-
-
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event: Event[_StateEventDataT],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
+def _async_entity_id_key(event_data: EventStateEventData) -> str:
+    """Return the key of state events."""
+    return event_data["entity_id"]
 
 
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
-    key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    # Dispatch soon to ensure one event loop runs before dispatch
+    index=EventKeyIndex("entity_id", _async_entity_id_key, dispatch_soon=True),
 )
 
 
@@ -389,11 +313,17 @@ def _async_track_state_change_event(
     )
 
 
+# Template trackers batch the state changes of an iteration of the event loop
+# themselves, so they are dispatched while the event is fired
+_KEYED_TRACK_TEMPLATE_STATE_CHANGE = _KeyedEventTracker(
+    event_type=EVENT_STATE_CHANGED,
+    index=EventKeyIndex("template_entity_id", _async_entity_id_key),
+)
+
+
 _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
-    key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
-    dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    index=EventKeyIndex("entity_id", _async_entity_id_key),
 )
 
 
@@ -414,24 +344,6 @@ def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
 
 
-@callback
-def _remove_listener(
-    hass: HomeAssistant,
-    tracker: _KeyedEventTracker[_TypedDictT],
-    keys: Iterable[str],
-    job: HassJob[[Event[_TypedDictT]], Any],
-    callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-) -> None:
-    """Remove listener."""
-    for key in keys:
-        callbacks[key].remove(job)
-        if not callbacks[key]:
-            del callbacks[key]
-
-    if not callbacks:
-        hass.data.pop(tracker.key).listener()
-
-
 # tracker, not hass is intentionally the first argument here since its
 # constant and may be used in a partial in the future
 def _async_track_event(
@@ -443,82 +355,29 @@ def _async_track_event(
 ) -> CALLBACK_TYPE:
     """Track an event by a specific key.
 
+    The event bus keeps the listeners bucketed by key so firing an
+    event only dispatches to the listeners of the matching key.
+
     This function is intended for internal use only.
     """
     if not keys:
         return _remove_empty_listener
-
-    hass_data = hass.data
-    tracker_key = tracker.key
-    if tracker_key in hass_data:
-        event_data = hass_data[tracker_key]
-        callbacks = event_data.callbacks
-    else:
-        callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
-        hass_data[tracker_key] = event_data
-
-    job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
-
-    if isinstance(keys, str):
-        # Almost all calls to this function use a single key
-        # so we optimize for that case. We don't use setdefault
-        # here because this function gets called ~20000 times
-        # during startup, and we want to avoid the overhead of
-        # creating empty lists and throwing them away.
-        callbacks[keys].append(job)
-        keys = (keys,)
-    else:
-        for key in keys:
-            callbacks[key].append(job)
-
-    return partial(_remove_listener, hass, tracker, keys, job, callbacks)
-
-
-@callback
-def _async_dispatch_old_entity_id_or_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
-    event: Event[EventEntityRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (
-        callbacks_list := callbacks.get(  # type: ignore[call-overload]  # mypy bug?
-            event.data.get("old_entity_id", event.data["entity_id"])
-        )
-    ):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data.get("old_entity_id", event.data["entity_id"]),
-                job,
-            )
+    return hass.bus.async_listen_keyed(
+        tracker.event_type, tracker.index, keys, action, job_type
+    )
 
 
 @callback
-def _async_entity_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventEntityRegistryUpdatedData]], Any]]],
+def _async_old_entity_id_or_entity_id_key(
     event_data: EventEntityRegistryUpdatedData,
-) -> bool:
-    """Filter entity registry updates by entity_id."""
-    return event_data.get("old_entity_id", event_data["entity_id"]) in callbacks
+) -> str:
+    """Return the key of entity registry updated events."""
+    return event_data.get("old_entity_id", event_data["entity_id"])  # type: ignore[return-value]
 
 
 _KEYED_TRACK_ENTITY_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_ENTITY_REGISTRY_UPDATED_DATA,
     event_type=EVENT_ENTITY_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_old_entity_id_or_entity_id_event,
-    filter_callable=_async_entity_registry_updated_filter,
+    index=EventKeyIndex("entity_id", _async_old_entity_id_or_entity_id_key),
 )
 
 
@@ -542,40 +401,14 @@ def async_track_entity_registry_updated_event(
 
 
 @callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
-@callback
-def _async_dispatch_device_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event: Event[EventDeviceRegistryUpdatedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["device_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["device_id"],
-                job,
-            )
+def _async_device_id_key(event_data: EventDeviceRegistryUpdatedData) -> str:
+    """Return the key of device registry updated events."""
+    return event_data["device_id"]
 
 
 _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
-    key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
-    dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    index=EventKeyIndex("device_id", _async_device_id_key),
 )
 
 
@@ -596,36 +429,13 @@ def async_track_device_registry_updated_event(
 
 
 @callback
-def _async_dispatch_domain_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event: Event[EventStateChangedData],
-) -> None:
-    """Dispatch domain event listeners."""
-    domain = split_entity_id(event.data["entity_id"])[0]
-    for job in callbacks.get(domain, []) + callbacks.get(MATCH_ALL, []):
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:
-            _LOGGER.exception(
-                "Error while processing event %s for domain %s", event, domain
-            )
-
-
-@callback
-def _async_domain_added_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["old_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If old_state is None, new_state must be set but
-        # mypy doesn't know that
-        event_data["new_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_added_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of added entities."""
+    if event_data["old_state"] is not None:
+        return None
+    # If old_state is None, new_state must be set but
+    # mypy doesn't know that
+    return event_data["new_state"].domain  # type: ignore[union-attr]
 
 
 @bind_hass
@@ -642,10 +452,8 @@ def async_track_state_added_domain(
 
 
 _KEYED_TRACK_STATE_ADDED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_ADDED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_added_filter,
+    index=EventKeyIndex("added_domain", _async_domain_added_key),
 )
 
 
@@ -663,26 +471,18 @@ def _async_track_state_added_domain(
 
 
 @callback
-def _async_domain_removed_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
-    event_data: EventStateChangedData,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["new_state"] is None and (
-        MATCH_ALL in callbacks
-        or
-        # If new_state is None, old_state must be set but
-        # mypy doesn't know that
-        event_data["old_state"].domain in callbacks  # type: ignore[union-attr]
-    )
+def _async_domain_removed_key(event_data: EventStateChangedData) -> str | None:
+    """Return the domain of removed entities."""
+    if event_data["new_state"] is not None:
+        return None
+    # If new_state is None, old_state must be set but
+    # mypy doesn't know that
+    return event_data["old_state"].domain  # type: ignore[union-attr]
 
 
 _KEYED_TRACK_STATE_REMOVED_DOMAIN = _KeyedEventTracker(
-    key=_TRACK_STATE_REMOVED_DOMAIN_DATA,
     event_type=EVENT_STATE_CHANGED,
-    dispatcher_callable=_async_dispatch_domain_event,
-    filter_callable=_async_domain_removed_filter,
+    index=EventKeyIndex("removed_domain", _async_domain_removed_key),
 )
 
 
@@ -715,10 +515,14 @@ class _TrackStateChangeFiltered:
         hass: HomeAssistant,
         track_states: TrackStates,
         action: Callable[[Event[EventStateChangedData]], Any],
+        entities_tracker: _KeyedEventTracker[
+            EventStateChangedData
+        ] = _KEYED_TRACK_STATE_CHANGE,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._action = action
+        self._entities_tracker = entities_tracker
         self._action_as_hassjob = HassJob(
             action, f"track state change filtered {track_states}"
         )
@@ -813,8 +617,12 @@ class _TrackStateChangeFiltered:
         if not entities:
             return
 
-        self._listeners[_ENTITIES_LISTENER] = _async_track_state_change_event(
-            self.hass, entities, self._action, self._action_as_hassjob.job_type
+        self._listeners[_ENTITIES_LISTENER] = _async_track_event(
+            self._entities_tracker,
+            self.hass,
+            entities,
+            self._action,
+            self._action_as_hassjob.job_type,
         )
 
     @callback
@@ -962,6 +770,109 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderScheduler:
+    """Batch template re-renders triggered by state changes.
+
+    Every TrackTemplateResultInfo hands the state_changed events it
+    receives to the scheduler instead of re-rendering right away. All
+    pending trackers are refreshed together on the next iteration of the
+    event loop, when the entity listeners of other trackers are dispatched,
+    so a tracker that is hit by several state changes in the same iteration
+    only re-renders once. Identical templates without variables are
+    rendered once per batch and shared between trackers until a state is
+    written.
+    """
+
+    __slots__ = ("_hass", "_pending", "_render_cache")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._pending: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        self._render_cache: (
+            dict[tuple[str, bool | None, bool | None], RenderInfo] | None
+        ) = None
+
+    @callback
+    def async_schedule(
+        self,
+        tracker: TrackTemplateResultInfo,
+        event: Event[EventStateChangedData],
+    ) -> None:
+        """Schedule a refresh of the tracker for a state change."""
+        if not self._pending:
+            self._hass.loop.call_soon(self._async_run)
+        if (events := self._pending.get(tracker)) is None:
+            self._pending[tracker] = [event]
+        else:
+            events.append(event)
+
+    @callback
+    def async_cancel(self, tracker: TrackTemplateResultInfo) -> None:
+        """Cancel a pending refresh of the tracker."""
+        self._pending.pop(tracker, None)
+
+    @callback
+    def async_render_to_info(
+        self, template: Template, variables: TemplateVarsType
+    ) -> RenderInfo:
+        """Render a template, reusing the render of an identical template."""
+        if (
+            (render_cache := self._render_cache) is None
+            or variables
+            or template._log_fn is not None  # noqa: SLF001
+        ):
+            return template.async_render_to_info(variables)
+        key = (
+            template.template,
+            template._limited,  # noqa: SLF001
+            template._strict,  # noqa: SLF001
+        )
+        if (info := render_cache.get(key)) is None:
+            info = render_cache[key] = template.async_render_to_info(variables)
+            return info
+        # Each tracker gets its own render info
+        return info._copy_for(template)  # noqa: SLF001
+
+    @callback
+    def _async_drop_render_cache(self, event: Event[EventStateChangedData]) -> None:
+        """Drop the shared renders since they may have read the old state."""
+        if self._render_cache:
+            self._render_cache.clear()
+
+    @callback
+    def _async_run(self) -> None:
+        """Refresh all trackers with pending state changes."""
+        pending = self._pending
+        self._pending = {}
+        self._render_cache = {}
+        # Only listen while rendering, for the states written by the actions
+        # of the trackers
+        remove_listener = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_drop_render_cache
+        )
+        try:
+            for tracker, events in pending.items():
+                tracker._refresh(events[-1], events=events)  # noqa: SLF001
+        finally:
+            remove_listener()
+            self._render_cache = None
+
+
+@callback
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> _TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    if (scheduler := hass.data.get(_TEMPLATE_RENDER_SCHEDULER)) is None:
+        scheduler = hass.data[_TEMPLATE_RENDER_SCHEDULER] = _TemplateRenderScheduler(
+            hass
+        )
+    return scheduler
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -998,6 +909,7 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._render_scheduler = _async_get_template_render_scheduler(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1054,9 +966,13 @@ class TrackTemplateResultInfo:
                 else:
                     log_fn(logging.ERROR, str(info.exception))
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+        self._track_state_changes = _TrackStateChangeFiltered(
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_schedule_refresh,
+            _KEYED_TRACK_TEMPLATE_STATE_CHANGE,
         )
+        self._track_state_changes.async_setup()
         self._update_time_listeners()
         _LOGGER.debug(
             (
@@ -1113,6 +1029,7 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._render_scheduler.async_cancel(self)
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1121,11 +1038,17 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _async_schedule_refresh(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a refresh of the templates for a state change."""
+        self._render_scheduler.async_schedule(self, event)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        events: Sequence[Event[EventStateChangedData]] = (),
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1142,7 +1065,7 @@ class TrackTemplateResultInfo:
         if event:
             info = self._info[template]
 
-            if not _event_triggers_rerender(event, info):
+            if not (event := _last_event_triggering_rerender(events, info)):
                 return False
 
             had_timer = self._rate_limit.async_has_timer(template)
@@ -1165,8 +1088,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._render_scheduler.async_render_to_info(
+            template, track_template_.variables
         )
 
         try:
@@ -1217,12 +1140,17 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        events: Sequence[Event[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
         The event is the state_changed event that caused the refresh
         to be considered.
 
+        events is an optional list of the state_changed events that were
+        batched together, ending with event. A template is re-rendered
+        once if any of them affects it.
+
         track_templates is an optional list of TrackTemplate objects
         to refresh.  If not provided, all tracked templates will be
         considered.
@@ -1238,10 +1166,14 @@ class TrackTemplateResultInfo:
         super_template = self._track_templates[0] if self._has_super_template else None
 
         track_templates = track_templates or self._track_templates
+        if events is None:
+            events = (event,) if event else ()
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, events
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1272,7 +1204,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, events
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1974,6 +1908,16 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+def _last_event_triggering_rerender(
+    events: Sequence[Event[EventStateChangedData]], info: RenderInfo
+) -> Event[EventStateChangedData] | None:
+    """Return the most recent event that requires a re-render."""
+    for event in reversed(events):
+        if _event_triggers_rerender(event, info):
+            return event
+    return None
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
@@ -0,0 +1,62 @@
+"""Index entities by the items they reference."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+
+from homeassistant.core import callback
+
+from .entity import Entity
+
+type ReferenceGetter[_EntityT: Entity] = Callable[
+    [_EntityT], Iterable[str] | str | None
+]
+
+
+class ReferenceIndex[_EntityT: Entity]:
+    """Index entities by the ids of the items they reference.
+
+    Entities are added to the index when they are added to Home Assistant
+    and removed when they are removed, so finding the entities referencing
+    an item is a dict lookup instead of checking the references of every
+    entity. The references of an entity must not change while it is added.
+    """
+
+    def __init__(self, references: Mapping[str, ReferenceGetter[_EntityT]]) -> None:
+        """Initialize the index with the getters of each kind of reference."""
+        self._references = references
+        # kind of reference -> referenced id -> entities, kept in insertion order
+        self._index: dict[str, dict[str, dict[_EntityT, None]]] = {
+            kind: {} for kind in references
+        }
+        self._indexed: dict[_EntityT, list[tuple[str, str]]] = {}
+
+    @callback
+    def async_add(self, entity: _EntityT) -> None:
+        """Add the references of an entity."""
+        indexed = self._indexed[entity] = []
+        for kind, getter in self._references.items():
+            if (referenced := getter(entity)) is None:
+                continue
+            if isinstance(referenced, str):
+                referenced = (referenced,)
+            index = self._index[kind]
+            for referenced_id in referenced:
+                index.setdefault(referenced_id, {})[entity] = None
+                indexed.append((kind, referenced_id))
+
+    @callback
+    def async_remove(self, entity: _EntityT) -> None:
+        """Remove the references of an entity."""
+        for kind, referenced_id in self._indexed.pop(entity, ()):
+            entities = self._index[kind][referenced_id]
+            entities.pop(entity, None)
+            if not entities:
+                del self._index[kind][referenced_id]
+
+    @callback
+    def async_referencing(self, kind: str, referenced_id: str) -> list[str]:
+        """Return the entity ids of the entities referencing an item."""
+        if (entities := self._index[kind].get(referenced_id)) is None:
+            return []
+        return [entity.entity_id for entity in entities]
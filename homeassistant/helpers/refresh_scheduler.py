@@ -0,0 +1,140 @@
+"""Coordinate scheduled refreshes of coordinators and polling platforms."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from weakref import WeakSet
+import zlib
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
+DATA_REFRESH_SCHEDULER: HassKey[RefreshScheduler] = HassKey("refresh_scheduler")
+
+# A refresh is never scheduled later than its interval. To move it to
+# its slot it is instead scheduled up to this fraction of the interval
+# early, so pollers converge on their slots within a few refreshes.
+MAX_SLOT_ADVANCE = 0.1
+
+MAX_CONCURRENT_REFRESHES_PER_HOST = 2
+
+
+@dataclass(slots=True, eq=False, weakref_slot=True)
+class RefreshStats:
+    """Statistics of the scheduled refreshes of a poller.
+
+    Pollers sharing a key share a slot, but each one has its own
+    statistics. The scheduler only keeps them as long as the poller
+    references them.
+    """
+
+    key: str
+    interval: float = 0.0
+    refreshes: int = 0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+
+
+class RefreshScheduler:
+    """Spread scheduled refreshes over their interval.
+
+    Each poller is assigned a deterministic slot within its interval
+    derived from its key, so pollers sharing an interval are spread over
+    it instead of firing together. Scheduled refreshes of pollers talking
+    to the same host are limited to a few at a time.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self.stats: WeakSet[RefreshStats] = WeakSet()
+
+    @callback
+    def async_add(self, key: str) -> RefreshStats:
+        """Add a poller and return its statistics."""
+        stats = RefreshStats(key)
+        self.stats.add(stats)
+        return stats
+
+    @callback
+    def async_remove(self, stats: RefreshStats) -> None:
+        """Forget the statistics of a poller that stopped polling."""
+        self.stats.discard(stats)
+
+    @callback
+    def async_next_refresh(self, stats: RefreshStats, interval: float) -> float:
+        """Return the loop time of the next refresh of a poller."""
+        stats.interval = interval
+        when = self._hass.loop.time() + interval
+        if interval < 1:
+            return when
+        # How far the next refresh is past the start of the key's slot
+        offset = zlib.crc32(stats.key.encode()) % int(interval)
+        past_slot = (when - offset) % interval
+        return when - min(past_slot, interval * MAX_SLOT_ADVANCE)
+
+    async def async_run(
+        self,
+        stats: RefreshStats,
+        host: str | None,
+        scheduled_at: float,
+        target: Callable[[], Awaitable[Any]],
+        started: Callable[[], None] | None = None,
+    ) -> None:
+        """Run a scheduled refresh and record its lag and duration.
+
+        The started callback is called once the refresh starts, after it
+        waited for its turn to refresh the host.
+        """
+        loop = self._hass.loop
+        if host is None:
+            start = loop.time()
+            if started is not None:
+                started()
+            await target()
+        else:
+            if (semaphore := self._host_semaphores.get(host)) is None:
+                semaphore = self._host_semaphores[host] = asyncio.Semaphore(
+                    MAX_CONCURRENT_REFRESHES_PER_HOST
+                )
+            async with semaphore:
+                start = loop.time()
+                if started is not None:
+                    started()
+                await target()
+        duration = loop.time() - start
+        lag = max(start - scheduled_at, 0.0)
+        stats.refreshes += 1
+        stats.last_duration = duration
+        stats.max_duration = max(stats.max_duration, duration)
+        stats.total_duration += duration
+        stats.last_lag = lag
+        stats.max_lag = max(stats.max_lag, lag)
+
+
+def refresh_host(config_entry: ConfigEntry | None) -> str | None:
+    """Return the host a config entry polls, if known."""
+    if config_entry is None:
+        return None
+    host = config_entry.data.get(CONF_HOST)
+    return host if isinstance(host, str) else None
+
+
+@callback
+@singleton(DATA_REFRESH_SCHEDULER)
+def async_get_refresh_scheduler(hass: HomeAssistant) -> RefreshScheduler:
+    """Return the refresh scheduler."""
+    return RefreshScheduler(hass)
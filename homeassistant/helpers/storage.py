@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from hashlib import blake2b
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
@@ -34,6 +35,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -49,6 +51,13 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# Keys identifying the dict items of a journaled list
+JOURNAL_ITEM_ID_KEYS = ("id", "entity_id")
+# The journal is compacted into the main file once it grows larger than
+# this or half the size of the main file, whichever is bigger.
+JOURNAL_COMPACT_MIN_SIZE = 64 * 1024
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -242,8 +251,22 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal enabled, saves append the changed top-level keys and
+        list items of the data to a journal file next to the main file
+        instead of rewriting it. List items are journaled by their id, which
+        is the id or entity_id of dict items and the value of other items;
+        lists with items lacking a unique id are journaled as a whole. The
+        journal is replayed when loading and compacted into the main file on
+        the first save after loading, when it grows too large and on the
+        final write. Items added by a replayed journal are put at the end of
+        their list.
+        """
+        if journal and encoder not in (None, JSONEncoder):
+            raise ValueError("Journal is only supported with the default encoder")
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,6 +282,17 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        # State of the main file and journal on disk, only used by the
+        # executor while holding the write lock.
+        self._journal_id: str | None = None
+        self._journal_compact = False
+        self._journal_header: tuple[Any, ...] = ()
+        self._journal_values: dict[str, bytes] = {}
+        self._journal_items: dict[str, dict[Any, tuple[str, Any]]] = {}
+        self._journal_digests: dict[int, tuple[Any, str, Any]] = {}
+        self._journal_size = 0
+        self._journal_max_size = 0
 
     @cached_property
     def path(self):
@@ -388,6 +422,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+        if self._journal and "journal_id" in data:
+            data = await self.hass.async_add_executor_job(self._replay_journal, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -518,6 +555,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        self._journal_compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -552,6 +590,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            self._write_journal_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -561,6 +603,156 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+    def _write_journal_data(self, path: str, data: dict) -> None:
+        """Append the changes to the journal or compact it into the main file."""
+        journal_path = f"{path}{JOURNAL_SUFFIX}"
+        stored = data["data"]
+        compact = (
+            self._journal_compact
+            or self._journal_id is None
+            or not isinstance(stored, Mapping)
+            or self._journal_header
+            != (data["version"], data["minor_version"], data["key"])
+            or self._journal_size > self._journal_max_size
+        )
+        self._journal_compact = False
+        try:
+            if not compact and self._append_journal_record(journal_path, stored):
+                return
+        except (TypeError, OSError) as err:
+            _LOGGER.debug("Unable to append to journal for %s: %s", self.key, err)
+
+        # Forget the on-disk state first so a failed write is retried in full
+        self._journal_id = None
+        journal_id = random_uuid_hex()
+        _LOGGER.debug("Compacting journal for %s into %s", self.key, path)
+        json_helper.save_json(
+            path,
+            {**data, "journal_id": journal_id},
+            self._private,
+            atomic_writes=self._atomic_writes,
+        )
+        with suppress(FileNotFoundError):
+            os.unlink(journal_path)
+        if not isinstance(stored, Mapping):
+            return
+        self._journal_values, self._journal_items = self._journal_snapshot(stored)
+        self._journal_header = (data["version"], data["minor_version"], data["key"])
+        self._journal_size = 0
+        self._journal_max_size = max(
+            JOURNAL_COMPACT_MIN_SIZE, os.path.getsize(path) // 2
+        )
+        self._journal_id = journal_id
+
+    def _journal_snapshot(
+        self, stored: Mapping[str, Any]
+    ) -> tuple[dict[str, bytes], dict[str, dict[Any, tuple[str, Any]]]]:
+        """Serialize the top-level values and digest the list items by id."""
+        values: dict[str, bytes] = {}
+        items: dict[str, dict[Any, tuple[str, Any]]] = {}
+        old_digests = self._journal_digests
+        digests: dict[int, tuple[Any, str, Any]] = {}
+        for key, value in stored.items():
+            if not isinstance(value, list) or (
+                key_items := _journal_list_items(value, old_digests, digests)
+            ) is None:
+                values[key] = json_helper.json_bytes(value)
+                continue
+            items[key] = key_items
+        self._journal_digests = digests
+        return values, items
+
+    def _append_journal_record(
+        self, journal_path: str, stored: Mapping[str, Any]
+    ) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if the changes can't be expressed as a journal record.
+        """
+        old_values = self._journal_values
+        old_items = self._journal_items
+        values, items = self._journal_snapshot(stored)
+        if values.keys() != old_values.keys() or items.keys() != old_items.keys():
+            # Top-level keys were added, removed or changed type
+            return False
+        changed_values = {
+            key: stored[key]
+            for key, value in values.items()
+            if old_values[key] != value
+        }
+        removed: dict[str, list[Any]] = {}
+        added: dict[str, list[Any]] = {}
+        for key, key_items in items.items():
+            old_key_items = old_items[key]
+            if gone := old_key_items.keys() - key_items.keys():
+                removed[key] = list(gone)
+            if new := [
+                item
+                for item_id, (digest, item) in key_items.items()
+                if (old := old_key_items.get(item_id)) is None or old[0] != digest
+            ]:
+                added[key] = new
+        if changed_values or removed or added:
+            record = json_helper.json_bytes(
+                {
+                    "journal_id": self._journal_id,
+                    "data": changed_values,
+                    "removed": removed,
+                    "added": added,
+                }
+            )
+            _LOGGER.debug("Appending %s bytes to %s", len(record) + 1, journal_path)
+            fd = os.open(
+                journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, record + b"\n")
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._journal_size += len(record) + 1
+        self._journal_values = values
+        self._journal_items = items
+        return True
+
+    def _replay_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Replay the journal written for the main file data."""
+        try:
+            with open(f"{self.path}{JOURNAL_SUFFIX}", "rb") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return data
+
+        journal_id = data["journal_id"]
+        stored = dict(data["data"])
+        lists: dict[str, dict[Any, Any]] = {}
+        for line in lines:
+            try:
+                record = json_util.json_loads_object(line)
+            except ValueError:
+                # An unclean shutdown can leave a partial last record
+                _LOGGER.warning("Ignoring incomplete journal record for %s", self.key)
+                break
+            if record["journal_id"] != journal_id:
+                # Left behind by an interrupted compaction
+                continue
+            stored.update(record["data"])
+            for key, item_ids in record["removed"].items():
+                key_items = _journal_list(lists, stored, key)
+                for item_id in item_ids:
+                    key_items.pop(item_id, None)
+            for key, added in record["added"].items():
+                key_items = _journal_list(lists, stored, key)
+                for item in added:
+                    # Replace changed items in place
+                    key_items[_journal_item_id(item)] = item
+
+        for key, key_items in lists.items():
+            stored[key] = list(key_items.values())
+        return {**data, "data": stored}
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +765,74 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            self._journal_id = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{JOURNAL_SUFFIX}"
+                )
+
+
+def _journal_digest(item: bytes) -> str:
+    """Return the digest identifying the content of a serialized list item."""
+    return blake2b(item, digest_size=12).hexdigest()
+
+
+def _journal_item_id(item: Any) -> Any:
+    """Return the id of a parsed list item, None if it has none."""
+    if isinstance(item, dict):
+        for key in JOURNAL_ITEM_ID_KEYS:
+            if isinstance(item_id := item.get(key), str):
+                return item_id
+        return None
+    if isinstance(item, list):
+        return None
+    return item
+
+
+def _journal_list_items(
+    value: list[Any],
+    old_digests: dict[int, tuple[Any, str, Any]],
+    digests: dict[int, tuple[Any, str, Any]],
+) -> dict[Any, tuple[str, Any]] | None:
+    """Return the digest and item of each list item by id.
+
+    Returns None if an item has no id or shares it with another item.
+    """
+    key_items: dict[Any, tuple[str, Any]] = {}
+    for item in value:
+        if isinstance(item, (dict, list)):
+            # Mutable items may have changed in place
+            digest = _journal_digest(json_helper.json_bytes(item))
+            item_id = _journal_item_id(item)
+        else:
+            # Registries keep the same json fragment for unchanged
+            # entries, so they only have to be digested once. The id
+            # is taken from the parsed item since it is what the
+            # journal is replayed on.
+            if (cached := old_digests.get(id(item))) is None or (
+                cached[0] is not item
+            ):
+                serialized = json_helper.json_bytes(item)
+                cached = (
+                    item,
+                    _journal_digest(serialized),
+                    _journal_item_id(json_util.json_loads(serialized)),
+                )
+            digests[id(item)] = cached
+            _, digest, item_id = cached
+        if item_id is None or item_id in key_items:
+            return None
+        key_items[item_id] = (digest, item)
+    return key_items
+
+
+def _journal_list(
+    lists: dict[str, dict[Any, Any]], stored: dict[str, Any], key: str
+) -> dict[Any, Any]:
+    """Return the list items of the key being replayed by id."""
+    if (key_items := lists.get(key)) is None:
+        key_items = lists[key] = {
+            _journal_item_id(item): item for item in stored.get(key, ())
+        }
+    return key_items
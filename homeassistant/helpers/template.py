@@ -159,6 +159,18 @@ CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
 
+#
+# Compiled template code is shared between all Template objects with the
+# same source and environment kind so config reloads, blueprints and the
+# websocket API do not have to parse and compile identical templates again.
+# Unlike the weak per-environment template_cache the LRU keeps the code
+# alive after the last Template using it has been garbage collected.
+#
+COMPILED_TEMPLATE_CACHE_SIZE = 2048
+COMPILED_TEMPLATE_LRU: LRU[tuple[str, str], CodeType] = LRU(
+    COMPILED_TEMPLATE_CACHE_SIZE
+)
+
 ORJSON_PASSTHROUGH_OPTIONS = (
     orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
 )
@@ -182,6 +194,17 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
     return template_state
 
 
+def compiled_template_cache_info() -> dict[str, int]:
+    """Return the size and hit rate of the compiled template cache."""
+    hits, misses = COMPILED_TEMPLATE_LRU.get_stats()
+    return {
+        "size": len(COMPILED_TEMPLATE_LRU),
+        "max_size": COMPILED_TEMPLATE_LRU.get_size(),
+        "hits": hits,
+        "misses": misses,
+    }
+
+
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
 
@@ -489,6 +512,24 @@ class RenderInfo:
         else:
             self.filter = _false
 
+    def _copy_for(self, template: Template) -> RenderInfo:
+        """Return a copy of the frozen render info for an identical template."""
+        info = RenderInfo(template)
+        info._result = self._result
+        info.exception = self.exception
+        info.all_states = self.all_states
+        info.all_states_lifecycle = self.all_states_lifecycle
+        info.domains = self.domains
+        info.domains_lifecycle = self.domains_lifecycle
+        info.entities = self.entities
+        info.rate_limit = self.rate_limit
+        info.has_time = self.has_time
+        if self.is_static:
+            info._freeze_static()
+        else:
+            info._freeze()
+        return info
+
 
 class Template:
     """Class to hold a template and manage caching and rendering."""
@@ -571,6 +612,14 @@ class Template:
             self._compiled_code = compiled
             return
 
+        # Templates without hass are deprecated and only use the weak cache
+        cache_key: tuple[str, str] | None = None
+        if self.hass is not None:
+            cache_key = (self.template, self._env_kind)
+            if compiled := COMPILED_TEMPLATE_LRU.get(cache_key):
+                self._compiled_code = compiled
+                return
+
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
@@ -578,6 +627,18 @@ class Template:
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
 
+        if cache_key is not None:
+            COMPILED_TEMPLATE_LRU[cache_key] = self._compiled_code
+
+    @property
+    def _env_kind(self) -> str:
+        """Return the kind of environment the template is compiled for."""
+        if self._limited:
+            return "limited"
+        if self._strict:
+            return "strict"
+        return "normal"
+
     def render(
         self,
         variables: TemplateVarsType = None,
@@ -6,6 +6,7 @@ from abc import abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from random import randint
 from time import monotonic
@@ -29,6 +30,7 @@ from homeassistant.util.dt import utcnow
 
 from . import entity, event
 from .debounce import Debouncer
+from .refresh_scheduler import RefreshStats, async_get_refresh_scheduler, refresh_host
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
@@ -86,6 +88,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self._refresh_key = (
+            f"{self.config_entry.domain}.{self.config_entry.entry_id}.{name}"
+            if self.config_entry
+            else name
+        )
+        self._refresh_stats: RefreshStats | None = None
+        self._refresh_scheduled_at = 0.0
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -171,6 +180,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Cancel any scheduled call, and ignore new runs."""
         self._shutdown_requested = True
         self._async_unsub_refresh()
+        if self._refresh_stats is not None:
+            async_get_refresh_scheduler(self.hass).async_remove(self._refresh_stats)
+            self._refresh_stats = None
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
 
@@ -224,14 +236,18 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         # We use loop.call_at because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
-        # calling dt_util.utcnow() on every update.
+        # calling dt_util.utcnow() on every update. The refresh
+        # scheduler moves the refresh to the slot of this coordinator
+        # so coordinators with the same interval do not fire together.
         hass = self.hass
-        loop = hass.loop
-
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        scheduler = async_get_refresh_scheduler(hass)
+        if (stats := self._refresh_stats) is None:
+            stats = self._refresh_stats = scheduler.async_add(self._refresh_key)
+        next_refresh = self._refresh_scheduled_at = (
+            scheduler.async_next_refresh(stats, self._update_interval_seconds)
+            + self._microsecond
         )
-        self._unsub_refresh = loop.call_at(
+        self._unsub_refresh = hass.loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
 
@@ -255,7 +271,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        if (stats := self._refresh_stats) is None:
+            await self._async_refresh(log_failures=True, scheduled=True)
+            return
+        await async_get_refresh_scheduler(self.hass).async_run(
+            stats,
+            refresh_host(self.config_entry),
+            self._refresh_scheduled_at,
+            partial(self._async_refresh, log_failures=True, scheduled=True),
+        )
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -6,17 +6,42 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
 import logging
+import os
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
-
-from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+import tracemalloc
+import zlib
+
+from homeassistant import config_entries, core, loader
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.tasks import CommitTask
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EVENT_STATE_CHANGED, UnitOfPower
+from homeassistant.helpers import (
+    entity_registry as er,
+    recorder as recorder_helper,
+    storage,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.json import (
+    JSON_DUMP,
+    json_bytes,
+    json_fragment,
+    save_json,
+)
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -223,6 +248,303 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_filtered_listeners(hass):
+    """Fire 100k state changed events at 10k listeners using event filters."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        tracked_entity_id = f"{entity_id}{idx}"
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            listener,
+            event_filter=core.callback(
+                lambda event_data, tracked_entity_id=tracked_entity_id: (
+                    event_data["entity_id"] == tracked_entity_id
+                )
+            ),
+        )
+
+    runtime = await _fire_state_changed_events(hass, entity_id, events_to_fire)
+
+    assert count == events_to_fire
+
+    return runtime
+
+
+@benchmark
+async def state_changed_keyed_listeners(hass):
+    """Fire 100k state changed events at 10k listeners using the keyed index."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(10**4):
+        async_track_state_change_event(hass, f"{entity_id}{idx}", listener)
+
+    runtime = await _fire_state_changed_events(hass, entity_id, events_to_fire)
+
+    assert count == events_to_fire
+
+    return runtime
+
+
+async def _fire_state_changed_events(hass, entity_id, events_to_fire):
+    """Fire state changed events spread over the tracked entities."""
+    event_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": core.State(f"{entity_id}{idx}", "off"),
+            "new_state": core.State(f"{entity_id}{idx}", "on"),
+        }
+        for idx in range(100)
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data[idx % 100])
+
+    await hass.async_block_till_done()
+
+    runtime = timer() - start
+    print(f"{events_to_fire / runtime:.0f} events/s")
+    return runtime
+
+
+@benchmark
+async def set_states_single(hass):
+    """Write 50k states one at a time with a state changed listener."""
+    count = 0
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    states = _generate_states(5 * 10**4)
+
+    start = timer()
+
+    for entity_id, state, attributes in states:
+        hass.states.async_set(entity_id, state, attributes)
+
+    await hass.async_block_till_done()
+
+    assert count == len(states)
+
+    return timer() - start
+
+
+@benchmark
+async def set_states_batched(hass):
+    """Write 50k states in batches of 500 with a state changed listener."""
+    count = 0
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    states = _generate_states(5 * 10**4)
+
+    start = timer()
+
+    for idx in range(0, len(states), 500):
+        hass.states.async_set_many(states[idx : idx + 500])
+
+    await hass.async_block_till_done()
+
+    assert count == len(states)
+
+    return timer() - start
+
+
+def _generate_states(number_of_states):
+    """Generate states for 1000 sensors."""
+    return [
+        (
+            f"sensor.power_{idx % 1000}",
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Power {idx % 1000}"},
+        )
+        for idx in range(number_of_states)
+    ]
+
+
+@benchmark
+async def recorder_write_states(hass):
+    """Record 50k state changes into a SQLite database."""
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    hass.set_state(core.CoreState.running)
+    with TemporaryDirectory() as tmp_dir:
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {
+                "recorder": {
+                    "db_url": f"sqlite:///{tmp_dir}/benchmark.db",
+                    "commit_interval": 1,
+                }
+            },
+        )
+        instance = get_instance(hass)
+        await instance.async_recorder_ready.wait()
+        states = _generate_states(5 * 10**4)
+
+        start = timer()
+
+        for entity_id, state, attributes in states:
+            hass.states.async_set(entity_id, state, attributes)
+        await hass.async_block_till_done()
+        instance.queue_task(CommitTask())
+        await instance.async_block_till_done()
+
+        runtime = timer() - start
+        print(f"{len(states) / runtime:.0f} rows/s")
+        await hass.async_stop()
+    return runtime
+
+
+@benchmark
+async def recorder_history_during_period(hass):
+    """Fetch 7 days of history for 200 entities from 5M state rows."""
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    hass.set_state(core.CoreState.running)
+    with TemporaryDirectory() as tmp_dir:
+        recorder_helper.async_initialize_recorder(hass)
+        assert await async_setup_component(
+            hass,
+            "recorder",
+            {"recorder": {"db_url": f"sqlite:///{tmp_dir}/benchmark.db"}},
+        )
+        instance = get_instance(hass)
+        await instance.async_recorder_ready.wait()
+        await instance.async_block_till_done()
+        end_time = dt_util.utcnow()
+        start_time = end_time - timedelta(days=7)
+        entity_ids = await instance.async_add_executor_job(
+            _insert_history_rows, instance, start_time, end_time, 5 * 10**6
+        )
+        print(f"Inserted 5M state rows for {len(entity_ids)} entities")
+
+        start = timer()
+        for minimal_response in (True, False):
+            for json_payload in (False, True):
+                section_start = timer()
+                await instance.async_add_executor_job(
+                    _fetch_history_payload,
+                    hass,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    minimal_response,
+                    json_payload,
+                )
+                print(
+                    f"{'json' if json_payload else 'dict'} "
+                    f"minimal_response={minimal_response}: "
+                    f"{timer() - section_start:.2f}s"
+                )
+        runtime = timer() - start
+        await hass.async_stop()
+    return runtime
+
+
+def _insert_history_rows(instance, start_time, end_time, number_of_rows):
+    """Insert state rows for 100 sensors and 100 binary sensors."""
+    entity_ids = [f"sensor.power_{idx}" for idx in range(100)] + [
+        f"binary_sensor.motion_{idx}" for idx in range(100)
+    ]
+    rows_per_entity = number_of_rows // len(entity_ids)
+    start_ts = start_time.timestamp()
+    interval = (end_time.timestamp() - start_ts) / rows_per_entity
+    connection = instance.engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT INTO states_meta (metadata_id, entity_id) VALUES (?, ?)",
+            enumerate(entity_ids, 1),
+        )
+        cursor.executemany(
+            "INSERT INTO state_attributes (attributes_id, shared_attrs) VALUES (?, ?)",
+            (
+                (
+                    metadata_id,
+                    JSON_DUMP({"friendly_name": entity_id, "icon": "mdi:flash"}),
+                )
+                for metadata_id, entity_id in enumerate(entity_ids, 1)
+            ),
+        )
+        cursor.executemany(
+            "INSERT INTO states "
+            "(metadata_id, attributes_id, state, last_updated_ts, last_changed_ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    metadata_id,
+                    metadata_id,
+                    str(idx % 500)
+                    if entity_id.startswith("sensor.")
+                    else ("on", "off")[idx // 10 % 2],
+                    start_ts + idx * interval + metadata_id / 1000,
+                    start_ts + idx * interval + metadata_id / 1000,
+                )
+                for idx in range(rows_per_entity)
+                for metadata_id, entity_id in enumerate(entity_ids, 1)
+            ),
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    return entity_ids
+
+
+def _fetch_history_payload(
+    hass, start_time, end_time, entity_ids, minimal_response, json_payload
+):
+    """Build the history/history_during_period payload."""
+    if json_payload:
+        states = history.get_significant_states_json(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            minimal_response=minimal_response,
+        )
+    else:
+        states = history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            minimal_response=minimal_response,
+            compressed_state_format=True,
+        )
+    return JSON_DUMP(states)
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -308,3 +630,221 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def websocket_states_snapshot(hass):
+    """Build and compress the subscribe_entities snapshot of 10k states."""
+    states = [
+        core.State(
+            f"sensor.power_{idx}",
+            str(idx),
+            {
+                "friendly_name": f"Power {idx}",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+            },
+        )
+        for idx in range(10**4)
+    ]
+
+    start = timer()
+    snapshot = b"".join(
+        (
+            b'{"id":1,"type":"event","event":{"a":{',
+            b",".join(state.as_compressed_state_json for state in states),
+            b"}}}",
+        )
+    )
+    encode_time = timer() - start
+    compress_start = timer()
+    compressed = zlib.compress(snapshot)
+    compress_time = timer() - compress_start
+    print(f"json: {len(snapshot)} bytes in {encode_time:.3f}s")
+    print(
+        f"zlib: {len(compressed)} bytes "
+        f"({len(compressed) / len(snapshot):.1%}) in {compress_time:.3f}s"
+    )
+    return timer() - start
+
+
+@benchmark
+async def registry_journal_save(hass):
+    """Save single entry changes of a 20k entry registry with and without journal."""
+    entries = {
+        f"entry_{idx}": json_fragment(
+            json_bytes(
+                {
+                    "id": f"entry_{idx}",
+                    "entity_id": f"sensor.power_{idx}",
+                    "platform": "benchmark",
+                    "unique_id": f"power_{idx}",
+                    "name": None,
+                    "options": {"sensor": {"display_precision": None}},
+                    "modified_at": dt_util.utcnow().isoformat(),
+                }
+            )
+        )
+        for idx in range(2 * 10**4)
+    }
+    saves = 100
+
+    with TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        runtime = 0.0
+        for journal in (False, True):
+            store = storage.Store(
+                hass, 1, f"benchmark_{journal}", atomic_writes=True, journal=journal
+            )
+            await store.async_save({"entities": list(entries.values())})
+            written = 0
+            start = timer()
+            for idx in range(saves):
+                entry_id = f"entry_{idx}"
+                entries[entry_id] = json_fragment(
+                    json_bytes({"id": entry_id, "name": f"Renamed {idx}"})
+                )
+                await store.async_save({"entities": list(entries.values())})
+                if not journal:
+                    written += os.path.getsize(store.path)
+            elapsed = timer() - start
+            if journal:
+                written = os.path.getsize(f"{store.path}{storage.JOURNAL_SUFFIX}")
+            runtime += elapsed
+            print(
+                f"journal={journal}: {written / saves:.0f} bytes and "
+                f"{elapsed / saves * 1000:.1f}ms per save"
+            )
+    return runtime
+
+
+@benchmark
+async def entity_registry_load(hass):
+    """Load an entity registry with 50k entities."""
+    timestamps = [
+        "1970-01-01T00:00:00+00:00",
+        *(dt_util.utcnow().replace(second=idx).isoformat() for idx in range(10)),
+    ]
+    entities = [
+        {
+            "aliases": [],
+            "area_id": None,
+            "categories": {},
+            "capabilities": {"state_class": "measurement"},
+            "config_entry_id": f"config_entry_{idx // 500}",
+            "created_at": timestamps[idx % len(timestamps)],
+            "device_class": None,
+            "device_id": f"device_{idx // 10}",
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"sensor.power_{idx}",
+            "hidden_by": None,
+            "icon": None,
+            "id": f"entry_{idx}",
+            "has_entity_name": True,
+            "labels": [],
+            "modified_at": timestamps[idx % len(timestamps)],
+            "name": None,
+            "options": {"sensor": {"display_precision": None}},
+            "original_device_class": "power",
+            "original_icon": None,
+            "original_name": "Power",
+            "platform": f"platform_{idx % 50}",
+            "supported_features": 0,
+            "translation_key": "power",
+            "unique_id": f"power_{idx}",
+            "previous_unique_id": None,
+            "unit_of_measurement": "W",
+        }
+        for idx in range(5 * 10**4)
+    ]
+
+    with TemporaryDirectory() as tmp_dir:
+        hass.config.config_dir = tmp_dir
+        os.makedirs(hass.config.path(storage.STORAGE_DIR))
+        await hass.async_add_executor_job(
+            save_json,
+            hass.config.path(storage.STORAGE_DIR, er.STORAGE_KEY),
+            {
+                "version": er.STORAGE_VERSION_MAJOR,
+                "minor_version": er.STORAGE_VERSION_MINOR,
+                "key": er.STORAGE_KEY,
+                "data": {"entities": entities, "deleted_entities": []},
+            },
+        )
+        del entities
+
+        start = timer()
+        await er.EntityRegistry(hass).async_load()
+        runtime = timer() - start
+
+        tracemalloc.start()
+        await er.EntityRegistry(hass).async_load()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Peak memory: {peak / 2**20:.1f} MiB")
+    return runtime
+
+
+@benchmark
+async def sensor_entity_writes(hass):
+    """Write 100k sensor updates through the entity state write path."""
+
+    class PowerSensor(SensorEntity):
+        """A power sensor which is not added with an entity platform."""
+
+        _attr_device_class = SensorDeviceClass.POWER
+        _attr_native_unit_of_measurement = UnitOfPower.WATT
+        _attr_state_class = SensorStateClass.MEASUREMENT
+        _no_platform_reported = True
+
+        def __init__(self, idx: int) -> None:
+            """Initialize the sensor."""
+            self.hass = hass
+            self.entity_id = f"sensor.power_{idx}"
+            self._attr_name = f"Power {idx}"
+            self._attr_extra_state_attributes = {"phase": idx % 3}
+
+        def write_power(self, power: int) -> None:
+            """Write a new power reading."""
+            self._attr_native_value = power
+            self.async_write_ha_state()
+
+    sensors = [PowerSensor(idx) for idx in range(1000)]
+
+    start = timer()
+
+    for idx in range(10**5):
+        sensors[idx % 1000].write_power(idx)
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_matching(hass):
+    """Match 100k MQTT topics against 1000 wildcard subscriptions."""
+    trie: TopicTrie[str] = TopicTrie()
+    for idx in range(1000):
+        if idx % 2:
+            subscription = f"tasmota/discovery/{idx}/+"
+        else:
+            subscription = f"zigbee2mqtt/device_{idx}/#"
+        trie.add(subscription, subscription)
+    trie.add("homeassistant/+/+/config", "discovery")
+    topics = [
+        f"zigbee2mqtt/device_{idx % 2000}/availability"
+        if idx % 3
+        else f"homeassistant/sensor/device_{idx}/config"
+        for idx in range(10**5)
+    ]
+
+    start = timer()
+
+    matches = sum(len(trie.matches(topic)) for topic in topics)
+
+    runtime = timer() - start
+    print(f"{matches} matches")
+    return runtime
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 import contextlib
+from dataclasses import dataclass
+from functools import cache, partial
 import logging
 import sys
 from threading import Thread
@@ -21,6 +26,12 @@ _JOIN_ATTEMPTS = 10
 
 EXECUTOR_SHUTDOWN_TIMEOUT = 10
 
+# How many jobs of an integration may run in the default executor at once
+MAX_EXECUTOR_JOBS_PER_DOMAIN = 16
+
+# Modules passing the jobs of their callers on to the queue
+_SUBMITTING_MODULES = {"homeassistant.core", __name__}
+
 
 def _log_thread_running_at_shutdown(name: str, ident: int) -> None:
     """Log the stack of a thread that was still running at shutdown."""
@@ -100,3 +111,186 @@ class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
             )
             if timeout_remaining <= 0:
                 return
+
+
+@dataclass(slots=True)
+class ExecutorJobStats:
+    """Statistics of the executor jobs of a domain."""
+
+    jobs: int = 0
+    running: int = 0
+    queued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    total_run: float = 0.0
+    max_run: float = 0.0
+
+
+class _ExecutorJob:
+    """A job submitted to the executor."""
+
+    __slots__ = ("target", "args", "submitted", "started")
+
+    def __init__(
+        self, target: Callable[..., Any], args: tuple[Any, ...], submitted: float
+    ) -> None:
+        """Initialize the job."""
+        self.target = target
+        self.args = args
+        self.submitted = submitted
+        self.started = 0.0
+
+    def run(self) -> Any:
+        """Run the job in an executor thread."""
+        self.started = time.monotonic()
+        return self.target(*self.args)
+
+
+@cache
+def _module_domain(module: str) -> tuple[str, bool]:
+    """Return the domain of a module and if it is an integration."""
+    parts = module.split(".", 3)
+    if parts[0] == "homeassistant":
+        if len(parts) > 2 and parts[1] == "components":
+            return parts[2], True
+        return "homeassistant", False
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1], True
+    return parts[0], False
+
+
+def _target_domain(target: Callable[..., Any]) -> tuple[str, bool]:
+    """Return the domain the target of a job belongs to."""
+    while isinstance(target, partial):
+        target = target.func
+    if not (module := getattr(target, "__module__", None)):
+        return "unknown", False
+    return _module_domain(module)
+
+
+def _submitter_domain() -> tuple[str, bool]:
+    """Return the domain of the code submitting a job."""
+    frame = sys._getframe(2)  # noqa: SLF001
+    while frame is not None:
+        if (module := frame.f_globals.get("__name__")) not in _SUBMITTING_MODULES:
+            return _module_domain(module) if module else ("unknown", False)
+        frame = frame.f_back
+    return "unknown", False
+
+
+def _copy_future_state(
+    source: asyncio.Future[Any], destination: asyncio.Future[Any]
+) -> None:
+    """Copy the outcome of a finished future to another future."""
+    if destination.done():
+        return
+    if source.cancelled():
+        destination.cancel()
+    elif (exc := source.exception()) is not None:
+        destination.set_exception(exc)
+    else:
+        destination.set_result(source.result())
+
+
+def _cancel_source(source: asyncio.Future[Any], future: asyncio.Future[Any]) -> None:
+    """Cancel the source of a future that was cancelled."""
+    if future.cancelled():
+        source.cancel()
+
+
+class ExecutorJobQueue:
+    """Share the default executor fairly between integrations.
+
+    An integration may only run a limited number of jobs in the executor
+    at a time. Its further jobs are queued and submitted when one of its
+    jobs finishes, so a few integrations blocking in I/O can not hold all
+    the threads of the executor. Jobs are attributed to the domain of their
+    target when it is part of Home Assistant, and otherwise to the code
+    submitting them. Only jobs attributed to an integration are queued, so
+    the jobs of the core are never held up. The wait and run time of the
+    jobs are recorded per domain.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        max_jobs_per_domain: int = MAX_EXECUTOR_JOBS_PER_DOMAIN,
+    ) -> None:
+        """Initialize the queue."""
+        self._loop = loop
+        self._max_jobs_per_domain = max_jobs_per_domain
+        self._queues: dict[
+            str, deque[tuple[_ExecutorJob, asyncio.Future[Any]]]
+        ] = {}
+        self.stats: dict[str, ExecutorJobStats] = {}
+
+    def async_submit[*_Ts, _T](
+        self, target: Callable[[*_Ts], _T], *args: *_Ts
+    ) -> asyncio.Future[_T]:
+        """Submit a job to the default executor.
+
+        This method must be run in the event loop.
+        """
+        domain, integration = _target_domain(target)
+        if not integration and domain != "homeassistant":
+            # Standard library and third party targets are attributed to the
+            # code submitting them
+            domain, integration = _submitter_domain()
+        if (stats := self.stats.get(domain)) is None:
+            stats = self.stats[domain] = ExecutorJobStats()
+        job = _ExecutorJob(target, args, time.monotonic())
+        if not integration or stats.running < self._max_jobs_per_domain:
+            return self._async_start(domain, stats, job)
+        future: asyncio.Future[_T] = self._loop.create_future()
+        if (queue := self._queues.get(domain)) is None:
+            queue = self._queues[domain] = deque()
+        queue.append((job, future))
+        stats.queued += 1
+        return future
+
+    def _async_start(
+        self, domain: str, stats: ExecutorJobStats, job: _ExecutorJob
+    ) -> asyncio.Future[Any]:
+        """Run a job in the default executor."""
+        future = self._loop.run_in_executor(None, job.run)
+        stats.running += 1
+        future.add_done_callback(partial(self._async_job_done, domain, stats, job))
+        return future
+
+    def _async_job_done(
+        self,
+        domain: str,
+        stats: ExecutorJobStats,
+        job: _ExecutorJob,
+        _future: asyncio.Future[Any],
+    ) -> None:
+        """Record the times of a job and start the next queued job."""
+        stats.running -= 1
+        stats.jobs += 1
+        # A job cancelled before it was started has not run
+        if started := job.started:
+            wait = started - job.submitted
+            run = time.monotonic() - started
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            stats.total_run += run
+            stats.max_run = max(stats.max_run, run)
+        if (queue := self._queues.get(domain)) is None:
+            return
+        while queue:
+            next_job, future = queue.popleft()
+            stats.queued -= 1
+            # The caller may have cancelled the job while it was queued
+            if future.done():
+                continue
+            try:
+                source = self._async_start(domain, stats, next_job)
+            except RuntimeError as err:
+                # The executor has been shut down
+                future.set_exception(err)
+                continue
+            source.add_done_callback(partial(_copy_future_state, destination=future))
+            future.add_done_callback(partial(_cancel_source, source))
+            break
+        if not queue:
+            del self._queues[domain]
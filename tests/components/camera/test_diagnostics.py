@@ -0,0 +1,36 @@
+"""Test camera diagnostics."""
+
+import pytest
+
+from homeassistant.components import camera
+from homeassistant.components.camera.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+
+
+@pytest.mark.usefixtures("mock_camera_with_device")
+async def test_config_entry_diagnostics(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the diagnostics hold the image cache counters of each camera."""
+    assert await async_setup_component(
+        hass, camera.DOMAIN, {camera.DOMAIN: {"platform": "demo"}}
+    )
+    await hass.async_block_till_done()
+    config_entry = hass.config_entries.async_entries("demo")[0]
+    entity_id = entity_registry.async_get_entity_id(
+        camera.DOMAIN, "demo", "Demo camera"
+    )
+    assert entity_id is not None
+
+    await camera.async_get_image(hass, entity_id)
+    await camera.async_get_image(hass, entity_id)
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert len(diagnostics) == 3
+    assert diagnostics[entity_id] == {
+        "image_cache": {"hits": 0, "shared": 0, "misses": 2}
+    }
@@ -1,10 +1,11 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
 from types import ModuleType
-from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, call, mock_open, patch
 
 import pytest
 
@@ -14,6 +15,8 @@ from homeassistant.components.camera.const import (
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
 )
+from homeassistant.components.camera.helper import get_camera_from_entity_id
+from homeassistant.components.camera.still_stream import StillStreamHub
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
@@ -92,6 +95,97 @@ async def test_get_image_from_camera(hass: HomeAssistant) -> None:
     assert image.content == b"Test"
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_from_camera_shared(hass: HomeAssistant) -> None:
+    """Test concurrent and recent requests share the fetched image."""
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+
+    with patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Test",
+    ) as mock_camera:
+        images = await asyncio.gather(
+            *(camera.async_get_image(hass, "camera.demo_camera") for _ in range(3))
+        )
+        assert mock_camera.call_count == 1
+        assert all(image.content == b"Test" for image in images)
+        # The image is not cached without a time to live
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera.call_count == 2
+
+        demo_camera._attr_image_cache_ttl = 60
+        await camera.async_get_image(hass, "camera.demo_camera")
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera.call_count == 3
+
+    assert demo_camera.image_cache.get_diagnostics() == {
+        "hits": 1,
+        "shared": 2,
+        "misses": 3,
+    }
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_from_camera_shared_sizes(hass: HomeAssistant) -> None:
+    """Test concurrent requests only share the fetch of an image of the same size."""
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+    turbo_jpeg = mock_turbo_jpeg(
+        first_width=16, first_height=12, second_width=16, second_height=12
+    )
+    with (
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton.instance",
+            return_value=turbo_jpeg,
+        ),
+        patch.object(
+            demo_camera, "async_camera_image", return_value=b"Valid jpeg"
+        ) as mock_camera_image,
+    ):
+        images = await asyncio.gather(
+            camera.async_get_image(hass, "camera.demo_camera"),
+            camera.async_get_image(hass, "camera.demo_camera", width=4, height=3),
+            camera.async_get_image(hass, "camera.demo_camera", width=4, height=3),
+            camera.async_get_image(hass, "camera.demo_camera", width=8, height=6),
+        )
+
+    # The size is passed to the camera, which may scale the image itself
+    assert mock_camera_image.call_args_list == [
+        call(width=None, height=None),
+        call(width=4, height=3),
+        call(width=8, height=6),
+    ]
+    assert images[0].content == b"Valid jpeg"
+    assert all(image.content == EMPTY_8_6_JPEG for image in images[1:])
+    assert images[1] is images[2]
+    assert demo_camera.image_cache.get_diagnostics() == {
+        "hits": 0,
+        "shared": 1,
+        "misses": 3,
+    }
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_from_camera_fetch_timeout(hass: HomeAssistant) -> None:
+    """Test a fetch timing out does not block the next requests."""
+    demo_camera = get_camera_from_entity_id(hass, "camera.demo_camera")
+
+    with (
+        patch.object(demo_camera, "async_camera_image", side_effect=TimeoutError),
+        pytest.raises(HomeAssistantError),
+    ):
+        await camera.async_get_image(hass, "camera.demo_camera")
+
+    with patch(
+        "homeassistant.components.demo.camera.Path.read_bytes",
+        autospec=True,
+        return_value=b"Test",
+    ):
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"Test"
+    assert demo_camera.image_cache.get_diagnostics()["misses"] == 2
+
+
 @pytest.mark.usefixtures("image_mock_url")
 async def test_get_image_from_camera_with_width_height(hass: HomeAssistant) -> None:
     """Grab an image from camera entity with width and height."""
@@ -600,6 +694,40 @@ async def test_camera_proxy_stream(hass_client: ClientSessionGenerator) -> None:
             assert response.status == HTTPStatus.BAD_GATEWAY
 
 
+async def test_still_stream_hub(hass: HomeAssistant) -> None:
+    """Test a still stream hub fetches the images once for all its viewers."""
+    images: asyncio.Queue[bytes | None] = asyncio.Queue()
+    on_close = Mock()
+    hub = StillStreamHub(hass, images.get, 0, on_close)
+    fast_viewer = hub.async_add_viewer()
+    slow_viewer = hub.async_add_viewer()
+
+    images.put_nowait(b"1")
+    assert await fast_viewer.async_next_image() == b"1"
+    images.put_nowait(b"2")
+    assert await fast_viewer.async_next_image() == b"2"
+    # The slow viewer skips the images it did not get to
+    assert await slow_viewer.async_next_image() == b"2"
+    # A new viewer gets the latest image right away
+    late_viewer = hub.async_add_viewer()
+    assert await late_viewer.async_next_image() == b"2"
+
+    # The streams of all viewers end when fetching an image fails
+    images.put_nowait(None)
+    for viewer in (fast_viewer, slow_viewer, late_viewer):
+        assert await viewer.async_next_image() is None
+        hub.async_remove_viewer(viewer)
+    on_close.assert_called_once()
+
+    # The hub stops fetching images when the last viewer is removed
+    on_close = Mock()
+    hub = StillStreamHub(hass, images.get, 0, on_close)
+    viewer = hub.async_add_viewer()
+    await asyncio.sleep(0)
+    hub.async_remove_viewer(viewer)
+    on_close.assert_called_once()
+
+
 @pytest.mark.usefixtures("mock_camera_web_rtc")
 async def test_websocket_web_rtc_offer(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
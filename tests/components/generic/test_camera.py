@@ -593,9 +593,10 @@ async def test_frame_interval_property(hass: HomeAssistant) -> None:
     await help_setup_mock_config_entry(hass, options)
 
     request = Mock()
-    with patch(
-        "homeassistant.components.camera.async_get_still_stream"
-    ) as mock_get_stream:
+    with (
+        patch("homeassistant.components.camera.StillStreamHub") as mock_hub,
+        patch("homeassistant.components.camera._async_get_shared_still_stream"),
+    ):
         await async_get_mjpeg_stream(hass, request, "camera.config_test")
 
-    assert mock_get_stream.call_args_list[0][0][3] == pytest.approx(0.2)
+    assert mock_hub.call_args_list[0][0][2] == pytest.approx(0.2)
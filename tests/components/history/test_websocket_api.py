@@ -1,8 +1,10 @@
 """The tests the History component websocket_api."""
 
 import asyncio
+from collections.abc import Generator
 from datetime import timedelta
-from unittest.mock import ANY, patch
+from typing import Any
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 from freezegun import freeze_time
 import pytest
@@ -454,6 +456,132 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sending the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state, attr in (
+        ("on", "attr"),
+        ("off", "attr"),
+        ("off", "changed"),
+        ("off", "again"),
+        ("on", "attr"),
+    ):
+        hass.states.async_set("sensor.test", state, attributes={"any": attr})
+        hass.states.async_set("light.test", state, attributes={"any": attr})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    msg_id = 0
+    for minimal_response in (False, True):
+        request = {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test", "light.test"],
+            "significant_changes_only": False,
+            "minimal_response": minimal_response,
+        }
+        msg_id += 1
+        await client.send_json({"id": msg_id, **request})
+        response = await client.receive_json()
+        assert response["success"]
+        expected = response["result"]
+
+        msg_id += 1
+        with patch.object(websocket_api, "HISTORY_CHUNK_SIZE", 2):
+            await client.send_json({"id": msg_id, **request, "chunked": True})
+            response = await client.receive_json()
+            assert response["id"] == msg_id
+            assert response["success"]
+            assert response["result"] is None
+
+            states: dict[str, list] = {}
+            chunks = 0
+            while True:
+                response = await client.receive_json()
+                assert response["id"] == msg_id
+                assert response["type"] == "event"
+                chunks += 1
+                for entity_id, entity_states in response["event"]["states"].items():
+                    assert sum(map(len, response["event"]["states"].values())) <= 2
+                    states.setdefault(entity_id, []).extend(entity_states)
+                if not response["event"].get("partial"):
+                    break
+
+        assert chunks > 2
+        assert states == expected
+
+    # A request in the future gets a single empty final chunk
+    msg_id += 1
+    await client.send_json(
+        {
+            "id": msg_id,
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.test"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["states"] == {}
+    assert "partial" not in response["event"]
+
+
+async def test_history_during_period_chunked_unsubscribed(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test history_during_period stops reading chunks once unsubscribed."""
+    await async_setup_component(hass, "history", {})
+    msg_id = 5
+    connection = Mock(subscriptions={msg_id: Mock()})
+    # The client unsubscribes once it received the first chunk
+    connection.send_message.side_effect = lambda message: connection.subscriptions.pop(
+        msg_id
+    )
+    connection.async_drain = AsyncMock()
+    read_chunks = 0
+    closed = False
+
+    def _get_chunks(*args: Any) -> Generator[dict[str, list]]:
+        nonlocal read_chunks, closed
+        try:
+            for _ in range(5):
+                read_chunks += 1
+                yield {"sensor.test": []}
+        finally:
+            closed = True
+
+    with patch.object(
+        websocket_api.history, "get_significant_states_json_chunks", _get_chunks
+    ):
+        await hass.async_add_executor_job(
+            websocket_api._ws_send_significant_states_chunks,
+            hass,
+            connection,
+            msg_id,
+            dt_util.utcnow(),
+            None,
+            ["sensor.test"],
+            True,
+            True,
+            False,
+            False,
+        )
+
+    assert connection.send_message.call_count == 1
+    connection.async_drain.assert_awaited_once()
+    assert read_chunks == 2
+    assert closed
+
+
 async def test_history_stream_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
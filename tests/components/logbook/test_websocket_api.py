@@ -292,6 +292,77 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test logbook get_events sending the events in chunks."""
+    now = dt_util.utcnow()
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    for state in (STATE_OFF, STATE_ON, STATE_OFF, STATE_ON, STATE_OFF):
+        hass.states.async_set("light.kitchen", state)
+        await hass.async_block_till_done()
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/get_events", "start_time": now.isoformat()}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected) == 5
+
+    with patch.object(websocket_api, "GET_EVENTS_CHUNK_SIZE", 2):
+        await client.send_json(
+            {
+                "id": 2,
+                "type": "logbook/get_events",
+                "start_time": now.isoformat(),
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        assert response["result"] is None
+
+        chunks = []
+        while True:
+            response = await client.receive_json()
+            assert response["id"] == 2
+            assert response["type"] == "event"
+            chunks.append(response["event"]["events"])
+            if not response["event"].get("partial"):
+                break
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [event for chunk in chunks for event in chunk] == expected
+
+    # Everything filtered away gets a single empty final chunk
+    await client.send_json(
+        {
+            "id": 3,
+            "type": "logbook/get_events",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"]["events"] == []
+    assert "partial" not in response["event"]
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
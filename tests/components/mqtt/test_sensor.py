@@ -13,6 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import mqtt, sensor
+from homeassistant.components.mqtt.models import DATA_MQTT
 from homeassistant.components.mqtt.sensor import MQTT_SENSOR_ATTRIBUTES_BLOCKED
 from homeassistant.const import (
     EVENT_STATE_CHANGED,
@@ -111,6 +112,50 @@ async def test_setting_sensor_value_via_mqtt_message(
     assert state.attributes.get("unit_of_measurement") == "fav unit"
 
 
+@pytest.mark.parametrize(
+    "hass_config",
+    [
+        {
+            mqtt.DOMAIN: {
+                sensor.DOMAIN: {
+                    "name": "test",
+                    "state_topic": "test-topic",
+                    "coalesce_window": 2,
+                }
+            }
+        }
+    ],
+)
+async def test_coalescing_sensor_value_via_mqtt_message(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test messages received during the coalesce window are coalesced."""
+    await mqtt_mock_entry()
+
+    for value in range(5):
+        async_fire_mqtt_message(hass, "test-topic", str(value))
+    # The first message is passed on and the latest one is held back
+    assert hass.states.get("sensor.test").state == "0"
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.test").state == "4"
+    subscription_info = hass.data[DATA_MQTT].debug_info_entities["sensor.test"][
+        "subscriptions"
+    ]["test-topic"]
+    assert subscription_info["coalesced"] == 3
+
+    # The window closes when nothing was received during it
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    async_fire_mqtt_message(hass, "test-topic", "5")
+    assert hass.states.get("sensor.test").state == "5"
+
+
 @pytest.mark.parametrize(
     "hass_config",
     [
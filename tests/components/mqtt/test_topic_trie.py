@@ -0,0 +1,65 @@
+"""Tests for the MQTT topic trie."""
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("subscription", "topic", "matches"),
+    [
+        ("+", "sensor", True),
+        ("+", "sensor/temperature", False),
+        ("+", "/sensor", False),
+        ("+/+", "/sensor", True),
+        ("sensor/+", "sensor/temperature", True),
+        ("sensor/+", "sensor", False),
+        ("sensor/+/state", "sensor/temperature/state", True),
+        ("sensor/+/state", "sensor/temperature/attributes", False),
+        ("#", "sensor/temperature", True),
+        ("sensor/#", "sensor", True),
+        ("sensor/#", "sensor/temperature/state", True),
+        ("sensor/#", "switch/sensor", False),
+        ("+/temperature/#", "sensor/temperature", True),
+        ("#", "$SYS/broker/uptime", False),
+        ("+/broker/uptime", "$SYS/broker/uptime", False),
+        ("$SYS/#", "$SYS/broker/uptime", True),
+        ("$SYS/+/uptime", "$SYS/broker/uptime", True),
+    ],
+)
+def test_matches(subscription: str, topic: str, matches: bool) -> None:
+    """Test matching a topic follows the MQTT wildcard rules."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add(subscription, "value")
+    assert trie.matches(topic) == (["value"] if matches else [])
+
+
+def test_add_remove() -> None:
+    """Test values are matched until they are removed."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("sensor/+/state", "state")
+    trie.add("sensor/+/state", "other_state")
+    trie.add("sensor/#", "all")
+    trie.add("sensor/temperature/state", "exact")
+
+    assert sorted(trie.matches("sensor/temperature/state")) == [
+        "all",
+        "exact",
+        "other_state",
+        "state",
+    ]
+
+    trie.remove("sensor/+/state", "state")
+    assert sorted(trie.matches("sensor/humidity/state")) == ["all", "other_state"]
+
+    with pytest.raises(KeyError):
+        trie.remove("sensor/+/state", "state")
+    with pytest.raises(KeyError):
+        trie.remove("switch/+", "state")
+
+    trie.remove("sensor/+/state", "other_state")
+    trie.remove("sensor/#", "all")
+    trie.remove("sensor/temperature/state", "exact")
+    assert trie.matches("sensor/temperature/state") == []
+    # Levels which no longer lead to any value are pruned
+    assert not trie._root.children
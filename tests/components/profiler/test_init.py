@@ -5,6 +5,7 @@ from functools import lru_cache
 import logging
 import os
 from pathlib import Path
+import time
 from unittest.mock import patch
 
 from freezegun.api import FrozenDateTimeFactory
@@ -31,12 +32,14 @@ from homeassistant.components.profiler import (
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.loop_monitor import WINDOW_INTERVAL
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -70,7 +73,9 @@ async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
     await hass.async_block_till_done()
 
 
-async def test_memory_usage(hass: HomeAssistant, tmp_path: Path) -> None:
+async def test_memory_usage(
+    hass: HomeAssistant, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
     """Test we can setup and the service is registered."""
     test_dir = tmp_path / "profiles"
     test_dir.mkdir()
@@ -97,6 +102,39 @@ async def test_memory_usage(hass: HomeAssistant, tmp_path: Path) -> None:
 
         mock_hpy.assert_called_once()
 
+    assert "State machine memory: 0 states, 0 distinct attribute dicts" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_memory_usage_state_summary(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the memory profile summarizes the memory used by states."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.two", "1", {"unit_of_measurement": "W"})
+    hass.states.get("sensor.one").as_dict_json  # noqa: B018
+    # The attributes did not change so the cached JSON is shared
+    hass.states.async_set("sensor.one", "2", {"unit_of_measurement": "W"})
+
+    with (
+        patch("guppy.hpy"),
+        patch("homeassistant.components.profiler._write_memory_profile"),
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_MEMORY, {CONF_SECONDS: 0.000001}, blocking=True
+        )
+
+    assert "State machine memory: 2 states, 2 distinct attribute dicts" in caplog.text
+    assert "bytes of cached attribute JSON" in caplog.text
+
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
 
@@ -311,6 +349,7 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "_dummy_test_lru_stats" in caplog.text
     assert "CacheInfo" in caplog.text
     assert "sqlalchemy_test" in caplog.text
+    assert "Cache stats for compiled templates" in caplog.text
 
 
 async def test_log_object_sources(
@@ -446,3 +485,58 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_loop_monitor(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test slow callbacks are attributed and the statistics are published."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.event_loop_lag").state == "0.0"
+    assert hass.states.get("sensor.slow_callbacks").state == "0"
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/loop_stats/subscribe"})
+    msg = await client.receive_json()
+    assert msg["success"]
+    msg = await client.receive_json()
+    assert msg["event"]["window"] == {"max_lag_ms": 0.0, "slow_callbacks": 0}
+    assert "tests" not in msg["event"]["slow_callbacks"]
+
+    def _block_loop() -> None:
+        end = time.perf_counter() + 0.02
+        while time.perf_counter() < end:
+            pass
+
+    @callback
+    def _slow_listener(event: Event) -> None:
+        _block_loop()
+
+    hass.bus.async_listen("slow_event", _slow_listener)
+    hass.bus.async_fire("slow_event")
+    hass.bus.async_fire("slow_event")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=WINDOW_INTERVAL), fire_all=True
+    )
+    await hass.async_block_till_done()
+
+    msg = await client.receive_json()
+    stats = msg["event"]
+    # The listener belongs to the tests package
+    assert stats["slow_callbacks"]["tests"]["count"] == 2
+    assert stats["slow_callbacks"]["tests"]["max_ms"] >= 20
+    assert stats["window"]["slow_callbacks"] >= 2
+    assert stats["lag"]["samples"] == sum(stats["lag"]["counts"])
+    assert stats["executor"]["homeassistant"]["jobs"] > 0
+    assert int(hass.states.get("sensor.slow_callbacks").state) >= 2
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass._job_timer is None
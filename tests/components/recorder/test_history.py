@@ -21,7 +21,7 @@ from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
 
 from .common import (
@@ -726,6 +726,54 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("start_offset", [timedelta(0), timedelta(seconds=2.5)])
+async def test_get_significant_states_json(
+    hass: HomeAssistant,
+    minimal_response: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    start_offset: timedelta,
+) -> None:
+    """Test the columnar JSON builder matches the compressed states."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = [*states, "media_player.not_recorded"]
+
+    fragments = history.get_significant_states_json(
+        hass,
+        zero + start_offset,
+        four,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        minimal_response=minimal_response,
+        no_attributes=no_attributes,
+    )
+    compressed_states = history.get_significant_states(
+        hass,
+        zero + start_offset,
+        four,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        minimal_response=minimal_response,
+        no_attributes=no_attributes,
+        compressed_state_format=True,
+    )
+    assert list(fragments) == list(compressed_states)
+    assert json_bytes(fragments) == json_bytes(compressed_states)
+
+
+async def test_get_significant_states_json_without_entity_ids_raises(
+    hass: HomeAssistant,
+) -> None:
+    """Test at least one entity id is required for the JSON builder."""
+    now = dt_util.utcnow()
+    with pytest.raises(ValueError, match="entity_ids must be provided"):
+        history.get_significant_states_json(hass, now, None)
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
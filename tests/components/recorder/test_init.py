@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Generator
 from datetime import datetime, timedelta
+from pathlib import Path
 import sqlite3
 import sys
 import threading
@@ -69,6 +70,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     MATCH_ALL,
 )
 from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
@@ -77,6 +79,7 @@ from homeassistant.helpers import (
     issue_registry as ir,
     recorder as recorder_helper,
 )
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
@@ -395,11 +398,8 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass)._pending_bulk_states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -1468,6 +1468,116 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 1}])
+async def test_saving_many_rows_in_one_commit(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test states and events buffered for the same commit are written in bulk."""
+    for idx in range(10):
+        hass.states.async_set(f"test.entity_{idx % 2}", str(idx), {"shared": True})
+        hass.bus.async_fire("bulk_event", {"shared": True})
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("test.entity_0", "after", {"shared": True})
+    await async_wait_recording_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.attributes_id,
+                States.state,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        )
+        assert [state.state for state in states] == [
+            *(str(idx) for idx in range(10)),
+            "after",
+        ]
+        assert len({state.attributes_id for state in states}) == 1
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        for idx in range(2, 10):
+            assert states[idx].entity_id == f"test.entity_{idx % 2}"
+            assert states[idx].old_state_id == states[idx - 2].state_id
+        assert states[10].old_state_id == states[8].state_id
+
+        events = list(
+            session.query(Events.event_id, Events.data_id, Events.event_type_id)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "bulk_event")
+        )
+        assert len(events) == 10
+        assert len({event.data_id for event in events}) == 1
+        assert None not in {event.data_id for event in events}
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 1}])
+async def test_saving_rows_after_failed_commit(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
+) -> None:
+    """Test the rows of a failed commit are written once when it is retried."""
+    instance = get_instance(hass)
+    event_session = instance.event_session
+    original_commit = event_session.commit
+    failed = False
+
+    def _fail_first_commit() -> None:
+        nonlocal failed
+        if not failed:
+            failed = True
+            raise OperationalError("commit", "fake params", "forced to fail")
+        original_commit()
+
+    with (
+        patch("time.sleep"),
+        patch.object(event_session, "commit", side_effect=_fail_first_commit),
+    ):
+        hass.states.async_set("test.retry", "one", {"retry": True})
+        hass.states.async_set("test.retry", "two", {"retry": True})
+        hass.bus.async_fire("retry_event", {"retry": True})
+        await async_wait_recording_done(hass)
+
+    assert failed
+    assert "Error executing query" in caplog.text
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                States.state_id,
+                States.old_state_id,
+                States.attributes_id,
+                States.state,
+            )
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "test.retry")
+            .order_by(States.state_id)
+        )
+        assert [state.state for state in states] == ["one", "two"]
+        assert states[1].old_state_id == states[0].state_id
+        assert states[0].attributes_id is not None
+        assert states[0].attributes_id == states[1].attributes_id
+        assert (
+            session.query(StateAttributes)
+            .filter(StateAttributes.shared_attrs == '{"retry":true}')
+            .count()
+            == 1
+        )
+
+        events = list(
+            session.query(Events.data_id)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "retry_event")
+        )
+        assert len(events) == 1
+        assert events[0].data_id is not None
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -2610,6 +2720,119 @@ async def test_clean_shutdown_when_schema_migration_fails(
     assert instance.engine is None
 
 
+def _get_native_states(hass: HomeAssistant, entity_id: str) -> list[State]:
+    with session_scope(hass=hass, read_only=True) as session:
+        states = []
+        for db_state, db_state_attributes in (
+            session.query(States, StateAttributes)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .filter(StatesMeta.entity_id == entity_id)
+            .order_by(States.state_id)
+        ):
+            db_state.entity_id = entity_id
+            state = db_state.to_native()
+            state.attributes = db_state_attributes.to_native()
+            states.append(state)
+        return states
+
+
+async def test_backlog_spills_events_until_database_catches_up(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+    tmp_path: Path,
+) -> None:
+    """Test events are spilled to disk while the backlog is full and replayed."""
+    spill_file = tmp_path / "recorder_spill.jsonl"
+    with patch.object(hass.config, "config_dir", str(tmp_path)):
+        instance = await async_setup_recorder_instance(hass, {})
+    hass.states.async_set("test.spill", "before")
+    await async_wait_recording_done(hass)
+
+    with patch.object(instance, "_reached_max_backlog", return_value=True):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=6))
+        await hass.async_block_till_done()
+    assert "will write new events to" in caplog.text
+
+    hass.states.async_set("test.spill", "spilled", {"attr": 1})
+    hass.bus.async_fire("spilled_event", {"data": 1})
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    hass.states.async_set("test.spill", "in_memory")
+    await async_wait_recording_done(hass)
+
+    assert spill_file.exists()
+    db_states = await instance.async_add_executor_job(
+        _get_native_states, hass, "test.spill"
+    )
+    assert [state.state for state in db_states] == ["before"]
+
+    with patch.object(recorder.core, "SPILL_RESUME_BACKLOG", -1):
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert spill_file.exists()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    hass.states.async_set("test.spill", "after")
+    await async_wait_recording_done(hass)
+
+    assert not spill_file.exists()
+    assert "recording the 3 events that were written to" in caplog.text
+    db_states = await instance.async_add_executor_job(
+        _get_native_states, hass, "test.spill"
+    )
+    assert [state.state for state in db_states] == [
+        "before",
+        "spilled",
+        "in_memory",
+        "after",
+    ]
+    assert db_states[1].attributes == {"attr": 1}
+
+    def _get_db_events() -> list[Events]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return list(
+                session.query(Events).filter(
+                    Events.event_type_id.in_(select_event_type_ids(("spilled_event",)))
+                )
+            )
+
+    assert len(await instance.async_add_executor_job(_get_db_events)) == 1
+
+
+async def test_spilled_events_are_recorded_at_startup(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    tmp_path: Path,
+) -> None:
+    """Test events spilled before a restart are recorded on the next start."""
+    old_state = State("test.spill", "off")
+    new_state = State("test.spill", "on", {"attr": 1})
+    event = Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "test.spill", "old_state": old_state, "new_state": new_state},
+    )
+    spill_file = tmp_path / "recorder_spill.jsonl"
+    spill_file.write_bytes(json_bytes(event) + b"\ninvalid\n")
+
+    with patch.object(hass.config, "config_dir", str(tmp_path)):
+        instance = await async_setup_recorder_instance(hass, {})
+    await async_wait_recording_done(hass)
+
+    assert not spill_file.exists()
+    db_states = await instance.async_add_executor_job(
+        _get_native_states, hass, "test.spill"
+    )
+    assert len(db_states) == 1
+    assert db_states[0].state == "on"
+    assert db_states[0].attributes == {"attr": 1}
+    assert db_states[0].last_updated == new_state.last_updated
+
+
 async def test_events_are_recorded_until_final_write(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -2,6 +2,7 @@
 
 import datetime
 import importlib
+from pathlib import Path
 import sqlite3
 import sys
 from unittest.mock import ANY, Mock, PropertyMock, call, patch
@@ -487,8 +488,9 @@ async def test_events_during_migration_queue_exhausted(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
     instrument_migration: InstrumentedMigration,
+    tmp_path: Path,
 ) -> None:
-    """Test that events during migration takes so long the queue is exhausted."""
+    """Test events are spilled when migration takes so long the queue is exhausted."""
 
     assert recorder.util.async_migration_in_progress(hass) is False
 
@@ -498,9 +500,11 @@ async def test_events_during_migration_queue_exhausted(
             new=create_engine_test,
         ),
         patch.object(recorder.core, "MAX_QUEUE_BACKLOG_MIN_VALUE", 1),
+        patch.object(recorder.core, "SPILL_RESUME_BACKLOG", 0),
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
+        patch.object(hass.config, "config_dir", str(tmp_path)),
     ):
         await async_setup_recorder_instance(
             hass, {"commit_interval": 0}, wait_recorder=False, wait_recorder_setup=False
@@ -514,23 +518,38 @@ async def test_events_during_migration_queue_exhausted(
         async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(hours=4))
         await hass.async_block_till_done()
         hass.states.async_set("my.entity", "off", {})
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(hours=5))
+        await hass.async_block_till_done(wait_background_tasks=True)
+        assert (tmp_path / "recorder_spill.jsonl").exists()
 
         # Let migration finish
         instrument_migration.migration_stall.set()
         await recorder.get_instance(hass).async_recorder_ready.wait()
         await async_wait_recording_done(hass)
 
-    assert recorder.util.async_migration_in_progress(hass) is False
+        assert recorder.util.async_migration_in_progress(hass) is False
+        db_states = await recorder.get_instance(hass).async_add_executor_job(
+            _get_native_states, hass, "my.entity"
+        )
+        assert len(db_states) == 1
+
+        # The queue has drained, the spilled events are recorded
+        async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(hours=6))
+        await hass.async_block_till_done(wait_background_tasks=True)
+        await async_wait_recording_done(hass)
+
+    assert not (tmp_path / "recorder_spill.jsonl").exists()
     db_states = await recorder.get_instance(hass).async_add_executor_job(
         _get_native_states, hass, "my.entity"
     )
-    assert len(db_states) == 1
+    assert [state.state for state in db_states] == ["on", "off"]
     hass.states.async_set("my.entity", "on", {})
     await async_wait_recording_done(hass)
     db_states = await recorder.get_instance(hass).async_add_executor_job(
         _get_native_states, hass, "my.entity"
     )
-    assert len(db_states) == 2
+    assert len(db_states) == 3
 
 
 @pytest.mark.parametrize(
@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1844,6 +1848,155 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2021-12-01 00:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test daily and monthly statistics are read from the rollup tables."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_active
+
+    zero = dt_util.utcnow() - timedelta(days=90)
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-28 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=5 * idx),
+            "last_reset": None,
+            "max": idx + 1,
+            "mean": idx,
+            "min": idx - 1,
+            "state": idx,
+            "sum": idx * 2,
+        }
+        for idx in range(40)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDaily).count() == 9
+        assert session.query(StatisticsMonthly).count() == 2
+
+    def _assert_rollups_match_hourly() -> None:
+        """Assert rollups give the same result as reducing hourly statistics."""
+        for period in ("day", "week", "month"):
+            for types in (
+                {"last_reset", "max", "mean", "min", "state", "sum"},
+                {"change"},
+            ):
+                instance.statistics_rollups_active = True
+                from_rollups = statistics.statistics_during_period(
+                    hass, zero, None, None, period, None, types
+                )
+                instance.statistics_rollups_active = False
+                from_hourly = statistics.statistics_during_period(
+                    hass, zero, None, None, period, None, types
+                )
+                instance.statistics_rollups_active = True
+                assert from_rollups == from_hourly
+                assert from_rollups
+
+    _assert_rollups_match_hourly()
+
+    # Adjusting the sum is reflected in the rollups
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=3), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    _assert_rollups_match_hourly()
+
+    # Rollups compiled in another time zone are not used, but rebuilt
+    await hass.config.async_set_time_zone("America/Regina")
+    stats = statistics_during_period(hass, zero, period="day")
+    assert "Statistics rollups are not aligned, rebuilding" in caplog.text
+    assert not instance.statistics_rollups_active
+    assert stats == statistics_during_period(hass, zero, period="day")
+    for _ in range(5):
+        await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_active
+    _assert_rollups_match_hourly()
+
+
+@pytest.mark.freeze_time("2022-01-01 00:00:00+00:00")
+@pytest.mark.parametrize("period", ["day", "week", "month"])
+@pytest.mark.parametrize(
+    ("start_time", "end_time"),
+    [
+        ("2021-09-25 07:00:00", "2021-12-10 13:00:00"),
+        ("2021-10-03 05:00:00", None),
+        ("2021-09-01 00:00:00", "2021-11-17 22:00:00"),
+        ("2021-10-01 00:00:00", "2021-12-01 00:00:00"),
+        ("2021-10-04 10:00:00", "2021-10-04 20:00:00"),
+    ],
+)
+async def test_statistics_rollups_unaligned_period(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    period: str,
+    start_time: str,
+    end_time: str | None,
+) -> None:
+    """Test partial days and months at the edges are reduced from hourly statistics."""
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-09-20 00:00:00"))
+    external_statistics = [
+        {
+            "start": start + timedelta(hours=7 * idx),
+            "last_reset": None,
+            "max": idx + 1,
+            "mean": idx,
+            "min": idx - 1,
+            "state": idx,
+            "sum": idx * 2,
+        }
+        for idx in range(300)
+    ]
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_active
+
+    period_start = dt_util.as_utc(dt_util.parse_datetime(start_time))
+    period_end = end_time and dt_util.as_utc(dt_util.parse_datetime(end_time))
+    for types in (
+        {"last_reset", "max", "mean", "min", "state", "sum"},
+        {"last_reset", "max", "min", "state", "sum"},
+        {"change"},
+    ):
+        instance.statistics_rollups_active = True
+        from_rollups = statistics.statistics_during_period(
+            hass, period_start, period_end, None, period, None, types
+        )
+        instance.statistics_rollups_active = False
+        from_hourly = statistics.statistics_during_period(
+            hass, period_start, period_end, None, period, None, types
+        )
+        assert from_rollups == from_hourly
+        assert from_rollups
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
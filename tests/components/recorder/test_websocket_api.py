@@ -2,6 +2,7 @@
 
 import datetime
 from datetime import timedelta
+from pathlib import Path
 from statistics import fmean
 import sys
 from unittest.mock import ANY, patch
@@ -2602,6 +2603,7 @@ async def test_recorder_info_migration_queue_exhausted(
     hass_ws_client: WebSocketGenerator,
     async_test_recorder: RecorderInstanceGenerator,
     instrument_migration: InstrumentedMigration,
+    tmp_path: Path,
 ) -> None:
     """Test getting recorder status when recorder queue is exhausted."""
     assert recorder.util.async_migration_in_progress(hass) is False
@@ -2615,6 +2617,7 @@ async def test_recorder_info_migration_queue_exhausted(
         patch.object(
             recorder.core, "MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG", sys.maxsize
         ),
+        patch.object(hass.config, "config_dir", str(tmp_path)),
     ):
         async with async_test_recorder(
             hass, wait_recorder=False, wait_recorder_setup=False
@@ -2638,7 +2641,7 @@ async def test_recorder_info_migration_queue_exhausted(
             response = await client.receive_json()
             assert response["success"]
             assert response["result"]["migration_in_progress"] is True
-            assert response["result"]["recording"] is False
+            assert response["result"]["recording"] is True
             assert response["result"]["thread_running"] is True
 
             # Let migration finish
@@ -17,6 +17,10 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.broadcast import (
+    DATA_STATE_CHANGED_BROADCASTER,
+    async_get_state_changed_broadcaster,
+)
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -910,6 +914,73 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities_shared_broadcast(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscriptions with the same filter share a broadcast bucket."""
+    hass.states.async_set("light.permitted", "off")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+
+    for msg_id in (7, 8):
+        await websocket_client.send_json({"id": msg_id, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["a"].keys() == {"light.permitted"}
+
+    broadcaster = hass.data[DATA_STATE_CHANGED_BROADCASTER]
+    assert len(broadcaster._buckets) == 1
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    received = {}
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        received[msg["id"]] = msg["event"]
+    assert received.keys() == {7, 8}
+    assert all(event["c"].keys() == {"light.permitted"} for event in received.values())
+
+    for msg_id in (9, 10):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": msg_id - 2}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert not broadcaster._buckets
+    assert broadcaster._unsub is None
+
+
+async def test_state_changed_broadcast_sender_error(
+    hass: HomeAssistant,
+    hass_admin_user: MockUser,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a failing sender does not keep the event from the others."""
+    broadcaster = async_get_state_changed_broadcaster(hass)
+    failing = Mock(side_effect=ValueError("boom"))
+    senders = [Mock(), failing, Mock()]
+    unsubs = [
+        broadcaster.async_subscribe(hass_admin_user, "all", None, None, sender)
+        for sender in senders
+    ]
+
+    hass.states.async_set("light.kitchen", "on")
+
+    for sender in senders:
+        sender.assert_called_once()
+    assert "Error sending state_changed event for light.kitchen" in caplog.text
+    assert "boom" in caplog.text
+
+    for unsub in unsubs:
+        unsub()
+    assert broadcaster._unsub is None
+
+
 async def test_subscribe_entities_with_unserializable_state(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
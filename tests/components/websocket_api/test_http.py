@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
@@ -17,6 +18,7 @@ from homeassistant.components.websocket_api import (
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
@@ -345,6 +347,88 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_subscribe_entities_slow_client(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test state diffs are collapsed per entity when the client falls behind."""
+    entity_ids = [f"sensor.load_{idx}" for idx in range(20)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "0")
+
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    client_states = {
+        entity_id: state["s"] for entity_id, state in msg["event"]["a"].items()
+    }
+    received_changes = 0
+
+    def _apply(msg: dict[str, Any]) -> None:
+        nonlocal received_changes
+        assert msg["id"] == 7
+        event = msg["event"]
+        for entity_id, state in event.get("a", {}).items():
+            client_states[entity_id] = state["s"]
+            received_changes += 1
+        for entity_id, diff in event.get("c", {}).items():
+            if "s" in diff["+"]:
+                client_states[entity_id] = diff["+"]["s"]
+            received_changes += 1
+        for entity_id in event.get("r", []):
+            client_states.pop(entity_id)
+            received_changes += 1
+
+    max_backlog = 0
+    produced_changes = 0
+    with patch(
+        "homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE_STATE_DIFFS",
+        2,
+    ):
+        for value in range(100):
+            # The producer makes ten state changes to five entities
+            # for every message the client reads
+            for step in range(10):
+                entity_id = entity_ids[step % 5 + (value % 4) * 5]
+                hass.states.async_set(entity_id, f"{value}-{step}")
+                produced_changes += 1
+            max_backlog = max(
+                max_backlog,
+                len(instance._message_queue)
+                + sum(len(diffs) for diffs in instance._pending_state_diffs.values()),
+            )
+            _apply(await websocket_client.receive_json())
+
+        hass.states.async_remove(entity_ids[0])
+        hass.states.async_set("sensor.load_new", "new")
+        expected_states = {
+            state.entity_id: state.state for state in hass.states.async_all()
+        }
+        while client_states != expected_states:
+            _apply(await websocket_client.receive_json())
+
+    # The backlog is bounded by the number of entities, not the number of changes
+    assert max_backlog <= 2 + 1 + len(entity_ids)
+    assert received_changes < produced_changes
+    assert not instance._pending_state_diffs
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -451,6 +535,45 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compressed_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test large messages are sent compressed once enabled."""
+    for idx in range(200):
+        hass.states.async_set(f"sensor.compressed_{idx}", "on", {"index": idx})
+    websocket_client = await hass_ws_client(hass)
+
+    await websocket_client.send_json({"id": 1, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+
+    await websocket_client.send_json(
+        {
+            "id": 2,
+            "type": "supported_features",
+            "features": {const.FEATURE_COMPRESSED_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 2
+    assert msg["success"] is True
+
+    # Small messages are still sent as text
+    await websocket_client.send_json({"id": 3, "type": "ping"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.TEXT
+
+    await websocket_client.send_json({"id": 4, "type": "get_states"})
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    payload = zlib.decompress(msg.data)
+    assert len(msg.data) < len(payload)
+    result = json_loads(payload)
+    assert result["id"] == 4
+    assert result["success"] is True
+    assert len(result["result"]) == 200
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
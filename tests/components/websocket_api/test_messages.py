@@ -6,10 +6,12 @@ from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    coalesced_state_diff_message,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -83,6 +85,40 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_coalesced_state_diff_message(hass: HomeAssistant) -> None:
+    """Test building a message from the net changes of many entities."""
+    context = Context(id="id")
+    old_window = State("light.window", "on", context=context)
+    new_window = State(
+        "light.window",
+        "off",
+        context=context,
+        last_changed=old_window.last_changed,
+        last_updated=old_window.last_updated,
+    )
+    new_door = State("light.door", "on")
+    old_porch = State("light.porch", "on")
+    message = coalesced_state_diff_message(
+        b"5",
+        {
+            "light.window": [old_window, new_window],
+            "light.door": [None, new_door],
+            "light.porch": [old_porch, None],
+            "light.gone": [None, None],
+        },
+    )
+    assert json_loads(message) == {
+        "id": 5,
+        "type": "event",
+        "event": {
+            "a": {"light.door": json_loads(new_door.as_compressed_state_json)},
+            "c": {"light.window": {"+": {"s": "off"}}},
+            "r": ["light.porch"],
+        },
+    }
+    assert coalesced_state_diff_message(b"5", {"light.gone": [None, None]}) is None
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -765,6 +765,66 @@ async def test_capability_attrs(hass: HomeAssistant) -> None:
     assert state.attributes["always"] == "there"
 
 
+async def test_cached_attributes(hass: HomeAssistant) -> None:
+    """Test attributes are only calculated again when they may have changed."""
+
+    class CachedEntity(entity.Entity):
+        """Entity with only cached properties."""
+
+        _attr_icon = "mdi:one"
+
+    class UncachedEntity(entity.Entity):
+        """Entity with an icon property which is not cached."""
+
+        @property
+        def icon(self) -> str:
+            return "mdi:uncached"
+
+    ent = CachedEntity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    ent._attr_extra_state_attributes = {"level": 1}
+    ent.async_write_ha_state()
+
+    calculate_state = entity.Entity._Entity__async_calculate_state
+    with patch.object(
+        entity.Entity,
+        "_Entity__async_calculate_state",
+        autospec=True,
+        side_effect=calculate_state,
+    ) as mock_calculate_state:
+        ent._attr_state = "on"
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 0
+        state = hass.states.get("hello.world")
+        assert state.state == "on"
+        assert state.attributes == {"icon": "mdi:one", "level": 1}
+
+        ent._attr_icon = "mdi:two"
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 1
+        assert hass.states.get("hello.world").attributes["icon"] == "mdi:two"
+
+        # Attributes modified in place are detected
+        ent._attr_extra_state_attributes["level"] = 2
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 2
+        assert hass.states.get("hello.world").attributes["level"] == 2
+
+        ent._attr_available = False
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 3
+        assert hass.states.get("hello.world").state == STATE_UNAVAILABLE
+
+        uncached = UncachedEntity()
+        uncached.hass = hass
+        uncached.entity_id = "hello.uncached"
+        uncached.async_write_ha_state()
+        uncached.async_write_ha_state()
+        assert mock_calculate_state.call_count == 5
+        assert hass.states.get("hello.uncached").attributes["icon"] == "mdi:uncached"
+
+
 async def test_warn_slow_write_state(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -2652,3 +2712,37 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the state of multiple entities in one batch."""
+    entities = []
+    for idx in range(3):
+        ent = entity.Entity()
+        ent.entity_id = f"test.batch_{idx}"
+        ent.hass = hass
+        ent.platform = MockEntityPlatform(hass, domain="test")
+        ent._attr_state = str(idx)
+        entities.append(ent)
+    entities[2]._attr_state = "x" * 256
+
+    entity.async_write_ha_states(hass, entities)
+
+    states = [hass.states.get(ent.entity_id) for ent in entities]
+    assert [state.state for state in states] == ["0", "1", STATE_UNKNOWN]
+    assert len({state.last_updated_timestamp for state in states}) == 1
+    assert len({state.context.id for state in states}) == 1
+
+
+async def test_async_write_ha_states_thread_safety(hass: HomeAssistant) -> None:
+    """Test async_write_ha_states thread safe check."""
+    ent = entity.Entity()
+    ent.entity_id = "test.any"
+    ent.hass = hass
+    ent.platform = MockEntityPlatform(hass, domain="test")
+    with pytest.raises(
+        RuntimeError,
+        match="Detected code that calls async_write_ha_states from a thread.",
+    ):
+        await hass.async_add_executor_job(entity.async_write_ha_states, hass, [ent])
+    assert not hass.states.get(ent.entity_id)
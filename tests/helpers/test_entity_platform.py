@@ -114,6 +114,54 @@ async def test_polling_check_works_if_entity_add_fails(
     assert working_poll_ent.async_update.called
 
 
+async def test_adaptive_polling(hass: HomeAssistant) -> None:
+    """Test adaptive polling backs off entities whose state does not change."""
+    platform = MockPlatform()
+    platform.MAX_SCAN_INTERVAL = timedelta(seconds=60)
+    entity_platform = MockEntityPlatform(
+        hass, platform=platform, scan_interval=timedelta(seconds=15)
+    )
+
+    class CountingEntity(MockEntity):
+        """Entity counting its updates."""
+
+        updates = 0
+        changing = False
+
+        async def async_update(self) -> None:
+            """Update the entity."""
+            self.updates += 1
+            if self.changing:
+                self._values["state"] = str(self.updates)
+
+    static_ent = CountingEntity(should_poll=True, name="static", state="on")
+    changing_ent = CountingEntity(should_poll=True, name="changing")
+    changing_ent.changing = True
+    await entity_platform.async_add_entities([static_ent, changing_ent])
+
+    for _ in range(12):
+        await entity_platform._async_update_entity_states()
+
+    # The static entity is polled every 30s after 3 polls and every
+    # 60s after 3 more polls
+    assert static_ent.updates == 6
+    assert changing_ent.updates == 12
+    assert entity_platform.async_get_polling_intervals() == {
+        static_ent.entity_id: 60.0,
+        changing_ent.entity_id: 15.0,
+    }
+
+    # A change brings the entity back to the scan interval
+    static_ent.changing = True
+    for _ in range(4):
+        await entity_platform._async_update_entity_states()
+    assert static_ent.updates == 10
+    assert entity_platform.async_get_polling_intervals()[static_ent.entity_id] == 15.0
+
+    await static_ent.async_remove()
+    assert static_ent.entity_id not in entity_platform.async_get_polling_intervals()
+
+
 async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     """Test the polling of only updated entities."""
     entity_platform = MockEntityPlatform(hass)
@@ -181,6 +229,27 @@ async def test_update_state_adds_entities(hass: HomeAssistant) -> None:
     assert len(hass.states.async_entity_ids()) == 2
 
 
+async def test_async_write_ha_states(hass: HomeAssistant) -> None:
+    """Test writing the states of the platform entities in one batch."""
+    platform = MockEntityPlatform(hass)
+    ent1 = Entity()
+    ent1._attr_unique_id = "one"
+    ent1._attr_state = "on"
+    ent2 = Entity()
+    ent2._attr_unique_id = "two"
+    ent2._attr_state = "on"
+    await platform.async_add_entities([ent1, ent2])
+
+    ent1._attr_state = "off"
+    ent2._attr_state = "off"
+    platform.async_write_ha_states([ent1])
+    assert hass.states.get(ent1.entity_id).state == "off"
+    assert hass.states.get(ent2.entity_id).state == "on"
+
+    platform.async_write_ha_states()
+    assert hass.states.get(ent2.entity_id).state == "off"
+
+
 async def test_update_state_adds_entities_with_update_before_add_true(
     hass: HomeAssistant,
 ) -> None:
@@ -240,7 +309,8 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
         await hass.async_block_till_done()
     assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    # The refresh scheduler may move the poll up to 10% early to its slot
+    assert 27.0 <= mock_track.call_args[0][0] <= 30.0
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -458,6 +458,83 @@ async def test_filter_on_load(
     assert entry_disabled_user.disabled_by is er.RegistryEntryDisabler.USER
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_load_shares_values(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test repeated values are parsed once and shared between loaded entries."""
+    timestamp = "2024-02-14T12:00:00.900075+00:00"
+
+    def _entity(idx: int) -> dict[str, Any]:
+        # Build the repeated values separately, as the JSON decoder does
+        return {
+            "aliases": [],
+            "area_id": None,
+            "capabilities": None,
+            "categories": {},
+            "config_entry_id": "".join(("entry", "_id")),
+            "created_at": "".join(timestamp),
+            "device_class": None,
+            "device_id": "".join(("device", "_id")),
+            "disabled_by": None,
+            "entity_category": None,
+            "entity_id": f"test.test{idx}",
+            "has_entity_name": False,
+            "hidden_by": None,
+            "icon": None,
+            "id": f"0000{idx}",
+            "labels": [],
+            "modified_at": "".join(timestamp),
+            "name": None,
+            "options": None,
+            "original_device_class": None,
+            "original_icon": None,
+            "original_name": None,
+            "platform": "".join(("super", "_platform")),
+            "previous_unique_id": None,
+            "supported_features": 0,
+            "translation_key": None,
+            "unique_id": f"unique_{idx}",
+            "unit_of_measurement": "".join(("k", "W")),
+        }
+
+    hass_storage[er.STORAGE_KEY] = {
+        "version": er.STORAGE_VERSION_MAJOR,
+        "minor_version": er.STORAGE_VERSION_MINOR,
+        "data": {
+            "entities": [_entity(1), _entity(2)],
+            "deleted_entities": [
+                {
+                    "config_entry_id": None,
+                    "created_at": "".join(timestamp),
+                    "entity_id": "test.test3",
+                    "id": "00003",
+                    "modified_at": "".join(timestamp),
+                    "orphaned_timestamp": None,
+                    "platform": "".join(("super", "_platform")),
+                    "unique_id": "unique_3",
+                },
+            ],
+        },
+    }
+
+    await er.async_load(hass)
+    registry = er.async_get(hass)
+
+    first = registry.entities["test.test1"]
+    second = registry.entities["test.test2"]
+    deleted = registry.deleted_entities[("test", "super_platform", "unique_3")]
+    assert first.created_at == datetime.fromisoformat(timestamp)
+    assert first.created_at is first.modified_at
+    assert first.created_at is second.created_at
+    assert first.created_at is deleted.created_at
+    assert first.platform is second.platform
+    assert first.platform is deleted.platform
+    assert first.config_entry_id is second.config_entry_id
+    assert first.device_id is second.device_id
+    assert first.unit_of_measurement is second.unit_of_measurement
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_load_bad_data(
     hass: HomeAssistant,
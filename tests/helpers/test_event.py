@@ -3183,6 +3183,107 @@ async def test_async_track_template_result_multiple_templates(
     ]
 
 
+async def test_async_track_template_result_batches_renders(
+    hass: HomeAssistant,
+) -> None:
+    """Test state changes in the same loop iteration are rendered together."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    template_str = "{{ states('sensor.one') | int + states('sensor.two') | int }}"
+    template_1 = Template(template_str, hass)
+    template_2 = Template(template_str, hass)
+
+    runs_1 = []
+    runs_2 = []
+
+    @ha.callback
+    def refresh_listener_1(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs_1.append((event.data["entity_id"], updates))
+
+    @ha.callback
+    def refresh_listener_2(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs_2.append((event.data["entity_id"], updates))
+
+    info_1 = async_track_template_result(
+        hass, [TrackTemplate(template_1, None)], refresh_listener_1
+    )
+    info_2 = async_track_template_result(
+        hass, [TrackTemplate(template_2, None)], refresh_listener_2
+    )
+    await hass.async_block_till_done()
+    renders = template_1._renders + template_2._renders
+
+    hass.states.async_set("sensor.one", "3")
+    hass.states.async_set("sensor.two", "4")
+    await hass.async_block_till_done()
+
+    # Both state changes are handled by a single render shared by both trackers
+    assert template_1._renders + template_2._renders == renders + 1
+    assert runs_1 == [("sensor.two", [TrackTemplateResult(template_1, None, 7)])]
+    assert runs_2 == [("sensor.two", [TrackTemplateResult(template_2, None, 7)])]
+    # The trackers do not share the render info of the shared render
+    render_info_2 = info_2._info[template_2]
+    assert render_info_2 is not info_1._info[template_1]
+    assert render_info_2.template is template_2
+    assert render_info_2.entities == {"sensor.one", "sensor.two"}
+
+    runs_1.clear()
+    runs_2.clear()
+    hass.states.async_set("sensor.one", "5")
+    info_2.async_remove()
+    await hass.async_block_till_done()
+
+    assert runs_1 == [("sensor.one", [TrackTemplateResult(template_1, 7, 9)])]
+    assert runs_2 == []
+
+
+async def test_async_track_template_result_batch_sees_written_states(
+    hass: HomeAssistant,
+) -> None:
+    """Test renders shared in a batch are dropped when a tracker writes a state."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.three", "0")
+    template_str = "{{ states('sensor.one') }} {{ states('sensor.three') }}"
+    template_1 = Template(template_str, hass)
+    template_2 = Template(template_str, hass)
+
+    runs_2 = []
+
+    @ha.callback
+    def refresh_listener_1(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        hass.states.async_set("sensor.three", "1")
+
+    @ha.callback
+    def refresh_listener_2(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs_2.append(updates)
+
+    async_track_template_result(
+        hass, [TrackTemplate(template_1, None)], refresh_listener_1
+    )
+    async_track_template_result(
+        hass, [TrackTemplate(template_2, None)], refresh_listener_2
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+
+    # The second tracker renders the state written by the first one
+    assert runs_2 == [[TrackTemplateResult(template_2, "1 0", "2 1")]]
+
+
 async def test_async_track_template_result_multiple_templates_mixing_domain(
     hass: HomeAssistant,
 ) -> None:
@@ -0,0 +1,42 @@
+"""Tests for the reference index helper."""
+
+from unittest.mock import Mock
+
+from homeassistant.helpers.reference_index import ReferenceIndex
+
+
+def test_reference_index() -> None:
+    """Test entities are indexed by the items they reference."""
+    index = ReferenceIndex(
+        {
+            "entities": lambda entity: entity.entities,
+            "blueprint": lambda entity: entity.blueprint,
+        }
+    )
+    first = Mock(entity_id="automation.first", entities={"light.a", "light.b"})
+    first.blueprint = "motion_light.yaml"
+    second = Mock(entity_id="automation.second", entities={"light.b"})
+    second.blueprint = None
+
+    index.async_add(first)
+    index.async_add(second)
+    assert index.async_referencing("entities", "light.a") == ["automation.first"]
+    assert index.async_referencing("entities", "light.b") == [
+        "automation.first",
+        "automation.second",
+    ]
+    assert index.async_referencing("entities", "light.c") == []
+    assert index.async_referencing("blueprint", "motion_light.yaml") == [
+        "automation.first"
+    ]
+
+    # The current entity id is returned
+    first.entity_id = "automation.renamed"
+    assert index.async_referencing("entities", "light.a") == ["automation.renamed"]
+
+    index.async_remove(first)
+    assert index.async_referencing("entities", "light.a") == []
+    assert index.async_referencing("entities", "light.b") == ["automation.second"]
+    assert index.async_referencing("blueprint", "motion_light.yaml") == []
+    # Removing an entity which is not indexed is a no-op
+    index.async_remove(first)
@@ -0,0 +1,125 @@
+"""Tests for the refresh scheduler helper."""
+
+import asyncio
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import refresh_scheduler
+from homeassistant.helpers.refresh_scheduler import async_get_refresh_scheduler
+
+
+def test_next_refresh_converges_on_slot() -> None:
+    """Test refreshes move to their slot without ever being late."""
+    hass = Mock()
+    hass.loop.time.return_value = 1000.25
+    scheduler = refresh_scheduler.RefreshScheduler(hass)
+
+    slots = set()
+    for key in ("coordinator_a", "coordinator_b"):
+        stats = scheduler.async_add(key)
+        now = 1000.25
+        for _ in range(12):
+            hass.loop.time.return_value = now
+            next_refresh = scheduler.async_next_refresh(stats, 30)
+            assert 27 <= next_refresh - now <= 30
+            # The refresh takes a little while
+            now = next_refresh + 0.2
+        assert next_refresh == pytest.approx(round(next_refresh))
+        slots.add(round(next_refresh) % 30)
+        assert stats.interval == 30
+
+    # Both coordinators ended up on a deterministic slot of their own
+    assert len(slots) == 2
+
+    hass.loop.time.return_value = 50.0
+    assert scheduler.async_next_refresh(scheduler.async_add("fast"), 0.5) == 50.5
+
+
+async def test_run_records_stats_and_limits_hosts(hass: HomeAssistant) -> None:
+    """Test refreshes of a host are limited and their stats are recorded."""
+    scheduler = async_get_refresh_scheduler(hass)
+    assert async_get_refresh_scheduler(hass) is scheduler
+
+    running = 0
+    max_running = 0
+    release = asyncio.Event()
+
+    async def _refresh() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await release.wait()
+        running -= 1
+
+    # Pollers sharing a key share a slot but not their statistics
+    pollers = [scheduler.async_add("poller") for _ in range(4)]
+    for stats in pollers:
+        scheduler.async_next_refresh(stats, 30)
+    now = hass.loop.time()
+    tasks = [
+        hass.async_create_task(scheduler.async_run(stats, "1.2.3.4", now, _refresh))
+        for stats in pollers
+    ]
+    other_host = hass.async_create_task(
+        scheduler.async_run(scheduler.async_add("other"), "4.3.2.1", now, _refresh)
+    )
+    await asyncio.sleep(0)
+    assert running == refresh_scheduler.MAX_CONCURRENT_REFRESHES_PER_HOST + 1
+
+    release.set()
+    await asyncio.gather(*tasks, other_host)
+    assert max_running == refresh_scheduler.MAX_CONCURRENT_REFRESHES_PER_HOST + 1
+
+    for stats in pollers:
+        assert stats.refreshes == 1
+        assert stats.max_lag >= stats.last_lag >= 0
+        assert stats.total_duration == stats.last_duration
+    assert len(scheduler.stats) == 5
+
+    # Removing a poller keeps the statistics of the others with its key
+    scheduler.async_remove(pollers[0])
+    assert pollers[0] not in scheduler.stats
+    assert all(stats in scheduler.stats for stats in pollers[1:])
+
+
+async def test_run_calls_started_once_the_refresh_starts(
+    hass: HomeAssistant,
+) -> None:
+    """Test the started callback is called once a refresh got its turn."""
+    scheduler = async_get_refresh_scheduler(hass)
+    stats = scheduler.async_add("poller")
+    release = asyncio.Event()
+    started: list[int] = []
+
+    async def _refresh() -> None:
+        await release.wait()
+
+    now = hass.loop.time()
+    tasks = [
+        hass.async_create_task(
+            scheduler.async_run(
+                stats, "1.2.3.4", now, _refresh, partial(started.append, idx)
+            )
+        )
+        for idx in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert started == [0, 1]
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started == [0, 1, 2]
+    assert stats.refreshes == 3
+
+
+def test_stats_are_dropped_with_their_poller() -> None:
+    """Test the statistics of a poller that was never removed are dropped."""
+    scheduler = refresh_scheduler.RefreshScheduler(Mock())
+    stats = scheduler.async_add("poller")
+    assert list(scheduler.stats) == [stats]
+
+    del stats
+    assert not list(scheduler.stats)
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -667,6 +667,143 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test saves are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        items = [{"id": str(idx), "name": f"Item {idx}"} for idx in range(100)]
+
+        await store.async_save({"items": items, "name": "one"})
+        main_file = await hass.async_add_executor_job(
+            _read_bytes_if_exists, store.path
+        )
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+
+        items = [*items[1:], {"id": "0", "name": "Renamed"}, {"id": "100"}]
+        await store.async_save({"items": items, "name": "two"})
+        await store.async_save({"items": items[:-1], "name": "two"})
+
+        # The main file is untouched and the changes are in the journal
+        assert main_file == await hass.async_add_executor_job(
+            _read_bytes_if_exists, store.path
+        )
+        journal = await hass.async_add_executor_job(
+            _read_bytes_if_exists, journal_path
+        )
+        assert journal.count(b"\n") == 2
+        assert len(journal) < len(main_file) / 10
+
+        # A partial record from an unclean shutdown is ignored
+        await hass.async_add_executor_job(
+            _append_bytes, journal_path, b'{"journal_id":'
+        )
+        expected = {"items": items[:-1], "name": "two"}
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded["name"] == "two"
+        assert sorted(loaded["items"], key=lambda item: item["id"]) == sorted(
+            expected["items"], key=lambda item: item["id"]
+        )
+
+        # The first save after loading compacts the journal
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == loaded
+        await store.async_save(expected)
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == expected
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_interrupted_compaction(tmpdir: py.path.local) -> None:
+    """Test records of a compacted journal are not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        journal_path = f"{store.path}{storage.JOURNAL_SUFFIX}"
+        await store.async_save({"items": [1, 2]})
+        await store.async_save({"items": [1, 2, 3]})
+        journal = await hass.async_add_executor_job(
+            _read_bytes_if_exists, journal_path
+        )
+
+        # Compacting on the final write and crashing before the journal
+        # is removed leaves the old journal behind
+        hass.set_state(CoreState.stopping)
+        await store.async_save({"items": [4]})
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, journal_path)
+        await hass.async_add_executor_job(_append_bytes, journal_path, journal)
+
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"items": [4]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_items_by_id(tmpdir: py.path.local) -> None:
+    """Test journaled items are matched by id, not by their serialization."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        # Registries store fragments which are not serialized the way the
+        # parsed items would be
+        kept = json_fragment(b'{"name": "Kept", "value": 1.50, "id": "kept"}')
+        removed = json_fragment(b'{"name": "Gone", "entity_id": "light.gone"}')
+        await store.async_save({"items": [kept, removed]})
+        await store.async_save({"items": [kept]})
+        changed = {"id": "kept", "name": "Changed"}
+        await store.async_save({"items": [changed, {"id": "new"}]})
+
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"items": [changed, {"id": "new"}]}
+
+        # Lists with items without an id are journaled as a whole
+        await store.async_save({"items": [{"name": "a"}, {"name": "a"}]})
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"items": [{"name": "a"}, {"name": "a"}]}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_requires_default_encoder(hass: HomeAssistant) -> None:
+    """Test the journal can't be used with a custom encoder."""
+
+    class CustomEncoder(json.JSONEncoder):
+        """A custom encoder."""
+
+    with pytest.raises(ValueError):
+        storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, encoder=CustomEncoder, journal=True
+        )
+
+
+def _read_bytes_if_exists(path: str) -> bytes | None:
+    """Read a file."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+def _append_bytes(path: str, data: bytes) -> None:
+    """Append to a file."""
+    with open(path, "ab") as fp:
+        fp.write(data)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -5170,6 +5170,25 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache(hass: HomeAssistant) -> None:
+    """Test compiled template code is shared between templates."""
+    template_string = "{{ 'compiled' ~ ' cache' }}"
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    compiled = template.COMPILED_TEMPLATE_LRU.get((template_string, "normal"))
+    assert compiled is not None
+    del tpl
+    hass.data[template._ENVIRONMENT].template_cache.clear()
+
+    info = template.compiled_template_cache_info()
+    tpl2 = template.Template(template_string, hass)
+    tpl2.ensure_valid()
+    assert tpl2._compiled_code is compiled
+    assert tpl2.async_render() == "compiled cache"
+    assert template.compiled_template_cache_info()["hits"] == info["hits"] + 1
+    assert info["max_size"] == template.COMPILED_TEMPLATE_CACHE_SIZE
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -18,6 +18,7 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 from freezegun import freeze_time
+import orjson
 import pytest
 from pytest_unordered import unordered
 import voluptuous as vol
@@ -225,6 +226,42 @@ async def test_async_run_hass_job_synchronous(hass: HomeAssistant) -> None:
     await task
 
 
+async def test_async_set_job_timer(hass: HomeAssistant) -> None:
+    """Test the job timer is called with the jobs run."""
+    timed: list[tuple[ha.HassJob, float]] = []
+
+    @ha.callback
+    def _job_timer(job: ha.HassJob, elapsed: float) -> None:
+        timed.append((job, elapsed))
+
+    remove_job_timer = hass.async_set_job_timer(_job_timer)
+    with pytest.raises(HomeAssistantError):
+        hass.async_set_job_timer(_job_timer)
+
+    calls = []
+    job = ha.HassJob(ha.callback(calls.append))
+    hass.async_run_hass_job(job, 1)
+    assert calls == [1]
+    assert len(timed) == 1
+    assert timed[0][0] is job
+    assert timed[0][1] >= 0
+
+    timed.clear()
+    listener = ha.callback(calls.append)
+    hass.bus.async_listen("test_event", listener)
+    hass.bus.async_fire("test_event", {})
+    assert len(calls) == 2
+    assert len(timed) == 1
+    assert timed[0][0].target is listener
+
+    remove_job_timer()
+    timed.clear()
+    hass.async_run_hass_job(job, 2)
+    assert len(calls) == 3
+    assert calls[-1] == 2
+    assert timed == []
+
+
 async def test_async_add_hass_job_coro_named(hass: HomeAssistant) -> None:
     """Test that we schedule coroutines and add jobs to the job pool with a name."""
 
@@ -311,7 +348,7 @@ async def test_async_add_job_add_hass_threaded_job_to_pool() -> None:
     ha.HomeAssistant._async_add_hass_job(hass, ha.HassJob(job))
     assert len(hass.loop.call_soon.mock_calls) == 0
     assert len(hass.loop.create_task.mock_calls) == 0
-    assert len(hass.loop.run_in_executor.mock_calls) == 2
+    assert len(hass.executor_job_queue.async_submit.mock_calls) == 2
 
 
 async def test_async_create_task_schedule_coroutine() -> None:
@@ -1169,6 +1206,130 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listeners registered by key only receive matching events."""
+    calls: list[tuple[str, ha.Event]] = []
+
+    @ha.callback
+    def key_func(event_data):
+        """Return the dispatch key."""
+        return event_data.get("key")
+
+    index = ha.EventKeyIndex("key", key_func)
+
+    unsub_a = hass.bus.async_listen_keyed(
+        "test", index, "a", ha.callback(lambda event: calls.append(("a", event)))
+    )
+    unsub_bc = hass.bus.async_listen_keyed(
+        "test",
+        index,
+        ["b", "c"],
+        ha.callback(lambda event: calls.append(("bc", event))),
+    )
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "c"})
+    hass.bus.async_fire("test", {"key": "d"})
+    hass.bus.async_fire("test", {"other": "a"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [(name, event.data) for name, event in calls] == [
+        ("a", {"key": "a"}),
+        ("bc", {"key": "c"}),
+    ]
+
+    unsub_a()
+    calls.clear()
+    hass.bus.async_fire("test", {"key": "a"})
+    hass.bus.async_fire("test", {"key": "b"})
+    await hass.async_block_till_done()
+    assert [name for name, _ in calls] == ["bc"]
+
+    unsub_bc()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test keyed listeners registered with MATCH_ALL get every accepted event."""
+    calls: list[str] = []
+
+    @ha.callback
+    def key_func(event_data):
+        """Return the dispatch key."""
+        return event_data["key"] if event_data.get("accept") else None
+
+    index = ha.EventKeyIndex("key", key_func)
+    hass.bus.async_listen_keyed(
+        "test", index, "a", ha.callback(lambda event: calls.append("a"))
+    )
+    hass.bus.async_listen_keyed(
+        "test", index, MATCH_ALL, ha.callback(lambda event: calls.append("all"))
+    )
+
+    hass.bus.async_fire("test", {"key": "a", "accept": True})
+    hass.bus.async_fire("test", {"key": "b", "accept": True})
+    hass.bus.async_fire("test", {"key": "a", "accept": False})
+    await hass.async_block_till_done()
+
+    assert calls == ["a", "all", "all"]
+
+
+async def test_eventbus_keyed_listener_dispatch_soon(hass: HomeAssistant) -> None:
+    """Test keyed listeners of a dispatch_soon index run in a later loop iteration."""
+    calls: list[ha.Event] = []
+
+    index = ha.EventKeyIndex(
+        "key", ha.callback(lambda event_data: event_data["key"]), dispatch_soon=True
+    )
+    hass.bus.async_listen_keyed(
+        "test", index, "a", ha.callback(lambda event: calls.append(event))
+    )
+
+    hass.bus.async_fire("test", {"key": "a"})
+    assert calls == []
+    await asyncio.sleep(0)
+    assert len(calls) == 1
+
+
+async def test_eventbus_keyed_listener_key_func_raises(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an exception in a key function does not break other listeners."""
+    calls: list[ha.Event] = []
+
+    @ha.callback
+    def bad_key_func(event_data):
+        """Raise."""
+        raise ValueError("boom")
+
+    hass.bus.async_listen_keyed(
+        "test",
+        ha.EventKeyIndex("bad", bad_key_func),
+        "a",
+        ha.callback(lambda event: calls.append(event)),
+    )
+    hass.bus.async_listen("test", ha.callback(lambda event: calls.append(event)))
+
+    hass.bus.async_fire("test", {"key": "a"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert "Error in event key function bad" in caplog.text
+
+
+async def test_eventbus_keyed_listener_remove_twice(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test removing a keyed listener twice logs an error."""
+    index = ha.EventKeyIndex("key", ha.callback(lambda event_data: "a"))
+    unsub = hass.bus.async_listen_keyed("test", index, "a", ha.callback(lambda e: None))
+    unsub()
+    unsub()
+    assert "Unable to remove unknown keyed job listener" in caplog.text
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1564,6 +1725,151 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_shares_attributes_json(hass: HomeAssistant) -> None:
+    """Test the serialized attributes are shared when attributes do not change."""
+    attrs = {"unit_of_measurement": "W", "friendly_name": "Power"}
+
+    hass.states.async_set("sensor.power", "1", attrs)
+    state = hass.states.get("sensor.power")
+    as_dict_json = state.as_dict_json
+    assert orjson.loads(as_dict_json)["attributes"] == attrs
+
+    hass.states.async_set("sensor.power", "2", dict(attrs))
+    new_state = hass.states.get("sensor.power")
+    assert new_state.attributes is state.attributes
+    assert new_state._cache["_attributes_json"] is state._cache["_attributes_json"]
+    assert orjson.loads(new_state.as_dict_json) == {
+        **orjson.loads(as_dict_json),
+        "state": "2",
+        "last_changed": new_state.last_changed.isoformat(),
+        "last_reported": new_state.last_reported.isoformat(),
+        "last_updated": new_state.last_updated.isoformat(),
+        "context": {"id": new_state.context.id, "parent_id": None, "user_id": None},
+    }
+
+    hass.states.async_set("sensor.power", "3", {**attrs, "friendly_name": "Other"})
+    other_state = hass.states.get("sensor.power")
+    assert "_attributes_json" not in other_state._cache
+    assert orjson.loads(b"{" + other_state.as_compressed_state_json + b"}") == {
+        "sensor.power": {
+            "s": "3",
+            "a": {"unit_of_measurement": "W", "friendly_name": "Other"},
+            "c": other_state.context.id,
+            "lc": other_state.last_changed_timestamp,
+        }
+    }
+
+
+def test_state_shares_common_attribute_values() -> None:
+    """Test values of attributes from a small set are shared between states."""
+    unit = "W"
+    device_class = f"po{unit}er".lower()
+    other_device_class = f"po{unit}er".lower()
+    assert device_class is not other_device_class
+    friendly_name = f"{unit} Power"
+    other_friendly_name = f"{unit} Power"
+
+    attributes = {"device_class": device_class, "friendly_name": friendly_name}
+    other_attributes = {
+        "device_class": other_device_class,
+        "friendly_name": other_friendly_name,
+    }
+    state = ha.State("sensor.power", "1", attributes)
+    other_state = ha.State("sensor.other_power", "1", other_attributes)
+
+    assert state.attributes["device_class"] is other_state.attributes["device_class"]
+    assert (
+        state.attributes["friendly_name"]
+        is not other_state.attributes["friendly_name"]
+    )
+    assert other_state.attributes == other_attributes
+    assert isinstance(other_state.attributes, ReadOnlyDict)
+    # The attributes passed in are not modified
+    assert other_attributes["device_class"] is other_device_class
+
+
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    hass.states.async_set("light.bowl", "off", {"brightness": 0})
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    seen: list[tuple[str | None, str | None]] = []
+
+    @ha.callback
+    def listener(event: ha.Event[ha.EventStateChangedData]) -> None:
+        """Record the states visible while handling the event."""
+        bowl = hass.states.get("light.bowl")
+        porch = hass.states.get("light.porch")
+        seen.append((bowl and bowl.state, porch and porch.state))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events: list[ha.Event] = []
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        ha.callback(lambda event: reported_events.append(event)),
+        event_filter=ha.callback(lambda event_data: True),
+    )
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 255}),
+            ("light.kitchen", "on", None),
+            ("light.porch", 3, None),
+        ],
+        context=context,
+        timestamp=1700000000.0,
+    )
+    await hass.async_block_till_done()
+
+    # Events are fired once all states have been written
+    assert seen == [("on", "3"), ("on", "3")]
+    assert [event.data["entity_id"] for event in changed_events] == [
+        "light.bowl",
+        "light.porch",
+    ]
+    assert [event.data["entity_id"] for event in reported_events] == ["light.kitchen"]
+    bowl = hass.states.get("light.bowl")
+    porch = hass.states.get("light.porch")
+    assert bowl.attributes == {"brightness": 255}
+    assert bowl.context is context
+    assert porch.context is context
+    assert bowl.last_updated_timestamp == porch.last_updated_timestamp == 1700000000.0
+    for event in (*changed_events, *reported_events):
+        assert event.context is context
+        assert event.time_fired_timestamp == 1700000000.0
+
+
+async def test_statemachine_set_many_shares_context(hass: HomeAssistant) -> None:
+    """Test states set in one batch without a context share one."""
+    hass.states.async_set_many([("light.bowl", "on", None), ("light.porch", "on", {})])
+
+    assert hass.states.get("light.bowl").context is (
+        hass.states.get("light.porch").context
+    )
+
+
+async def test_statemachine_set_many_invalid_state(hass: HomeAssistant) -> None:
+    """Test events are fired for the states written before an invalid state."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ("light.bowl", "on", None),
+                ("light.porch", "x" * 256, None),
+                ("light.kitchen", "on", None),
+            ]
+        )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == ["light.bowl"]
+    assert hass.states.get("light.porch") is None
+    assert hass.states.get("light.kitchen") is None
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
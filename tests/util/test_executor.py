@@ -1,13 +1,19 @@
 """Test Home Assistant executor util."""
 
+import asyncio
 import concurrent.futures
+from datetime import datetime
+import threading
 import time
 from unittest.mock import patch
 
 import pytest
 
-from homeassistant.util import executor
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util import dt as dt_util
+from homeassistant.util.executor import (
+    ExecutorJobQueue,
+    InterruptibleThreadPoolExecutor,
+)
 
 
 async def test_executor_shutdown_can_interrupt_threads(
@@ -92,3 +98,80 @@ async def test_overall_timeout_reached(caplog: pytest.LogCaptureFixture) -> None
     assert finish - start < 3.0
 
     iexecutor.shutdown()
+
+
+async def test_executor_job_queue() -> None:
+    """Test jobs of an integration are limited and their times are recorded."""
+    queue = ExecutorJobQueue(asyncio.get_running_loop(), max_jobs_per_domain=2)
+    release = threading.Event()
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def _slow_job(value: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        release.wait()
+        with lock:
+            running -= 1
+        if value == 3:
+            raise ValueError("Job failed")
+        return value
+
+    _slow_job.__module__ = "homeassistant.components.slow"
+
+    futures = [queue.async_submit(_slow_job, value) for value in range(5)]
+    stats = queue.stats["slow"]
+    assert stats.running == 2
+    assert stats.queued == 3
+
+    # Jobs outside of integrations are never queued
+    assert await queue.async_submit(lambda: "core") == "core"
+    assert queue.stats["tests"].jobs == 1
+
+    # A job cancelled while it is queued is never run
+    futures[4].cancel()
+    release.set()
+    results = await asyncio.gather(*futures[:4], return_exceptions=True)
+    assert results[:3] == [0, 1, 2]
+    assert isinstance(results[3], ValueError)
+
+    assert max_running == 2
+    assert stats.jobs == 4
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.max_wait >= 0
+    assert stats.total_run >= stats.max_run > 0
+
+
+async def test_executor_job_queue_attributes_submitting_integration() -> None:
+    """Test an integration can not starve the executor through stdlib targets."""
+    queue = ExecutorJobQueue(asyncio.get_running_loop(), max_jobs_per_domain=2)
+    release = threading.Event()
+    integration_globals = {"__name__": "custom_components.greedy"}
+    exec(  # noqa: S102
+        "def submit(queue, target):\n    return queue.async_submit(target)",
+        integration_globals,
+    )
+    submit = integration_globals["submit"]
+
+    # The target is part of the standard library
+    futures = [submit(queue, release.wait) for _ in range(4)]
+    stats = queue.stats["greedy"]
+    assert stats.running == 2
+    assert stats.queued == 2
+    assert "threading" not in queue.stats
+
+    # Jobs with a target of the core are never queued, whoever submits them
+    assert isinstance(await submit(queue, dt_util.utcnow), datetime)
+    assert queue.stats["homeassistant"].jobs == 1
+    # Jobs submitted outside of the integration are not held up by it
+    assert await queue.async_submit(lambda: "core") == "core"
+    assert queue.stats["tests"].jobs == 1
+
+    release.set()
+    assert await asyncio.gather(*futures) == [True] * 4
+    assert stats.jobs == 4
+    assert stats.queued == 0